@@ -1,70 +1,79 @@
 from agency_swarm import Agency
-from ceo.ceo import CEO
-from cto.cto import CTO
-from ai_engineer.ai_engineer import AIEngineer
-from fullstack_dev.fullstack_dev import FullStackDeveloper
-from mobile_dev.mobile_dev import MobileDeveloper
-from uiux_designer.uiux_designer import UIUXDesigner
-from qa_engineer.qa_engineer import QAEngineer
-from devops_engineer.devops_engineer import DevOpsEngineer
-from data_engineer.data_engineer import DataEngineer
+from common.agent_registry import AgentRegistry
+from common.context_window import install_context_windows
+from common.fan_out import install_fan_out
+from common.prompt_assembly import PromptAssembler
+from common.topology import full_mesh, hub_and_spoke, layered
+import os
 
-# Initialize agents
-ceo = CEO()
-cto = CTO()
-ai_engineer = AIEngineer()
-fullstack_dev = FullStackDeveloper()
-mobile_dev = MobileDeveloper()
-uiux_designer = UIUXDesigner()
-qa_engineer = QAEngineer()
-devops_engineer = DevOpsEngineer()
-data_engineer = DataEngineer()
+AGENCY_DIR = os.path.dirname(os.path.abspath(__file__))
+TOPOLOGIES = ["full_mesh", "layered", "hub_and_spoke"]
 
-# Create the agency with defined communication flows
-agency = Agency(
-    [
-        ceo,  # CEO is the entry point for communication with users
-        [ceo, cto],  # CEO can communicate with CTO
-        [ceo, ai_engineer],  # CEO can communicate with AI Engineer
-        [ceo, fullstack_dev],  # CEO can communicate with Full-Stack Developer
-        [ceo, mobile_dev],  # CEO can communicate with Mobile Developer
-        [ceo, uiux_designer],  # CEO can communicate with UI/UX Designer
-        [ceo, qa_engineer],  # CEO can communicate with QA Engineer
-        [ceo, devops_engineer],  # CEO can communicate with DevOps Engineer
-        [ceo, data_engineer],  # CEO can communicate with Data Engineer
-        [cto, ai_engineer],  # CTO can communicate with AI Engineer
-        [cto, fullstack_dev],  # CTO can communicate with Full-Stack Developer
-        [cto, mobile_dev],  # CTO can communicate with Mobile Developer
-        [cto, uiux_designer],  # CTO can communicate with UI/UX Designer
-        [cto, qa_engineer],  # CTO can communicate with QA Engineer
-        [cto, devops_engineer],  # CTO can communicate with DevOps Engineer
-        [cto, data_engineer],  # CTO can communicate with Data Engineer
-        [ai_engineer, fullstack_dev],  # AI Engineer can communicate with Full-Stack Developer
-        [ai_engineer, mobile_dev],  # AI Engineer can communicate with Mobile Developer
-        [ai_engineer, uiux_designer],  # AI Engineer can communicate with UI/UX Designer
-        [ai_engineer, qa_engineer],  # AI Engineer can communicate with QA Engineer
-        [ai_engineer, devops_engineer],  # AI Engineer can communicate with DevOps Engineer
-        [ai_engineer, data_engineer],  # AI Engineer can communicate with Data Engineer
-        [fullstack_dev, mobile_dev],  # Full-Stack Developer can communicate with Mobile Developer
-        [fullstack_dev, uiux_designer],  # Full-Stack Developer can communicate with UI/UX Designer
-        [fullstack_dev, qa_engineer],  # Full-Stack Developer can communicate with QA Engineer
-        [fullstack_dev, devops_engineer],  # Full-Stack Developer can communicate with DevOps Engineer
-        [fullstack_dev, data_engineer],  # Full-Stack Developer can communicate with Data Engineer
-        [mobile_dev, uiux_designer],  # Mobile Developer can communicate with UI/UX Designer
-        [mobile_dev, qa_engineer],  # Mobile Developer can communicate with QA Engineer
-        [mobile_dev, devops_engineer],  # Mobile Developer can communicate with DevOps Engineer
-        [mobile_dev, data_engineer],  # Mobile Developer can communicate with Data Engineer
-        [uiux_designer, qa_engineer],  # UI/UX Designer can communicate with QA Engineer
-        [uiux_designer, devops_engineer],  # UI/UX Designer can communicate with DevOps Engineer
-        [uiux_designer, data_engineer],  # UI/UX Designer can communicate with Data Engineer
-        [qa_engineer, devops_engineer],  # QA Engineer can communicate with DevOps Engineer
-        [qa_engineer, data_engineer],  # QA Engineer can communicate with Data Engineer
-        [devops_engineer, data_engineer],  # DevOps Engineer can communicate with Data Engineer
-    ],
-    shared_instructions="agency_manifesto.md",
-    temperature=0.5,
-    max_prompt_tokens=25000
-)
+
+def create_agency(topology: str = "full_mesh"):
+    """
+    Builds the agency with its communication flows wired up in the given
+    topology and returns it together with the registry of its agents and the
+    topology itself.
+    """
+    # Register agents lazily: each one is built (instructions, tools, assistant sync)
+    # only when the first message is routed to it
+    registry = AgentRegistry()
+    ceo = registry.register("ceo.ceo", "CEO")
+    cto = registry.register("cto.cto", "CTO")
+    ai_engineer = registry.register("ai_engineer.ai_engineer", "AIEngineer")
+    fullstack_dev = registry.register("fullstack_dev.fullstack_dev", "FullStackDeveloper")
+    mobile_dev = registry.register("mobile_dev.mobile_dev", "MobileDeveloper")
+    uiux_designer = registry.register("uiux_designer.uiux_designer", "UIUXDesigner")
+    qa_engineer = registry.register("qa_engineer.qa_engineer", "QAEngineer")
+    devops_engineer = registry.register("devops_engineer.devops_engineer", "DevOpsEngineer")
+    data_engineer = registry.register("data_engineer.data_engineer", "DataEngineer")
+
+    specialists = [
+        ai_engineer,
+        fullstack_dev,
+        mobile_dev,
+        uiux_designer,
+        qa_engineer,
+        devops_engineer,
+        data_engineer,
+    ]
+
+    if topology == "full_mesh":
+        # Every agent can communicate with every other agent (36 edges)
+        communication = full_mesh([ceo, cto] + specialists)
+    elif topology == "layered":
+        # CEO communicates with the CTO, the CTO with every specialist
+        communication = layered([[ceo], [cto], specialists])
+    elif topology == "hub_and_spoke":
+        # CEO communicates with every agent, agents do not talk to each other
+        communication = hub_and_spoke(ceo, [cto] + specialists)
+    else:
+        raise ValueError(f"Invalid topology '{topology}', expected one of {TOPOLOGIES}")
+
+    # The manifesto is the shared, byte-identical prefix of every agent's instructions
+    prompt_assembler = PromptAssembler.from_file(os.path.join(AGENCY_DIR, "agency_manifesto.md"))
+
+    # Create the agency with defined communication flows
+    agency = Agency(
+        communication.build_chart(entry=ceo),  # CEO is the entry point for communication with users
+        shared_instructions=prompt_assembler.shared_prefix,
+        temperature=0.5,
+        max_prompt_tokens=25000
+    )
+    # CEO and CTO can consult independent agents concurrently instead of one after another
+    install_fan_out(agency, ["CEO", "CTO"])
+    # Keep every thread under max_prompt_tokens with a rolling summary instead of
+    # letting the API truncate the oldest messages
+    install_context_windows(agency)
+    return agency, registry, communication
+
+
+agency, registry, topology = create_agency(os.getenv("AGENCY_TOPOLOGY", "full_mesh"))
+ceo = registry.get("CEO")
+
+if os.getenv("AGENCY_EAGER_AGENTS", "false").lower() == "true":
+    registry.materialize_all()  # Build and sync every agent up front, e.g. for a warm server
 
 if __name__ == "__main__":
-    agency.run_demo()  # Start the agency in terminal mode 
\ No newline at end of file
+    agency.run_demo()  # Start the agency in terminal mode
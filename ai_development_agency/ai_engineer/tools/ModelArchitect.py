@@ -1,9 +1,15 @@
-from agency_swarm.tools import BaseTool
 from pydantic import Field
 from typing import Dict, List, Optional
-import json
+if __name__ == "__main__" and not __package__:
+    # Run as a script: the shared modules live in the agency root
+    import sys
+    from pathlib import Path
+    sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from common.async_tool import AsyncTool
+from common.tool_stream import build_report
+from common.tool_cache import cached_run
 
-class ModelArchitect(BaseTool):
+class ModelArchitect(AsyncTool):
     """
     A tool for designing AI/ML model architectures, selecting appropriate frameworks,
     and planning model deployment strategies.
@@ -24,6 +30,7 @@ class ModelArchitect(BaseTool):
         description="Optional constraints like hardware limitations, latency requirements, or memory bounds"
     )
 
+    @cached_run
     def run(self) -> str:
         """
         Generates model architecture designs and recommendations based on the specified parameters.
@@ -41,47 +48,47 @@ class ModelArchitect(BaseTool):
 
     def _design_model_architecture(self) -> str:
         architecture = {
-            "model_type": self._determine_model_type(),
-            "architecture_details": self._specify_architecture(),
-            "framework_selection": self._select_framework(),
-            "performance_estimates": self._estimate_performance(),
-            "resource_requirements": self._estimate_resources(),
-            "scaling_considerations": self._consider_scaling()
+            "model_type": self._determine_model_type,
+            "architecture_details": self._specify_architecture,
+            "framework_selection": self._select_framework,
+            "performance_estimates": self._estimate_performance,
+            "resource_requirements": self._estimate_resources,
+            "scaling_considerations": self._consider_scaling
         }
         
-        return json.dumps(architecture, indent=2)
+        return build_report(architecture)
 
     def _design_training_pipeline(self) -> str:
         pipeline = {
-            "data_pipeline": self._design_data_pipeline(),
-            "preprocessing": self._design_preprocessing(),
-            "training_strategy": self._design_training_strategy(),
-            "validation_approach": self._design_validation_approach(),
-            "monitoring_setup": self._design_training_monitoring()
+            "data_pipeline": self._design_data_pipeline,
+            "preprocessing": self._design_preprocessing,
+            "training_strategy": self._design_training_strategy,
+            "validation_approach": self._design_validation_approach,
+            "monitoring_setup": self._design_training_monitoring
         }
         
-        return json.dumps(pipeline, indent=2)
+        return build_report(pipeline)
 
     def _design_deployment_strategy(self) -> str:
         strategy = {
-            "deployment_type": self._determine_deployment_type(),
-            "serving_infrastructure": self._design_serving_infrastructure(),
-            "scaling_strategy": self._design_scaling_strategy(),
-            "monitoring_setup": self._design_monitoring_setup(),
-            "fallback_mechanisms": self._design_fallback_mechanisms()
+            "deployment_type": self._determine_deployment_type,
+            "serving_infrastructure": self._design_serving_infrastructure,
+            "scaling_strategy": self._design_scaling_strategy,
+            "monitoring_setup": self._design_monitoring_setup,
+            "fallback_mechanisms": self._design_fallback_mechanisms
         }
         
-        return json.dumps(strategy, indent=2)
+        return build_report(strategy)
 
     def _design_optimization_strategy(self) -> str:
         optimization = {
-            "performance_optimizations": self._design_performance_optimizations(),
-            "resource_optimizations": self._design_resource_optimizations(),
-            "latency_optimizations": self._design_latency_optimizations(),
-            "memory_optimizations": self._design_memory_optimizations()
+            "performance_optimizations": self._design_performance_optimizations,
+            "resource_optimizations": self._design_resource_optimizations,
+            "latency_optimizations": self._design_latency_optimizations,
+            "memory_optimizations": self._design_memory_optimizations
         }
         
-        return json.dumps(optimization, indent=2)
+        return build_report(optimization)
 
     def _determine_model_type(self) -> Dict:
         task_type = self.requirements.get("task_type", "")
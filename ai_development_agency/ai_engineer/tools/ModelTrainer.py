@@ -1,9 +1,15 @@
-from agency_swarm.tools import BaseTool
 from pydantic import Field
 from typing import Dict, List, Optional
-import json
+if __name__ == "__main__" and not __package__:
+    # Run as a script: the shared modules live in the agency root
+    import sys
+    from pathlib import Path
+    sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from common.async_tool import AsyncTool
+from common.tool_stream import build_report
+from common.tool_cache import cached_run
 
-class ModelTrainer(BaseTool):
+class ModelTrainer(AsyncTool):
     """
     A tool for training, optimizing, and evaluating AI/ML models,
     including data preprocessing, training pipeline setup, and performance monitoring.
@@ -24,6 +30,7 @@ class ModelTrainer(BaseTool):
         description="Optional configuration for monitoring training progress and performance"
     )
 
+    @cached_run
     def run(self) -> str:
         """
         Executes the specified training phase and returns relevant metrics and information.
@@ -41,43 +48,43 @@ class ModelTrainer(BaseTool):
 
     def _setup_preprocessing(self) -> str:
         preprocessing = {
-            "data_pipeline": self._configure_data_pipeline(),
-            "preprocessing_steps": self._define_preprocessing_steps(),
-            "validation_setup": self._setup_validation_pipeline(),
-            "resource_allocation": self._allocate_preprocessing_resources()
+            "data_pipeline": self._configure_data_pipeline,
+            "preprocessing_steps": self._define_preprocessing_steps,
+            "validation_setup": self._setup_validation_pipeline,
+            "resource_allocation": self._allocate_preprocessing_resources
         }
         
-        return json.dumps(preprocessing, indent=2)
+        return build_report(preprocessing)
 
     def _setup_training(self) -> str:
         training = {
-            "training_pipeline": self._configure_training_pipeline(),
-            "optimization_setup": self._setup_optimization_strategy(),
-            "monitoring_config": self._setup_training_monitoring(),
-            "checkpointing": self._configure_checkpointing()
+            "training_pipeline": self._configure_training_pipeline,
+            "optimization_setup": self._setup_optimization_strategy,
+            "monitoring_config": self._setup_training_monitoring,
+            "checkpointing": self._configure_checkpointing
         }
         
-        return json.dumps(training, indent=2)
+        return build_report(training)
 
     def _setup_evaluation(self) -> str:
         evaluation = {
-            "evaluation_metrics": self._define_evaluation_metrics(),
-            "testing_pipeline": self._configure_testing_pipeline(),
-            "performance_analysis": self._analyze_performance(),
-            "validation_results": self._generate_validation_results()
+            "evaluation_metrics": self._define_evaluation_metrics,
+            "testing_pipeline": self._configure_testing_pipeline,
+            "performance_analysis": self._analyze_performance,
+            "validation_results": self._generate_validation_results
         }
         
-        return json.dumps(evaluation, indent=2)
+        return build_report(evaluation)
 
     def _setup_optimization(self) -> str:
         optimization = {
-            "optimization_strategy": self._define_optimization_strategy(),
-            "hyperparameter_tuning": self._setup_hyperparameter_tuning(),
-            "model_compression": self._configure_model_compression(),
-            "performance_tracking": self._setup_performance_tracking()
+            "optimization_strategy": self._define_optimization_strategy,
+            "hyperparameter_tuning": self._setup_hyperparameter_tuning,
+            "model_compression": self._configure_model_compression,
+            "performance_tracking": self._setup_performance_tracking
         }
         
-        return json.dumps(optimization, indent=2)
+        return build_report(optimization)
 
     def _configure_data_pipeline(self) -> Dict:
         return {
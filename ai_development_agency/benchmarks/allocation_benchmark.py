@@ -0,0 +1,123 @@
+import argparse
+import json
+import random
+import time
+
+from common.allocation import ResourceAllocator
+from benchmarks.schedule_benchmark import random_portfolio
+
+SKILLS = [f"skill-{i}" for i in range(20)]
+INFRASTRUCTURE_TYPES = ["gpu", "staging", "device-lab"]
+
+
+def random_roster(num_people: int, num_infrastructure: int, rng: random.Random):
+    people = [
+        {"name": f"person-{i}", "skills": rng.sample(SKILLS, 4), "capacity": rng.choice([1, 1, 2])}
+        for i in range(num_people)
+    ]
+    infrastructure = [
+        {"name": f"infra-{i}", "type": rng.choice(INFRASTRUCTURE_TYPES), "capacity": 2}
+        for i in range(num_infrastructure)
+    ]
+    return people + infrastructure
+
+
+def random_commitments(resources, count: int, horizon: float, rng: random.Random):
+    """
+    Existing bookings concentrated on a few busy people, each with a long calendar.
+    """
+    commitments = []
+    for i in range(count):
+        start = rng.uniform(0, horizon)
+        commitments.append({
+            "resource": rng.choice(resources)["name"],
+            "start": start,
+            "end": start + rng.uniform(1, 10),
+            "project": f"project-{i % 50}",
+        })
+    return commitments
+
+
+def pairwise_conflicts(resources, commitments) -> int:
+    # The same booking rule as the allocator, but checking each commitment
+    # against every earlier booking of the resource instead of a tree query
+    lanes = {resource["name"]: [[] for _ in range(resource.get("capacity", 1))] for resource in resources}
+    conflicts = 0
+    for commitment in commitments:
+        for bookings in lanes[commitment["resource"]]:
+            if not any(start < commitment["end"] and end > commitment["start"] for start, end in bookings):
+                bookings.append((commitment["start"], commitment["end"]))
+                break
+        else:
+            conflicts += 1
+    return conflicts
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Resource allocation: full plan, incremental re-plan and interval-tree conflict checks"
+    )
+    parser.add_argument("--people", type=int, default=300)
+    parser.add_argument("--infrastructure", type=int, default=30)
+    parser.add_argument("--tasks", type=int, default=5000)
+    parser.add_argument("--commitments", type=int, default=20_000)
+    parser.add_argument("--busy-people", type=int, default=10)
+    parser.add_argument("--updates", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    resources = random_roster(args.people, args.infrastructure, rng)
+    tasks = random_portfolio(args.tasks, 2, rng)
+    for task in tasks:
+        task["skills"] = rng.sample(SKILLS, rng.randint(1, 2))
+        if rng.random() < 0.2:
+            task["infrastructure"] = [rng.choice(INFRASTRUCTURE_TYPES)]
+    commitments = random_commitments(resources[:args.busy_people], args.commitments, 5000, rng)
+
+    start = time.perf_counter()
+    allocator = ResourceAllocator(resources, commitments)
+    booking_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    allocator.plan(tasks)
+    plan_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    naive_conflicts = pairwise_conflicts(resources, commitments)
+    pairwise_seconds = time.perf_counter() - start
+
+    updates = [(f"task-{rng.randrange(args.tasks)}", rng.randint(1, 20)) for _ in range(args.updates)]
+    replaced = 0
+    start = time.perf_counter()
+    for task_id, duration in updates:
+        replaced += allocator.update_task(task_id, duration=duration)
+    incremental_seconds = (time.perf_counter() - start) / args.updates
+
+    summary = allocator.summary()
+    report = {
+        "people": args.people,
+        "infrastructure": args.infrastructure,
+        "tasks": args.tasks,
+        "full_plan_seconds": round(plan_seconds, 3),
+        "per_update": {
+            "incremental_ms": round(incremental_seconds * 1000, 3),
+            "full_plan_ms": round(plan_seconds * 1000, 3),
+            "avg_tasks_replaced": round(replaced / args.updates, 1),
+        },
+        "commitment_conflicts": {
+            "commitments": args.commitments,
+            "busy_people": args.busy_people,
+            "interval_tree_ms": round(booking_seconds * 1000, 3),
+            "pairwise_ms": round(pairwise_seconds * 1000, 3),
+            "conflicts": sum(1 for c in allocator.conflicts if c["conflict_type"] == "scheduling"),
+            "pairwise_conflicts": naive_conflicts,
+        },
+        "makespan_days": summary["makespan_days"],
+        "unassignable": len(summary["unassignable"]),
+    }
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
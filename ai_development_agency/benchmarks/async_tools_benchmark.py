@@ -0,0 +1,105 @@
+import argparse
+import json
+import os
+import time
+from types import SimpleNamespace
+
+os.environ.setdefault("OPENAI_API_KEY", "sk-offline-benchmark")
+
+from openai.types.beta.threads.required_action_function_tool_call import (
+    Function,
+    RequiredActionFunctionToolCall,
+)
+
+from common.async_tool import ConcurrentToolsThread
+from common.tool_cache import tool_cache
+from devops_engineer.tools.InfrastructureManager import InfrastructureManager
+
+OPERATIONS = ["provision", "deploy", "monitor", "maintain"]
+
+INFRA_CONFIG = {
+    "cloud_provider": "AWS",
+    "region": "us-west-2",
+    "resources": {"compute": "kubernetes", "database": "postgresql"},
+}
+
+
+class RemoteInfrastructureManager(InfrastructureManager):
+    """
+    InfrastructureManager with a fixed delay per call, standing in for the cloud
+    API round trips a real provision/deploy/monitor/maintain call would make.
+    """
+
+    _latency = 0.25
+
+    def run(self) -> str:
+        time.sleep(self._latency)
+        return super().run()
+
+
+def run_turn(concurrent: bool) -> float:
+    """
+    Handles one requires_action step with the four operations the way
+    agency_swarm does, with the submission of the outputs to the API left out.
+    """
+    tool_cache.clear()
+    agent = SimpleNamespace(name="DevOps Engineer", functions=[RemoteInfrastructureManager])
+    thread = ConcurrentToolsThread(SimpleNamespace(name="CTO"), agent)
+    thread.concurrent_tools = concurrent
+
+    tool_calls = [
+        RequiredActionFunctionToolCall(
+            id=f"call_{operation}",
+            type="function",
+            function=Function(
+                name=RemoteInfrastructureManager.__name__,
+                arguments=json.dumps({"infra_config": INFRA_CONFIG, "operation_type": operation}),
+            ),
+        )
+        for operation in OPERATIONS
+    ]
+    thread._run = SimpleNamespace(
+        id="run_benchmark",
+        status="requires_action",
+        model="gpt-4o",
+        required_action=SimpleNamespace(submit_tool_outputs=SimpleNamespace(tool_calls=tool_calls)),
+    )
+    submitted = []
+    thread.submit_tool_outputs = lambda tool_outputs, event_handler=None: submitted.extend(tool_outputs)
+
+    start = time.perf_counter()
+    for _ in thread._handle_run_requires_action(agent, None, False, None, None):
+        pass
+    elapsed = time.perf_counter() - start
+
+    assert len(submitted) == len(OPERATIONS), submitted
+    assert all(isinstance(output["output"], str) for output in submitted), submitted
+    assert all(not output["output"].startswith("Error") for output in submitted), submitted
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Wall time of four InfrastructureManager calls in one turn, sequential vs concurrent"
+    )
+    parser.add_argument("--latency", type=float, default=0.25,
+                        help="Simulated seconds per InfrastructureManager call")
+    parser.add_argument("--runs", type=int, default=3)
+    args = parser.parse_args()
+
+    RemoteInfrastructureManager._latency = args.latency
+    sequential = sorted(run_turn(concurrent=False) for _ in range(args.runs))[args.runs // 2]
+    concurrent = sorted(run_turn(concurrent=True) for _ in range(args.runs))[args.runs // 2]
+
+    report = {
+        "operations": OPERATIONS,
+        "latency_per_call_s": args.latency,
+        "sequential_s": round(sequential, 3),
+        "concurrent_s": round(concurrent, 3),
+        "speedup": round(sequential / concurrent, 2),
+    }
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
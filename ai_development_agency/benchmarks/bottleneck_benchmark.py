@@ -0,0 +1,93 @@
+import argparse
+import json
+import random
+import time
+import tracemalloc
+
+from common.bottlenecks import SECONDS_PER_DAY, StageMonitor
+
+# (stage, people working it, mean days per task); review is understaffed
+PIPELINE = [("assigned", 6, 0.5), ("in_progress", 8, 2.0), ("review", 2, 0.95)]
+
+
+def simulated_events(num_events: int, arrivals_per_day: float, rng: random.Random):
+    """
+    Tasks flowing through the pipeline stages and into 'completed', as task
+    events in time order. Each stage serves tasks first come, first served
+    with its number of people and exponential service times.
+    """
+    # Twice the tasks needed, so arrivals continue past the last event kept
+    num_tasks = 2 * num_events // (len(PIPELINE) + 1) + 1
+    clock = 0.0
+    entered = []
+    for task in range(num_tasks):
+        clock += rng.expovariate(arrivals_per_day) * SECONDS_PER_DAY
+        entered.append((clock, task))
+
+    events = []
+    previous = {}  # task -> (status, since, person)
+    for stage, people, mean_days in PIPELINE:
+        free_at = [0.0] * people
+        finished = []
+        for at, task in sorted(entered):
+            events.append((at, task, previous.get(task), stage))
+            person = min(range(people), key=free_at.__getitem__)
+            finish = max(at, free_at[person]) + rng.expovariate(1 / mean_days) * SECONDS_PER_DAY
+            free_at[person] = finish
+            previous[task] = (stage, at, f"{stage}-{person}")
+            finished.append((finish, task))
+        entered = finished
+    events += [(at, task, previous[task], "completed") for at, task in entered]
+
+    events.sort(key=lambda event: event[0])
+    for seq, (at, _, old, new_status) in enumerate(events[:num_events], start=1):
+        yield {
+            "seq": seq,
+            "project_id": "PRJ-001",
+            "at": at,
+            "old_status": old[0] if old else None,
+            "new_status": new_status,
+            "old_status_since": old[1] if old else None,
+            "old_assignee": old[2] if old else None,
+        }
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Streaming bottleneck detection: throughput and memory over a long event history"
+    )
+    parser.add_argument("--events", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    parser.add_argument("--arrivals-per-day", type=float, default=2.2)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    report = {"runs": {}}
+    for num_events in args.events:
+        events = list(simulated_events(num_events, args.arrivals_per_day, random.Random(args.seed)))
+        monitor = StageMonitor()
+        tracemalloc.start()
+        start = time.perf_counter()
+        for event in events:
+            monitor.apply(event)
+        elapsed = time.perf_counter() - start
+        memory = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+
+        wip = {}
+        for event in events:
+            wip[event["new_status"]] = wip.get(event["new_status"], 0) + 1
+            if event["old_status"]:
+                wip[event["old_status"]] -= 1
+        now = events[-1]["at"]
+        bottlenecks = monitor.bottlenecks("PRJ-001", wip, now)
+        report["runs"][f"{num_events}_events"] = {
+            "events_per_second": int(num_events / elapsed),
+            "monitor_memory_kb": round(memory / 1024, 1),
+            "bottlenecks": [b["area"] for b in bottlenecks],
+            "stages": monitor.stage_stats("PRJ-001", wip, now),
+        }
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+import argparse
+import json
+import math
+import time
+
+from common.capacity import CapacitySimulator
+
+
+def erlang_c_wait_ms(arrival_rate: float, service_ms: float, servers: int) -> float:
+    """
+    Mean queueing delay of an M/M/c queue.
+    """
+    load = arrival_rate * service_ms / 1000
+    utilization = load / servers
+    terms = sum(load ** k / math.factorial(k) for k in range(servers))
+    tail = load ** servers / math.factorial(servers) / (1 - utilization)
+    waiting = tail / (terms + tail)
+    return waiting * service_ms / (servers - load)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Capacity simulator: agreement with M/M/c theory, and replica planning time"
+    )
+    parser.add_argument("--requests", type=int, default=200_000)
+    parser.add_argument("--rate", type=float, default=2000, help="requests/second for the planning run")
+    parser.add_argument("--target-ms", type=float, default=75)
+    args = parser.parse_args()
+
+    validation = []
+    for servers, utilization in [(1, 0.5), (1, 0.8), (4, 0.7), (8, 0.9)]:
+        service_ms = 10.0
+        rate = utilization * servers * 1000 / service_ms
+        tiers = [{"name": "Queue", "service_ms": service_ms, "service_cv": 1.0, "concurrency": servers}]
+        result = CapacitySimulator(rate, tiers, requests=args.requests).run([1])
+        validation.append({
+            "servers": servers,
+            "utilization": utilization,
+            "simulated_wait_ms": result["tiers"][0]["mean_queueing_delay_ms"],
+            "erlang_c_wait_ms": round(erlang_c_wait_ms(rate, service_ms, servers), 3),
+        })
+
+    start = time.perf_counter()
+    simulator = CapacitySimulator(args.rate)
+    plan = simulator.plan(args.target_ms, min_replicas=2)
+    plan_seconds = time.perf_counter() - start
+
+    report = {
+        "mm_c_validation": validation,
+        "plan": {
+            "arrival_rate": args.rate,
+            "target_p99_ms": args.target_ms,
+            "meets_target": plan["meets_target"],
+            "p99_ms": plan["latency_ms"]["p99"],
+            "replicas": {tier["name"]: tier["replicas"] for tier in plan["tiers"]},
+            "tier_simulations": len(simulator._cache),
+            "seconds": round(plan_seconds, 3),
+        },
+    }
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+import argparse
+import json
+import os
+import random
+import tempfile
+import time
+
+from common.tech_catalog import TechCatalog, compile_catalog, words
+
+KINDS = ["framework", "database", "cloud_service", "ai_platform", "development_tool"]
+CATEGORIES = [f"Category {i}" for i in range(40)]
+FEATURES = [f"Feature {i}" for i in range(2000)]
+TAGS = [f"tag{i}" for i in range(500)]
+
+
+def random_catalog(num_entries: int, rng: random.Random):
+    return {
+        "version": "benchmark",
+        "technologies": [
+            {
+                "name": f"Technology {i}",
+                "kind": rng.choice(KINDS),
+                "category": rng.choice(CATEGORIES),
+                "key_features": rng.sample(FEATURES, 4),
+                "tags": rng.sample(TAGS, 6),
+            }
+            for i in range(num_entries)
+        ],
+    }
+
+
+def scan(entries, kind, required_features, preferred, limit):
+    # The same selection and ranking, entry by entry over the parsed JSON
+    preferred_words = {word for text in preferred for word in words(text)}
+    ranked = []
+    for number, entry in enumerate(entries):
+        if entry["kind"] != kind:
+            continue
+        features = {feature.lower() for feature in entry["key_features"]}
+        if any(feature.lower() not in features for feature in required_features):
+            continue
+        text = " ".join([entry["name"], entry["category"], *entry["key_features"], *entry["tags"]])
+        ranked.append((-len(preferred_words & set(words(text))), number, entry))
+    ranked.sort(key=lambda item: item[:2])
+    return [entry for _, _, entry in ranked[:limit]]
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Technology catalog: compiled, memory-mapped inverted index against a linear scan"
+    )
+    parser.add_argument("--entries", type=int, default=50_000)
+    parser.add_argument("--queries", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    catalog = random_catalog(args.entries, rng)
+    queries = [
+        (
+            rng.choice(KINDS),
+            rng.sample(FEATURES, rng.randint(0, 1)),
+            [" ".join(rng.sample(TAGS, 3)), rng.choice(CATEGORIES)],
+        )
+        for _ in range(args.queries)
+    ]
+
+    with tempfile.TemporaryDirectory() as directory:
+        source_path = os.path.join(directory, "catalog.json")
+        index_path = os.path.join(directory, "catalog.idx")
+        with open(source_path, "w") as source:
+            json.dump(catalog, source)
+
+        start = time.perf_counter()
+        compile_catalog(source_path, index_path)
+        compile_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        index = TechCatalog(index_path)
+        open_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        results = [
+            index.search(kind, required_features=required, preferred=preferred, limit=5)
+            for kind, required, preferred in queries
+        ]
+        index_ms = (time.perf_counter() - start) / args.queries * 1000
+
+        start = time.perf_counter()
+        with open(source_path) as source:
+            entries = json.load(source)["technologies"]
+        load_seconds = time.perf_counter() - start
+
+        sample = queries[:20]
+        start = time.perf_counter()
+        scanned = [scan(entries, kind, required, preferred, 5) for kind, required, preferred in sample]
+        scan_ms = (time.perf_counter() - start) / len(sample) * 1000
+        index_size = os.path.getsize(index_path)
+        index.close()
+
+    report = {
+        "entries": args.entries,
+        "compile_seconds": round(compile_seconds, 2),
+        "index_mb": round(index_size / 2 ** 20, 1),
+        "open_ms": {
+            "mmap_index": round(open_seconds * 1000, 1),
+            "parse_json": round(load_seconds * 1000, 1),
+        },
+        "query_ms": {
+            "inverted_index": round(index_ms, 4),
+            "linear_scan": round(scan_ms, 1),
+        },
+        "matches_scan": results[:len(sample)] == scanned,
+    }
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
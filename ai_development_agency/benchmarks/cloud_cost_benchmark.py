@@ -0,0 +1,100 @@
+import argparse
+import itertools
+import json
+import time
+
+import numpy as np
+
+from common.cloud_costs import get_cost_model, workload_spec
+
+GRID = {
+    "rps": np.geomspace(10, 20_000, 40).round(1).tolist(),
+    "response_kb": [2, 10, 50, 200, 1000],
+    "database_gb": [5, 50, 500, 5000],
+    "growth_per_month": [0.0, 0.05, 0.1, 0.2],
+    "db_replicas": [1, 2],
+}
+
+
+def python_total(model, workload, provider):
+    """
+    One configuration priced month by month and option by option in Python.
+    """
+    p = model._prices[provider]
+    hours = model.hours_per_month
+    total = 0.0
+    for month in range(workload["months"]):
+        growth = (1 + workload["growth_per_month"]) ** month
+        rps = workload["rps"] * growth
+        peak = rps * workload["peak_to_average"] / workload["target_utilization"]
+
+        vcpu = peak * workload["cpu_ms_per_request"] / 1000
+        total += min(
+            max(workload["min_instances"], np.ceil(vcpu / size)) * hourly * hours
+            for size, hourly in zip(p["compute_vcpu"], p["compute_hourly"])
+        )
+
+        egress_gb = rps * workload["response_kb"] * 730 * 3600 / 2 ** 20
+        for lower, upper, price in zip(p["egress_lower"], p["egress_upper"], p["egress_price"]):
+            total += min(max(egress_gb - lower, 0), upper - lower) * price
+
+        hot_gb = workload["database_gb"] * growth * workload["db_hot_fraction"]
+        db_vcpu = peak * workload["db_cpu_ms_per_request"] / 1000
+        options = []
+        for size, memory, hourly in zip(p["db_vcpu"], p["db_memory"], p["db_hourly"]):
+            memory_nodes = np.ceil(hot_gb / memory)
+            if memory_nodes > 1 and memory < p["db_memory"].max():
+                continue
+            options.append(max(1, memory_nodes, np.ceil(db_vcpu / size)) * hourly * hours)
+        total += workload["db_replicas"] * (min(options) + workload["database_gb"] * growth * p["db_storage"])
+
+        total += workload["storage_gb"] * growth * p["storage"]
+    return total
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Cloud cost model: a vectorized what-if sweep against pricing each configuration in Python"
+    )
+    parser.add_argument("--months", type=int, default=24)
+    parser.add_argument("--sample", type=int, default=200, help="configurations priced by the Python loop")
+    args = parser.parse_args()
+
+    model = get_cost_model()
+    base = {"months": args.months}
+
+    start = time.perf_counter()
+    result = model.sweep(base, GRID)
+    sweep_seconds = time.perf_counter() - start
+    configurations = len(result["cheapest"])
+
+    spec = workload_spec(base)
+    combos = list(itertools.product(*GRID.values()))
+    sample = range(0, configurations, max(1, configurations // args.sample))
+    start = time.perf_counter()
+    looped = {
+        provider: [python_total(model, {**spec, **dict(zip(GRID, combos[i]))}, provider) for i in sample]
+        for provider in model.providers
+    }
+    loop_seconds = (time.perf_counter() - start) / len(sample) * configurations
+
+    report = {
+        "configurations": configurations,
+        "providers": len(model.providers),
+        "months": args.months,
+        "seconds": {
+            "vectorized_sweep": round(sweep_seconds, 3),
+            "python_loop_extrapolated": round(loop_seconds, 1),
+        },
+        "cheapest_share": {
+            provider: round(float((result["cheapest"] == provider).mean()), 3) for provider in model.providers
+        },
+        "matches_python": all(
+            np.allclose(result["total_cost"][provider][list(sample)], looped[provider]) for provider in model.providers
+        ),
+    }
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
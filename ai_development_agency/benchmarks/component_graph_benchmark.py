@@ -0,0 +1,88 @@
+import argparse
+import json
+import random
+import time
+
+import numpy as np
+
+from common.component_graph import Call, Component, ComponentGraph
+
+
+def random_graph(num_services: int, rng: random.Random) -> ComponentGraph:
+    # Layered like a microservice estate: each service calls a few services from the next layers down
+    graph = ComponentGraph(Component(f"service-{i}", round(rng.uniform(0.5, 20), 2)) for i in range(num_services))
+    for target in range(1, num_services):
+        for _ in range(rng.randint(1, 2)):
+            source = rng.randrange(max(0, target - 30), target)
+            graph.add_call(Call(
+                f"service-{source}", f"service-{target}",
+                mode="async" if rng.random() < 0.15 else "sync",
+                fan_out=rng.choice([1, 1, 1, 2, 3]),
+                parallel=rng.random() < 0.5,
+                latency_ms=round(rng.uniform(0.1, 2), 2),
+            ))
+    return graph
+
+
+def walk(graph: ComponentGraph, name: str, memo: dict) -> float:
+    # The same latency computed by recursing over the calls, without the multiplier matrix
+    if name not in memo:
+        total = graph.components[name].latency_ms
+        for call in graph.calls:
+            if call.source == name and call.mode == "sync":
+                total += call.multiplier * (call.latency_ms + walk(graph, call.target, memo))
+        memo[name] = total
+    return memo[name]
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Component graph: latency budgets over a large service graph, full and incremental"
+    )
+    parser.add_argument("--services", type=int, default=500)
+    parser.add_argument("--updates", type=int, default=10_000)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    graph = random_graph(args.services, rng)
+
+    start = time.perf_counter()
+    entries = graph.entry_points()
+    graph.latency(entries[0])
+    build_ms = (time.perf_counter() - start) * 1000
+
+    start = time.perf_counter()
+    report = graph.budgets({entry: 500 for entry in entries})
+    budgets_ms = (time.perf_counter() - start) * 1000
+
+    names = list(graph.components)
+    updates = [(rng.choice(names), round(rng.uniform(0.5, 20), 2)) for _ in range(args.updates)]
+    start = time.perf_counter()
+    for name, latency_ms in updates:
+        graph.set_latency(name, latency_ms)
+    incremental_us = (time.perf_counter() - start) / args.updates * 1e6
+
+    incremental = [graph.latency(entry) for entry in entries]
+    start = time.perf_counter()
+    memo = {}
+    walked = [walk(graph, entry, memo) for entry in entries]
+    walk_ms = (time.perf_counter() - start) * 1000
+
+    print(json.dumps({
+        "services": args.services,
+        "calls": len(graph.calls),
+        "entry_points": len(entries),
+        "build_ms": round(build_ms, 2),
+        "all_budgets_ms": round(budgets_ms, 2),
+        "latency_update_us": {
+            "incremental": round(incremental_us, 2),
+            "recursive_walk": round(walk_ms * 1000, 1),
+        },
+        "dominant_hops": sorted({path["dominant_hop"] for path in report.values()})[:5],
+        "matches_walk": bool(np.allclose(incremental, walked)),
+    }, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+import argparse
+import json
+import random
+import statistics
+import time
+
+from common.context_window import ContextWindow
+from common.tokens import count_tokens
+
+TOPICS = [
+    "database schema migration plan for the orders service",
+    "frontend component library and design tokens",
+    "kubernetes autoscaling policy for the inference API",
+    "authentication flow with OAuth2 and refresh tokens",
+    "feature store and batch pipeline for model training",
+    "load testing results for the checkout endpoint",
+]
+
+
+def generate_thread(turns: int, seed: int):
+    """
+    A synthetic CEO <-> CTO thread: each turn has a request, a tool output and a
+    reply, and requests regularly come back to earlier topics.
+    """
+    rng = random.Random(seed)
+    messages = []
+    for turn in range(turns):
+        topic = rng.choice(TOPICS)
+        request = f"Turn {turn}: please review the {topic}. " + " ".join(
+            rng.choice(topic.split()) + f" item{rng.randint(0, 50)}" for _ in range(60)
+        )
+        tool_output = json.dumps({
+            "analysis": topic,
+            "findings": [f"{topic} finding {i} metric{rng.randint(0, 999)}" for i in range(40)],
+        })
+        reply = f"The {topic} looks feasible. " + " ".join(
+            f"step{i} {rng.choice(topic.split())}" for i in range(80)
+        )
+        messages.append(("user", request, None))
+        messages.append(("tool", tool_output, f"call_{turn}"))
+        messages.append(("assistant", reply, None))
+    return messages
+
+
+def run_context_window(messages, max_prompt_tokens, reserved_tokens):
+    window = ContextWindow(max_prompt_tokens=max_prompt_tokens, reserved_tokens=reserved_tokens)
+    latencies = []
+    peak = 0
+    for role, content, tool_call_id in messages:
+        start = time.perf_counter()
+        window.add(role, content, tool_call_id=tool_call_id)
+        latencies.append(time.perf_counter() - start)
+        # Pinned tool outputs are rendered into the request instead of being
+        # replayed by the thread, so total_tokens already accounts for them
+        peak = max(peak, window.total_tokens)
+    return latencies, peak
+
+
+def run_full_truncation(messages, max_prompt_tokens, reserved_tokens):
+    """
+    Baseline: recount the whole history on every message and drop the oldest
+    messages until it fits.
+    """
+    history = []
+    latencies = []
+    peak = 0
+    for role, content, _ in messages:
+        start = time.perf_counter()
+        history.append(content)
+        total = reserved_tokens + sum(count_tokens(m) for m in history)
+        while total > max_prompt_tokens and history:
+            total -= count_tokens(history.pop(0))
+        latencies.append(time.perf_counter() - start)
+        peak = max(peak, total)
+    return latencies, peak
+
+
+def summarize(latencies, peak, budget):
+    ordered = sorted(latencies)
+    return {
+        "p50_ms": round(statistics.median(ordered) * 1000, 3),
+        "p99_ms": round(ordered[int(len(ordered) * 0.99) - 1] * 1000, 3),
+        "max_ms": round(ordered[-1] * 1000, 3),
+        "peak_prompt_tokens": peak,
+        "within_budget": peak <= budget,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Context window latency over a long CEO <-> CTO thread")
+    parser.add_argument("--turns", type=int, default=300)
+    parser.add_argument("--max-prompt-tokens", type=int, default=25000)
+    parser.add_argument("--reserved-tokens", type=int, default=2500,
+                        help="Instructions and tool schema tokens sent with every request")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    messages = generate_thread(args.turns, args.seed)
+    report = {
+        "messages": len(messages),
+        "context_window": summarize(
+            *run_context_window(messages, args.max_prompt_tokens, args.reserved_tokens),
+            args.max_prompt_tokens,
+        ),
+        "full_history_truncation": summarize(
+            *run_full_truncation(messages, args.max_prompt_tokens, args.reserved_tokens),
+            args.max_prompt_tokens,
+        ),
+    }
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+import argparse
+import json
+
+from common.db_workloads import BACKENDS, WORKLOAD_SHAPES, BenchmarkResults, get_benchmark_results
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Read/write/mixed workloads against the embedded database stand-ins TechEvaluator cites"
+    )
+    parser.add_argument("--backends", nargs="+", default=list(BACKENDS), choices=list(BACKENDS))
+    parser.add_argument("--shapes", nargs="+", default=["read_heavy", "mixed", "write_heavy"],
+                        choices=list(WORKLOAD_SHAPES))
+    parser.add_argument("--records", type=int, default=10_000)
+    parser.add_argument("--operations", type=int, default=20_000)
+    parser.add_argument("--value-bytes", type=int, default=512)
+    parser.add_argument("--key-distribution", default="zipfian", choices=["zipfian", "uniform"])
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--save", action="store_true",
+                        help="store the results where TechEvaluator reads them (AGENCY_DB_BENCHMARK_PATH)")
+    args = parser.parse_args()
+
+    results = get_benchmark_results() if args.save else BenchmarkResults()
+    report = {}
+    for shape in args.shapes:
+        workload = {
+            "shape": shape,
+            "records": args.records,
+            "operations": args.operations,
+            "value_bytes": args.value_bytes,
+            "key_distribution": args.key_distribution,
+            "seed": args.seed,
+        }
+        report[shape] = {}
+        for backend in args.backends:
+            result = results.measure(backend, workload, rerun=True)
+            report[shape][backend] = {
+                "throughput_ops_per_second": result["throughput_ops_per_second"],
+                "load_records_per_second": result["load_records_per_second"],
+                "read": result["read"].summary(),
+                "write": result["write"].summary(),
+            }
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+import argparse
+import json
+import random
+import time
+
+from common.design_cache import design_cache
+from cto.tools.ArchitectureDesigner import ArchitectureDesigner
+
+
+def service_graph(num_services: int, rng: random.Random) -> dict:
+    components = [{"name": f"service-{i}", "latency_ms": round(rng.uniform(0.5, 20), 2)} for i in range(num_services)]
+    interactions = [
+        {"from": f"service-{rng.randrange(max(0, i - 20), i)}", "to": f"service-{i}",
+         "fan_out": rng.choice([1, 1, 2]), "parallel": rng.random() < 0.5, "latency_ms": 1}
+        for i in range(1, num_services)
+    ]
+    return {"components": components, "interactions": interactions}
+
+
+def design(requirements: dict, design_id=None) -> str:
+    return ArchitectureDesigner(
+        project_requirements=requirements, design_type="system", scalability_level="high", design_id=design_id
+    ).run()
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Incremental re-design: one changed requirement against regenerating the whole design"
+    )
+    parser.add_argument("--services", type=int, default=300)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    requirements = {
+        "project_type": "Marketplace",
+        "performance_requirements": {"latency": "< 250ms"},
+        "capacity": {"arrival_rate": 800},
+        "component_graph": service_graph(args.services, rng),
+    }
+    revised = {**requirements, "capacity": {"arrival_rate": 2400}}
+
+    design_cache.clear()
+    start = time.perf_counter()
+    full = design(revised)
+    full_seconds = time.perf_counter() - start
+
+    design_cache.clear()
+    design(requirements, design_id="benchmark")
+    start = time.perf_counter()
+    diff = design(revised, design_id="benchmark")
+    incremental_seconds = time.perf_counter() - start
+
+    changes = json.loads(diff)
+    print(json.dumps({
+        "services": args.services,
+        "changed_fields": changes["changed_fields"],
+        "recomputed_sections": changes["recomputed_sections"],
+        "changes": len(changes["changes"]),
+        "seconds": {
+            "full_design": round(full_seconds, 3),
+            "incremental": round(incremental_seconds, 3),
+        },
+        "output_bytes": {
+            "full_design": len(full),
+            "diff": len(diff),
+        },
+    }, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+import argparse
+import json
+import os
+import random
+import time
+
+os.environ.setdefault("OPENAI_API_KEY", "sk-offline-benchmark")
+
+from agency import create_agency
+from common.fan_out import DEFAULT_MAX_CONCURRENCY, create_fan_out_tool
+
+
+class SimulatedThread:
+    """
+    Stands in for a CEO -> specialist thread: answers after a fixed latency
+    instead of running an assistant, so the benchmark runs offline.
+    """
+
+    def __init__(self, recipient: str, latency: float):
+        self.recipient = recipient
+        self.latency = latency
+
+    def get_completion(self, message, **kwargs):
+        time.sleep(self.latency)
+        yield f"{self.recipient} is working on it"
+        return f"{self.recipient} reviewed: {message}"
+
+    def cancel_run(self):
+        pass
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Project kickoff latency: consecutive SendMessage calls vs one FanOutMessage"
+    )
+    parser.add_argument("--min-latency", type=float, default=0.2,
+                        help="Fastest simulated specialist reply, in seconds")
+    parser.add_argument("--max-latency", type=float, default=1.0,
+                        help="Slowest simulated specialist reply, in seconds")
+    parser.add_argument("--max-concurrency", type=int, default=DEFAULT_MAX_CONCURRENCY)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    agency, registry, _ = create_agency("full_mesh")
+    ceo = registry.get("CEO")
+
+    rng = random.Random(args.seed)
+    threads = agency.agents_and_threads["CEO"]
+    recipient_agents = [thread.recipient_agent for thread in threads.values()]
+    latencies = {}
+    for recipient in threads:
+        latencies[recipient] = round(rng.uniform(args.min_latency, args.max_latency), 3)
+        threads[recipient] = SimulatedThread(recipient, latencies[recipient])
+
+    message = "New project kickoff: review the requirements for your area."
+
+    start = time.perf_counter()
+    for thread in threads.values():
+        for _ in thread.get_completion(message):
+            pass
+    sequential = time.perf_counter() - start
+
+    fan_out_tool = create_fan_out_tool(ceo, recipient_agents, agency.agents_and_threads,
+                                       max_concurrency=args.max_concurrency)
+    tool = fan_out_tool(delegations=[{"recipient": name, "message": message} for name in threads])
+    tool._caller_agent = ceo
+    start = time.perf_counter()
+    replies = json.loads(tool.run())
+    concurrent = time.perf_counter() - start
+
+    report = {
+        "specialists": len(threads),
+        "max_concurrency": args.max_concurrency,
+        "latencies_s": latencies,
+        "slowest_specialist_s": max(latencies.values()),
+        "sum_of_latencies_s": round(sum(latencies.values()), 3),
+        "sequential_s": round(sequential, 3),
+        "fan_out_s": round(concurrent, 3),
+        "speedup": round(sequential / concurrent, 2),
+        "replies_in_request_order": [reply["recipient"] for reply in replies] == list(threads),
+    }
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+import argparse
+import json
+import random
+import time
+import tracemalloc
+
+from common.monte_carlo import DEFAULT_CHUNK_SIZE, DEFAULT_TRIALS, simulate_project
+from benchmarks.schedule_benchmark import random_portfolio
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Monte Carlo schedule and cost simulation: time and peak memory per project"
+    )
+    parser.add_argument("--tasks", type=int, nargs="+", default=[20, 50, 100, 200])
+    parser.add_argument("--trials", type=int, default=DEFAULT_TRIALS)
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    report = {"trials": args.trials, "chunk_size": args.chunk_size, "projects": {}}
+    for num_tasks in args.tasks:
+        tasks = random_portfolio(num_tasks, 3, random.Random(args.seed))
+        for task in tasks:
+            task["cost"] = task["duration"] * 400
+
+        tracemalloc.start()
+        start = time.perf_counter()
+        result = simulate_project(tasks, trials=args.trials, seed=args.seed,
+                                  chunk_size=args.chunk_size, daily_rate=600)
+        elapsed = time.perf_counter() - start
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        repeat = simulate_project(tasks, trials=args.trials, seed=args.seed,
+                                  chunk_size=args.chunk_size, daily_rate=600)
+        report["projects"][f"{num_tasks}_tasks"] = {
+            "seconds": round(elapsed, 3),
+            "trials_per_second": int(args.trials / elapsed),
+            "peak_memory_mb": round(peak / 2**20, 1),
+            "duration_days": result["duration_days"],
+            "cost": result["cost"],
+            "reproducible": repeat == result,
+        }
+
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+import argparse
+import json
+import random
+import time
+
+from common.performance import PerformanceRollup
+from common.task_store import TaskStore
+
+
+def record_history(store: TaskStore, num_tasks: int, num_projects: int, num_members: int,
+                   rework_probability: float, rng: random.Random):
+    """
+    Moves each task through in_progress and review to completed, sending a
+    share of them back from review for rework first.
+    """
+    for _ in range(num_tasks):
+        task = store.add_task(
+            project_id=f"PRJ-{rng.randrange(num_projects):03d}",
+            name="Task",
+            assignee=f"member-{rng.randrange(num_members)}",
+            details={"estimated_days": rng.choice([1, 2, 3, 5, 8])},
+        )
+        store.update_task(task["task_id"], status="in_progress")
+        store.update_task(task["task_id"], status="review")
+        while rng.random() < rework_probability:
+            store.update_task(task["task_id"], status="in_progress")
+            store.update_task(task["task_id"], status="review")
+        store.update_task(task["task_id"], status="completed")
+
+
+def review_latency(store: TaskStore, members, from_rollup: bool) -> float:
+    start = time.perf_counter()
+    for member in members:
+        if from_rollup:
+            store.performance_review(member)
+        else:
+            # Recomputing from the event log on every review
+            rollup = PerformanceRollup()
+            for event in store.events():
+                rollup.apply(event)
+            rollup.review(member)
+    return (time.perf_counter() - start) / len(members)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Performance reviews: per-member rollups against rescanning the task event log"
+    )
+    parser.add_argument("--tasks", type=int, default=20_000)
+    parser.add_argument("--projects", type=int, default=20)
+    parser.add_argument("--members", type=int, default=50)
+    parser.add_argument("--rework", type=float, default=0.2)
+    parser.add_argument("--reviews", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    store = TaskStore()
+    record_history(store, args.tasks, args.projects, args.members, args.rework, rng)
+    events = len(store.events())
+
+    start = time.perf_counter()
+    store.performance_review()
+    first_review = time.perf_counter() - start
+
+    members = [f"member-{rng.randrange(args.members)}" for _ in range(args.reviews)]
+    member_ms = review_latency(store, members, from_rollup=True) * 1000
+    team_ms = review_latency(store, [None] * args.reviews, from_rollup=True) * 1000
+    rescan_ms = review_latency(store, members[:3], from_rollup=False) * 1000
+
+    rebuilt = PerformanceRollup()
+    for event in store.events():
+        rebuilt.apply(event)
+    team = store.performance_review()
+
+    report = {
+        "tasks": args.tasks,
+        "events": events,
+        "first_review_ms": round(first_review * 1000, 1),
+        "review_ms": {
+            "member": round(member_ms, 4),
+            "team": round(team_ms, 4),
+            "rescan_per_review": round(rescan_ms, 1),
+        },
+        "matches_rescan": team == rebuilt.review(now=time.time()),
+    }
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
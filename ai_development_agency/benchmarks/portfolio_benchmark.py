@@ -0,0 +1,97 @@
+import argparse
+import json
+import os
+import random
+import time
+
+os.environ.setdefault("OPENAI_API_KEY", "sk-offline-benchmark")
+
+from ceo.tools.PortfolioAnalyzer import ANALYSIS_TYPES, PortfolioAnalyzer, _project_metrics
+from ceo.tools.ProjectAnalyzer import ProjectAnalyzer
+from common.tool_cache import tool_cache
+from common.tool_output import use_output_format
+from benchmarks.schedule_benchmark import random_portfolio
+
+TECH_STACKS = [
+    {"frontend": ["React"], "backend": ["Python", "FastAPI"], "database": ["PostgreSQL"]},
+    {"frontend": ["Vue"], "backend": ["Node.js"], "database": ["MongoDB"]},
+    {"frontend": ["React"], "backend": ["Go"], "database": ["PostgreSQL"], "ai_ml": ["PyTorch"]},
+]
+
+
+def random_projects(count: int, num_tasks: int, trials: int, rng: random.Random):
+    projects = []
+    for i in range(count):
+        tasks = random_portfolio(num_tasks, 3, rng)
+        projects.append({
+            "name": f"project-{i}",
+            "tech_stack": rng.choice(TECH_STACKS),
+            "timeline": {"duration": f"{rng.randint(2, 8)} months"},
+            "budget": {"total": rng.randint(50, 400) * 1000, "daily_rate": 800},
+            "tasks": tasks,
+            "simulation": {"trials": trials},
+        })
+    return projects
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Portfolio analysis: one ProjectAnalyzer call per project and analysis vs one batch call"
+    )
+    parser.add_argument("--projects", type=int, default=40)
+    parser.add_argument("--tasks", type=int, default=50)
+    parser.add_argument("--trials", type=int, default=20_000)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    projects = random_projects(args.projects, args.tasks, args.trials, random.Random(args.seed))
+
+    tool_cache.clear()
+    start = time.perf_counter()
+    separate = []
+    separate_chars = 0
+    with use_output_format("compact"):
+        for project in projects:
+            analyzers = {
+                analysis_type: ProjectAnalyzer(project_requirements=project, analysis_type=analysis_type)
+                for analysis_type in ANALYSIS_TYPES
+            }
+            reports = {analysis_type: json.loads(analyzer.run()) for analysis_type, analyzer in analyzers.items()}
+            separate_chars += len(json.dumps(reports, indent=2))
+            simulation = analyzers["risk_assessment"]._run_simulation()
+            separate.append({"project": project["name"], **_project_metrics(reports, simulation)})
+    separate_seconds = time.perf_counter() - start
+
+    tool_cache.clear()
+    start = time.perf_counter()
+    with use_output_format("compact"):
+        batch = json.loads(PortfolioAnalyzer(projects=projects).run())
+    batch_seconds = time.perf_counter() - start
+
+    summary = batch["summary"]
+    batch_rows = {
+        name: {column: values[i] for column, values in summary.items() if column != "rank"}
+        for i, name in enumerate(summary["project"])
+    }
+    report = {
+        "projects": args.projects,
+        "tasks_per_project": args.tasks,
+        "trials": args.trials,
+        "cpus": os.cpu_count(),
+        "separate_calls_seconds": round(separate_seconds, 3),
+        "batch_seconds": round(batch_seconds, 3),
+        "speedup": round(separate_seconds / batch_seconds, 2),
+        "separate_output_chars": separate_chars,
+        "batch_output_chars": len(json.dumps(summary, separators=(",", ":"))),
+        "matches_separate_calls": all(
+            {k: v for k, v in row.items() if v is not None}
+            == {k: v for k, v in batch_rows[row["project"]].items() if v is not None}
+            for row in separate
+        ),
+        "top_3": summary["project"][:3],
+    }
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+import argparse
+import json
+import os
+import random
+import tempfile
+import time
+
+from common.progress import ProgressRollup
+from common.task_store import TASK_STATUSES, TaskStore
+
+
+def record_history(store: TaskStore, num_events: int, num_projects: int, num_members: int, rng: random.Random):
+    """
+    Creates tasks and moves them through statuses and assignees until the
+    event log holds num_events events; about one event in five creates a task.
+    """
+    tasks = []
+    state = {}
+    for _ in range(num_events):
+        if not tasks or rng.random() < 0.2:
+            project = rng.randrange(num_projects)
+            task = store.add_task(
+                project_id=f"PRJ-{project:03d}",
+                name="Task",
+                assignee=f"member-{rng.randrange(num_members)}",
+                details={"milestone": f"M{rng.randrange(5)}"},
+            )
+            tasks.append(task["task_id"])
+            state[task["task_id"]] = (task["assignee"], task["status"])
+            continue
+        # Every update changes something, so each one logs exactly one event
+        task_id = rng.choice(tasks)
+        assignee, status = state[task_id]
+        if rng.random() < 0.9:
+            status = rng.choice([s for s in TASK_STATUSES if s != status])
+            store.update_task(task_id, status=status)
+        else:
+            assignee = rng.choice([f"member-{m}" for m in range(num_members) if f"member-{m}" != assignee])
+            store.update_task(task_id, assignee=assignee)
+        state[task_id] = (assignee, status)
+
+
+def report_latency(store: TaskStore, projects, rollup_reports: bool) -> float:
+    start = time.perf_counter()
+    for project_id in projects:
+        if rollup_reports:
+            progress = store.progress()
+            progress.project_progress(project_id)
+            progress.member_progress(project_id)
+            progress.milestone_progress(project_id)
+        else:
+            # Recomputing from the event log on every report
+            rollup = ProgressRollup()
+            for event in store.events():
+                rollup.apply(event)
+            rollup.project_progress(project_id)
+    return (time.perf_counter() - start) / len(projects)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Progress rollups: report latency and restart time over a large event log"
+    )
+    parser.add_argument("--events", type=int, default=100_000)
+    parser.add_argument("--projects", type=int, default=100)
+    parser.add_argument("--members", type=int, default=50)
+    parser.add_argument("--reports", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "tasks.db")
+        store = TaskStore(path)
+        start = time.perf_counter()
+        record_history(store, args.events, args.projects, args.members, rng)
+        record_seconds = time.perf_counter() - start
+        events = len(store.events())
+
+        projects = [f"PRJ-{rng.randrange(args.projects):03d}" for _ in range(args.reports)]
+        store.progress()
+        rollup_ms = report_latency(store, projects, rollup_reports=True) * 1000
+        replay_ms = report_latency(store, projects[:3], rollup_reports=False) * 1000
+        matches = all(
+            store.progress().projects.get(f"PRJ-{p:03d}", {}) == store.count_by_status(project_id=f"PRJ-{p:03d}")
+            for p in range(args.projects)
+        )
+        store.save_snapshot()
+        # Events after the snapshot, replayed on restart
+        for _ in range(1000):
+            store.update_task(f"TASK-{rng.randint(1, 1000)}", status=rng.choice(TASK_STATUSES))
+        store.close()
+
+        start = time.perf_counter()
+        restarted = TaskStore(path)
+        restarted.progress()
+        snapshot_restart = time.perf_counter() - start
+        restarted._connection.execute("DELETE FROM progress_snapshots")
+        restarted._connection.commit()
+        restarted.close()
+
+        start = time.perf_counter()
+        restarted = TaskStore(path)
+        restarted.progress()
+        full_restart = time.perf_counter() - start
+        restarted.close()
+
+    report = {
+        "events": events,
+        "events_per_second_recorded": int(events / record_seconds),
+        "report_ms": {
+            "rollup": round(rollup_ms, 4),
+            "replay_per_report": round(replay_ms, 1),
+        },
+        "restart_ms": {
+            "from_snapshot": round(snapshot_restart * 1000, 1),
+            "full_replay": round(full_restart * 1000, 1),
+        },
+        "matches_task_table": matches,
+    }
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
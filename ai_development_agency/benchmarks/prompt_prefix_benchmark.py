@@ -0,0 +1,31 @@
+import argparse
+import json
+import os
+
+os.environ.setdefault("OPENAI_API_KEY", "sk-offline-benchmark")  # nothing is sent
+
+from agency import AGENCY_DIR, create_agency
+from common.prompt_assembly import PromptAssembler
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Report shared-prefix layout and cached tokens per turn for every agent"
+    )
+    parser.add_argument("--max-prompt-tokens", type=int, default=25000)
+    parser.add_argument("--model", default="gpt-4o")
+    args = parser.parse_args()
+
+    assembler = PromptAssembler.from_file(os.path.join(AGENCY_DIR, "agency_manifesto.md"))
+    _, registry, _ = create_agency()
+    # Agent-only instructions, read without syncing any assistant
+    agent_instructions = {
+        agent.name: agent.load_class()().instructions for agent in registry.agents
+    }
+
+    report = assembler.report(agent_instructions, args.max_prompt_tokens, args.model)
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
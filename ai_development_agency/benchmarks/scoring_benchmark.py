@@ -0,0 +1,95 @@
+import argparse
+import json
+import random
+import time
+
+from common.scoring import WeightedScoring, normalize_weights
+
+
+def random_candidates(num_candidates: int, num_criteria: int, rng: random.Random):
+    criteria = [f"criterion-{k}" for k in range(num_criteria)]
+    candidates = {
+        f"candidate-{i}": {criterion: round(rng.uniform(1, 10), 1) for criterion in criteria}
+        for i in range(num_candidates)
+    }
+    return candidates, criteria
+
+
+def python_sensitivity(candidates, weights):
+    """
+    The same closed-form weight flips, computed candidate by candidate in Python.
+    """
+    criteria = list(weights)
+    low = {c: min(scores[c] for scores in candidates.values()) for c in criteria}
+    high = {c: max(scores[c] for scores in candidates.values()) for c in criteria}
+    normalized = {
+        name: {c: (scores[c] - low[c]) / (high[c] - low[c]) if high[c] > low[c] else 1.0 for c in criteria}
+        for name, scores in candidates.items()
+    }
+    scores = {name: sum(weights[c] * row[c] for c in criteria) for name, row in normalized.items()}
+    winner = max(scores, key=scores.get)
+    flips = {}
+    for c in criteria:
+        up, down = None, None
+        for name, row in normalized.items():
+            if name == winner:
+                continue
+            diff = row[c] - normalized[winner][c]
+            if diff == 0:
+                continue
+            delta = (scores[winner] - scores[name]) / diff
+            if diff > 0 and (up is None or delta < up[0]):
+                up = (delta, name)
+            elif diff < 0 and delta > -weights[c] and (down is None or delta > down[0]):
+                down = (delta, name)
+        flips[c] = (up[1] if up else None, down[1] if down else None)
+    return winner, flips
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Weighted scoring: ranking and weight sensitivity for many candidates"
+    )
+    parser.add_argument("--candidates", type=int, default=5000)
+    parser.add_argument("--criteria", type=int, default=12)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    candidates, criteria = random_candidates(args.candidates, args.criteria, rng)
+    weights = normalize_weights({criterion: rng.uniform(0.5, 3) for criterion in criteria})
+
+    start = time.perf_counter()
+    scoring = WeightedScoring(candidates, weights)
+    build_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    sensitivity = scoring.sensitivity()
+    vectorized_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    winner, flips = python_sensitivity(candidates, weights)
+    python_seconds = time.perf_counter() - start
+
+    matches = winner == scoring.winner and all(
+        flips[row["criterion"]] == (row["winner_above"], row["winner_below"]) for row in sensitivity
+    )
+    report = {
+        "candidates": args.candidates,
+        "criteria": args.criteria,
+        "build_and_rank_ms": round(build_seconds * 1000, 2),
+        "sensitivity_ms": {
+            "vectorized": round(vectorized_seconds * 1000, 2),
+            "python": round(python_seconds * 1000, 2),
+        },
+        "winner": scoring.winner,
+        "criteria_that_can_flip_winner": sum(
+            1 for row in sensitivity if row["winner_above"] is not None or row["winner_below"] is not None
+        ),
+        "matches_python": matches,
+    }
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+AGENCY_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Runs in a fresh interpreter so import costs are measured, not cached.
+# Without --live the remote assistant sync is replaced by a fixed delay so the
+# benchmark runs offline and is repeatable.
+STARTUP_SCRIPT = """
+import json, os, sys, time
+start = time.perf_counter()
+sync_calls = []
+import common.agent_registry as agent_registry
+if not {live}:
+    def simulated_sync(agent):
+        sync_calls.append(agent.name)
+        time.sleep({sync_latency})
+        agent.id = "asst_offline_" + agent.name
+        return agent
+    agent_registry.sync_assistant = simulated_sync
+import agency
+agency_ready = time.perf_counter()
+agency.ceo.id  # first message routed to the CEO
+first_message_ready = time.perf_counter()
+print(json.dumps({{
+    "agency_construction_s": agency_ready - start,
+    "cold_start_to_first_ceo_message_s": first_message_ready - start,
+    "materialized_agents": agency.registry.materialized_names(),
+    "assistant_syncs": len(sync_calls),
+}}))
+"""
+
+
+def run_startup(eager: bool, live: bool, sync_latency: float) -> dict:
+    env = dict(os.environ)
+    env["AGENCY_EAGER_AGENTS"] = "true" if eager else "false"
+    if not live:
+        env.setdefault("OPENAI_API_KEY", "sk-offline-benchmark")
+    script = STARTUP_SCRIPT.format(live=live, sync_latency=sync_latency)
+    result = subprocess.run(
+        [sys.executable, "-c", script],
+        cwd=AGENCY_DIR,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Compare cold start of the eager and lazy agent registries"
+    )
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--sync-latency", type=float, default=0.35,
+                        help="Simulated seconds per assistant sync when not --live")
+    parser.add_argument("--live", action="store_true",
+                        help="Sync against the real OpenAI API instead of simulating it")
+    args = parser.parse_args()
+
+    report = {}
+    for mode, eager in (("eager", True), ("lazy", False)):
+        runs = [run_startup(eager, args.live, args.sync_latency) for _ in range(args.runs)]
+        report[mode] = {
+            "median_cold_start_s": sorted(
+                r["cold_start_to_first_ceo_message_s"] for r in runs
+            )[len(runs) // 2],
+            "materialized_agents": runs[-1]["materialized_agents"],
+            "assistant_syncs": runs[-1]["assistant_syncs"],
+        }
+    report["speedup"] = round(
+        report["eager"]["median_cold_start_s"] / report["lazy"]["median_cold_start_s"], 2
+    )
+
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+import argparse
+import json
+import os
+import random
+import tempfile
+import time
+
+from common.task_store import TASK_STATUSES, TaskStore
+
+
+def fill_store(store: TaskStore, num_tasks: int, num_projects: int, num_members: int, rng: random.Random):
+    """
+    Adds num_tasks tasks spread over projects and members, each depending on
+    up to two earlier tasks of the same project.
+    """
+    by_project = {}
+    for _ in range(num_tasks):
+        project_id = f"PRJ-{rng.randrange(num_projects):03d}"
+        earlier = by_project.setdefault(project_id, [])
+        task = store.add_task(
+            project_id=project_id,
+            name=f"Task {len(earlier)}",
+            assignee=f"member-{rng.randrange(num_members)}",
+            status=rng.choice(TASK_STATUSES),
+            depends_on=rng.sample(earlier[-20:], min(len(earlier[-20:]), rng.randint(0, 2))),
+        )
+        earlier.append(task["task_id"])
+
+
+def time_queries(store: TaskStore, queries, indexed: bool) -> float:
+    # NOT INDEXED makes SQLite scan the table, as a store without indexes would
+    table = "tasks" if indexed else "tasks NOT INDEXED"
+    start = time.perf_counter()
+    for column, value in queries:
+        store._connection.execute(
+            f"SELECT status, COUNT(*) FROM {table} WHERE {column} = ? GROUP BY status", (value,)
+        ).fetchall()
+    return (time.perf_counter() - start) / len(queries)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Task store: indexed progress queries vs full scans"
+    )
+    parser.add_argument("--tasks", type=int, default=50_000)
+    parser.add_argument("--projects", type=int, default=200)
+    parser.add_argument("--members", type=int, default=100)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    with tempfile.TemporaryDirectory() as directory:
+        store = TaskStore(os.path.join(directory, "tasks.db"))
+        start = time.perf_counter()
+        fill_store(store, args.tasks, args.projects, args.members, rng)
+        insert_seconds = time.perf_counter() - start
+
+        queries = [
+            rng.choice([
+                ("project_id", f"PRJ-{rng.randrange(args.projects):03d}"),
+                ("assignee", f"member-{rng.randrange(args.members)}"),
+                ("status", rng.choice(TASK_STATUSES)),
+            ])
+            for _ in range(args.queries)
+        ]
+        indexed = time_queries(store, queries, indexed=True)
+        scan = time_queries(store, queries, indexed=False)
+
+        project_id = "PRJ-000"
+        start = time.perf_counter()
+        tasks = store.query(project_id=project_id, status="blocked")
+        filtered_query = time.perf_counter() - start
+
+        report = {
+            "tasks": args.tasks,
+            "inserts_per_second": int(args.tasks / insert_seconds),
+            "progress_count_ms": {
+                "indexed": round(indexed * 1000, 3),
+                "full_scan": round(scan * 1000, 3),
+                "speedup": round(scan / indexed, 1),
+            },
+            "blocked_tasks_query": {
+                "results": len(tasks),
+                "ms": round(filtered_query * 1000, 3),
+            },
+            "last_task_id": store.query(project_id=project_id)[-1]["task_id"],
+        }
+        store.close()
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,39 @@
+import glob
+import importlib
+import os
+import re
+
+AGENCY_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def load_tool_classes() -> dict:
+    """
+    Imports every tool in */tools/*.py, keyed by class name.
+    """
+    tools = {}
+    for path in sorted(glob.glob(os.path.join(AGENCY_DIR, "*", "tools", "*.py"))):
+        agent_folder = os.path.basename(os.path.dirname(os.path.dirname(path)))
+        name = os.path.splitext(os.path.basename(path))[0]
+        module = importlib.import_module(f"{agent_folder}.tools.{name}")
+        tools[name] = getattr(module, name)
+    return tools
+
+
+def sample_tool_calls(tool_class) -> list:
+    """
+    Builds one instance of the tool per option of its selector field (the
+    required str field, e.g. analysis_type), with an empty config dict.
+    """
+    calls = []
+    config_fields = {}
+    selector = None
+    for field_name, field in tool_class.model_fields.items():
+        if not field.is_required():
+            continue
+        if field.annotation is str:
+            selector = (field_name, re.findall(r"'([a-z_]+)'", field.description or ""))
+        else:
+            config_fields[field_name] = {}
+    for option in selector[1] if selector else []:
+        calls.append(tool_class(**config_fields, **{selector[0]: option}))
+    return calls
@@ -0,0 +1,50 @@
+import argparse
+import json
+
+from common.tokens import count_tokens
+from common.tool_output import OUTPUT_FORMATS, use_output_format
+from benchmarks.tool_calls import load_tool_classes, sample_tool_calls
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Tokens and bytes per tool call for each tool output format"
+    )
+    parser.add_argument("--per-tool", action="store_true", help="Include the per-tool breakdown")
+    args = parser.parse_args()
+
+    totals = {output_format: {"bytes": 0, "tokens": 0} for output_format in OUTPUT_FORMATS}
+    per_tool = {}
+    calls = 0
+    for name, tool_class in load_tool_classes().items():
+        tool_calls = sample_tool_calls(tool_class)
+        calls += len(tool_calls)
+        per_tool[name] = {}
+        for output_format in OUTPUT_FORMATS:
+            with use_output_format(output_format):
+                outputs = [tool.run() for tool in tool_calls]
+            size = sum(len(output.encode("utf-8")) for output in outputs)
+            tokens = sum(count_tokens(output) for output in outputs)
+            totals[output_format]["bytes"] += size
+            totals[output_format]["tokens"] += tokens
+            per_tool[name][output_format] = {"bytes": size, "tokens": tokens}
+
+    baseline = totals["pretty"]["tokens"]
+    report = {
+        "tool_calls": calls,
+        "per_call": {
+            output_format: {
+                "bytes": round(total["bytes"] / calls, 1),
+                "tokens": round(total["tokens"] / calls, 1),
+                "token_savings_vs_pretty": round(1 - total["tokens"] / baseline, 3),
+            }
+            for output_format, total in totals.items()
+        },
+    }
+    if args.per_tool:
+        report["per_tool"] = per_tool
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+import argparse
+import json
+import os
+
+os.environ.setdefault("OPENAI_API_KEY", "sk-offline-benchmark")  # nothing is sent
+
+from agency import TOPOLOGIES, create_agency
+from common.tokens import count_schema_tokens, count_tokens
+
+
+def tool_schemas(tools) -> list:
+    return [{"type": "function", "function": tool.openai_schema} for tool in tools]
+
+
+def measure_topology(topology_name: str, agent_profiles: dict) -> dict:
+    """
+    Builds the agency in the given topology (without syncing any assistant) and
+    reports the tool schema size and prompt tokens each agent sends per request.
+    """
+    agency, registry, topology = create_agency(topology_name)
+    agents = {}
+    for agent in registry.agents:
+        profile = agent_profiles.get(agent.name)
+        if profile is None:
+            real_agent = agent.load_class()()
+            profile = agent_profiles[agent.name] = {
+                "tool_schemas": tool_schemas(real_agent.tools),
+                "instructions": real_agent.instructions,
+            }
+        # Until it is materialized, a lazy agent's tools are exactly the ones the
+        # Agency added for its communication flows
+        communication_schemas = tool_schemas(agent.tools)
+        schemas = profile["tool_schemas"] + communication_schemas
+        schema_tokens = count_schema_tokens(schemas)
+        instructions = agency.shared_instructions + "\n\n" + profile["instructions"]
+        agents[agent.name] = {
+            "recipients": len(topology.recipients_of(agent.name)),
+            "schema_bytes": len(json.dumps(schemas, separators=(",", ":"))),
+            "communication_schema_tokens": count_schema_tokens(communication_schemas),
+            "schema_tokens": schema_tokens,
+            "prompt_tokens": schema_tokens + count_tokens(instructions),
+        }
+
+    unreachable = set(agents) - {"CEO"} - set(topology.reachable_from("CEO"))
+    return {
+        "edges": topology.num_edges,
+        "unreachable_from_ceo": sorted(unreachable),
+        "total_schema_bytes": sum(a["schema_bytes"] for a in agents.values()),
+        "total_prompt_tokens": sum(a["prompt_tokens"] for a in agents.values()),
+        "agents": agents,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Report tool schema size and prompt tokens per agent for each topology"
+    )
+    parser.add_argument("--topology", choices=TOPOLOGIES, action="append",
+                        help="Topology to measure (repeatable), defaults to all")
+    parser.add_argument("--summary", action="store_true", help="Omit the per-agent breakdown")
+    args = parser.parse_args()
+
+    agent_profiles = {}
+    report = {}
+    for topology_name in args.topology or TOPOLOGIES:
+        report[topology_name] = measure_topology(topology_name, agent_profiles)
+        if args.summary:
+            report[topology_name].pop("agents")
+
+    routable = [name for name, result in report.items() if not result["unreachable_from_ceo"]]
+    if routable:
+        report["cheapest_routable_topology"] = min(
+            routable, key=lambda name: report[name]["total_prompt_tokens"]
+        )
+
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
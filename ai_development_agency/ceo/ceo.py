@@ -1,5 +1,6 @@
 from agency_swarm import Agent
 from .tools.ProjectAnalyzer import ProjectAnalyzer
+from .tools.PortfolioAnalyzer import PortfolioAnalyzer
 from .tools.TeamCoordinator import TeamCoordinator
 
 class CEO(Agent):
@@ -17,7 +18,7 @@ class CEO(Agent):
                 "Development Agency."
             ),
             instructions="./instructions.md",
-            tools=[ProjectAnalyzer, TeamCoordinator],
+            tools=[ProjectAnalyzer, PortfolioAnalyzer, TeamCoordinator],
             tools_folder="./tools",
             temperature=0.5,
             max_prompt_tokens=25000,
@@ -0,0 +1,192 @@
+from pydantic import Field
+from typing import Dict, List, Optional
+import json
+if __name__ == "__main__" and not __package__:
+    # Run as a script: the shared modules live in the agency root
+    import sys
+    from pathlib import Path
+    sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from common.async_tool import AsyncTool
+from common.cloud_costs import cost_model_version
+from common.portfolio import columnar_summary, run_portfolio
+from common.tool_output import use_output_format
+from common.tool_stream import build_report
+from common.tool_cache import cached_run, tool_code_version
+from ceo.tools.ProjectAnalyzer import ProjectAnalyzer
+
+ANALYSIS_TYPES = ["feasibility", "resource_planning", "risk_assessment"]
+
+# Summary columns, and the order projects are ranked in (column, descending).
+# Projects whose feasibility rests on ProjectAnalyzer's default scores rank
+# after those scored from a simulation.
+SUMMARY_COLUMNS = [
+    "project", "ranked_on_defaults", "feasibility_score", "on_time_probability", "on_budget_probability",
+    "duration_days", "p80_duration_days", "estimated_cost", "p80_cost"
+]
+RANK_BY = [
+    ("ranked_on_defaults", False), ("feasibility_score", True), ("on_time_probability", True), ("p80_cost", False)
+]
+
+
+class PortfolioAnalyzer(AsyncTool):
+    """
+    A tool for analyzing a batch of prospective projects at once and ranking them.
+    This tool helps the CEO triage the intake queue without one ProjectAnalyzer call per project.
+    """
+
+    projects: List[Dict] = Field(
+        ...,
+        description=(
+            "Projects to analyze, each a project_requirements dictionary as taken by ProjectAnalyzer "
+            "(tech_stack, timeline, budget, optional tasks) plus a unique 'name'"
+        )
+    )
+
+    analysis_types: List[str] = Field(
+        default_factory=lambda: list(ANALYSIS_TYPES),
+        description="Analyses to run for every project: 'feasibility', 'resource_planning' and/or 'risk_assessment'"
+    )
+
+    include_reports: bool = Field(
+        False,
+        description="Whether to include every project's full reports next to the ranked summary"
+    )
+
+    @cached_run
+    def run(self) -> str:
+        """
+        Analyzes all projects in a process pool and returns a ranked, columnar summary.
+        """
+        invalid = [t for t in self.analysis_types if t not in ANALYSIS_TYPES]
+        if invalid or not self.analysis_types:
+            return f"Invalid analysis types specified: {invalid}"
+
+        names = [project.get("name") or f"project-{i + 1}" for i, project in enumerate(self.projects)]
+        duplicates = sorted({name for name in names if names.count(name) > 1})
+        if duplicates:
+            return f"Duplicate project names: {duplicates}"
+
+        jobs = [
+            {"name": name, "requirements": project, "analysis_types": self.analysis_types,
+             "include_reports": self.include_reports}
+            for name, project in zip(names, self.projects)
+        ]
+        results = run_portfolio(_analyze_project, jobs, shared={"tech_profiles": self._profile_tech_stacks()})
+
+        rows = [result["row"] for result in results if "row" in result]
+        portfolio = {
+            "projects": len(self.projects),
+            "ranked_by": [column for column, _ in RANK_BY],
+            "summary": columnar_summary(rows, SUMMARY_COLUMNS, RANK_BY)
+        }
+        errors = {result["project"]: result["error"] for result in results if "error" in result}
+        if errors:
+            portfolio["errors"] = errors
+        if self.include_reports:
+            portfolio["reports"] = {result["row"]["project"]: result["reports"] for result in results if "row" in result}
+
+        return build_report(portfolio)
+
+    def cache_dependencies(self) -> List[str]:
+        # Every project runs through ProjectAnalyzer, which projects costs from the price sheet
+        return [tool_code_version(ProjectAnalyzer), cost_model_version()]
+
+    def _profile_tech_stacks(self) -> Dict[str, Dict]:
+        # Projects often share a stack; profile each distinct one once for the whole batch
+        profiler = ProjectAnalyzer(project_requirements={}, analysis_type=ANALYSIS_TYPES[0])
+        profiles = {}
+        for project in self.projects:
+            tech_stack = project.get("tech_stack", {})
+            key = ProjectAnalyzer.tech_stack_key(tech_stack)
+            if key not in profiles:
+                profiles[key] = profiler.profile_tech_stack(tech_stack)
+        return profiles
+
+
+def _analyze_project(job: Dict, shared: Dict) -> Dict:
+    """
+    Runs the requested analyses for one project in a worker process. A single
+    analyzer serves all of them, so its schedule and simulation are computed once.
+    """
+    reports = {}
+    try:
+        analyzer = ProjectAnalyzer(project_requirements=job["requirements"], analysis_type=job["analysis_types"][0])
+        analyzer._tech_profiles = shared.get("tech_profiles")
+        with use_output_format("compact"):
+            for analysis_type in job["analysis_types"]:
+                analyzer.analysis_type = analysis_type
+                reports[analysis_type] = json.loads(analyzer.run())
+        row = {"project": job["name"], **_project_metrics(reports, analyzer._run_simulation())}
+    except Exception as e:
+        return {"project": job["name"], "error": str(e)}
+
+    return {"row": row, "reports": reports if job["include_reports"] else None}
+
+
+def _project_metrics(reports: Dict[str, Dict], simulation: Optional[Dict]) -> Dict[str, Optional[float]]:
+    """
+    The summary row of one project. estimated_cost is the mean simulated cost.
+    ranked_on_defaults is set when the project has no simulated on-time or
+    on-budget probability (no tasks, no timeline duration, or no task costs),
+    so its feasibility score uses the analyzer's constant defaults.
+    """
+    simulation = simulation or {}
+    metrics = {
+        "ranked_on_defaults": "on_time_probability" not in simulation or "on_budget_probability" not in simulation
+    }
+    if "feasibility" in reports:
+        metrics["feasibility_score"] = round(reports["feasibility"]["feasibility_score"], 4)
+    if "resource_planning" in reports:
+        metrics["duration_days"] = reports["resource_planning"]["timeline"].get("project_duration_days")
+    if simulation:
+        metrics["p80_duration_days"] = simulation["duration_days"]["p80"]
+        metrics["on_time_probability"] = simulation.get("on_time_probability")
+        if "cost" in simulation:
+            metrics["estimated_cost"] = simulation["cost"]["mean"]
+            metrics["p80_cost"] = simulation["cost"]["p80"]
+            metrics["on_budget_probability"] = simulation.get("on_budget_probability")
+    return metrics
+
+
+if __name__ == "__main__":
+    # Test the PortfolioAnalyzer tool
+    tech_stack = {
+        "frontend": ["React", "TypeScript"],
+        "backend": ["Python", "FastAPI"],
+        "database": ["PostgreSQL"]
+    }
+    test_projects = [
+        {
+            "name": "Customer Portal",
+            "tech_stack": tech_stack,
+            "timeline": {"duration": "3 months"},
+            "budget": {"total": 60000, "daily_rate": 800},
+            "tasks": [
+                {"id": "Design", "duration": "2 weeks"},
+                {"id": "Build", "duration": "6 weeks", "depends_on": ["Design"]},
+                {"id": "Launch", "duration": "1 week", "depends_on": ["Build"]}
+            ]
+        },
+        {
+            "name": "Recommendation Engine",
+            "tech_stack": {**tech_stack, "ai_ml": ["PyTorch"]},
+            "timeline": {"duration": "2 months"},
+            "budget": {"total": 50000, "daily_rate": 1000},
+            "tasks": [
+                {"id": "Data pipeline", "duration": "3 weeks"},
+                {"id": "Model training", "duration": "5 weeks", "depends_on": ["Data pipeline"]},
+                {"id": "Serving", "duration": "2 weeks", "depends_on": ["Model training"]}
+            ]
+        },
+        {
+            "name": "Internal Dashboard",
+            "tech_stack": tech_stack,
+            "timeline": {"duration": "6 weeks"},
+            "budget": {"total": 20000}
+        }
+    ]
+
+    analyzer = PortfolioAnalyzer(projects=test_projects)
+
+    print("Testing PortfolioAnalyzer tool:")
+    print(analyzer.run())
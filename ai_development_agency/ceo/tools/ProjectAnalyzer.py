@@ -1,9 +1,20 @@
-from agency_swarm.tools import BaseTool
 from pydantic import Field
-from typing import Dict, List
+from typing import Dict, List, Optional
 import json
+import math
+if __name__ == "__main__" and not __package__:
+    # Run as a script: the shared modules live in the agency root
+    import sys
+    from pathlib import Path
+    sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from common.async_tool import AsyncTool
+from common.cloud_costs import cost_model_version, get_cost_model, unknown_parameters
+from common.monte_carlo import DEFAULT_SEED, DEFAULT_TRIALS, simulate_project
+from common.scheduling import DURATION_UNITS, TaskGraph, parse_duration
+from common.tool_stream import build_report
+from common.tool_cache import cached_run
 
-class ProjectAnalyzer(BaseTool):
+class ProjectAnalyzer(AsyncTool):
     """
     A tool for analyzing project requirements, assessing feasibility, and generating project plans.
     This tool helps the CEO evaluate new projects and create comprehensive project strategies.
@@ -11,7 +22,13 @@ class ProjectAnalyzer(BaseTool):
     
     project_requirements: Dict = Field(
         ...,
-        description="Dictionary containing project requirements including technical specs, timeline, and budget"
+        description=(
+            "Dictionary containing project requirements including technical specs, timeline, and budget. "
+            "Optional 'tasks': list of {id, duration (days or e.g. '2 weeks'), depends_on: [task ids], phase, "
+            "duration_range: [optimistic, pessimistic], cost, cost_range: [low, high], daily_rate}. Optional "
+            "'infrastructure': cloud workload {rps, response_kb, storage_gb, database_gb, growth_per_month, "
+            "...; provider} priced over the timeline's duration"
+        )
     )
     
     analysis_type: str = Field(
@@ -19,6 +36,14 @@ class ProjectAnalyzer(BaseTool):
         description="Type of analysis to perform: 'feasibility', 'resource_planning', or 'risk_assessment'"
     )
 
+    # Computed once per call and shared by the sections that need them
+    _schedule: Optional[TaskGraph] = None
+    _simulation: Optional[Dict] = None
+    _projection: Optional[Dict] = None
+    # Tech stack profiles precomputed for a batch of projects, keyed by tech_stack_key()
+    _tech_profiles: Optional[Dict[str, Dict]] = None
+
+    @cached_run
     def run(self) -> str:
         """
         Analyzes project requirements and returns a detailed assessment based on the specified analysis type.
@@ -32,6 +57,10 @@ class ProjectAnalyzer(BaseTool):
         else:
             return "Invalid analysis type specified"
 
+    def cache_dependencies(self) -> List[str]:
+        # Infrastructure costs are projected from the price sheet
+        return [cost_model_version()]
+
     def _analyze_feasibility(self) -> str:
         # Analyze technical feasibility
         tech_stack = self.project_requirements.get("tech_stack", {})
@@ -42,43 +71,62 @@ class ProjectAnalyzer(BaseTool):
         
         analysis_result = {
             "feasibility_score": feasibility_score,
-            "technical_assessment": self._assess_technical_requirements(tech_stack),
-            "timeline_assessment": self._assess_timeline(timeline),
-            "budget_assessment": self._assess_budget(budget),
-            "recommendations": self._generate_recommendations()
+            "technical_assessment": lambda: self._assess_technical_requirements(tech_stack),
+            "timeline_assessment": lambda: self._assess_timeline(timeline),
+            "budget_assessment": lambda: self._assess_budget(budget),
+            "recommendations": self._generate_recommendations
         }
         
-        return json.dumps(analysis_result, indent=2)
+        return build_report(analysis_result)
 
     def _analyze_resources(self) -> str:
         resources = {
-            "development_team": self._calculate_team_requirements(),
-            "infrastructure": self._calculate_infrastructure_needs(),
-            "timeline": self._generate_timeline(),
-            "cost_estimation": self._estimate_costs()
+            "development_team": self._calculate_team_requirements,
+            "infrastructure": self._calculate_infrastructure_needs,
+            "timeline": self._generate_timeline,
+            "cost_estimation": self._estimate_costs
         }
+        if self.project_requirements.get("infrastructure"):
+            resources["infrastructure_projection"] = self._project_infrastructure_costs
         
-        return json.dumps(resources, indent=2)
+        return build_report(resources)
 
     def _analyze_risks(self) -> str:
         risks = {
-            "technical_risks": self._identify_technical_risks(),
-            "timeline_risks": self._identify_timeline_risks(),
-            "budget_risks": self._identify_budget_risks(),
-            "mitigation_strategies": self._generate_risk_mitigation_strategies()
+            "technical_risks": self._identify_technical_risks,
+            "timeline_risks": self._identify_timeline_risks,
+            "budget_risks": self._identify_budget_risks,
+            "mitigation_strategies": self._generate_risk_mitigation_strategies
         }
+        if self.project_requirements.get("tasks"):
+            risks["simulation"] = self._run_simulation
         
-        return json.dumps(risks, indent=2)
+        return build_report(risks)
 
     def _calculate_feasibility_score(self, tech_stack: Dict, timeline: Dict, budget: Dict) -> float:
         # Implement scoring logic based on project parameters
-        technical_score = self._evaluate_technical_complexity(tech_stack)
+        technical_score = self.profile_tech_stack(tech_stack)["complexity_level"]
         timeline_score = self._evaluate_timeline_feasibility(timeline)
         budget_score = self._evaluate_budget_feasibility(budget)
         
         return (technical_score + timeline_score + budget_score) / 3
 
     def _assess_technical_requirements(self, tech_stack: Dict) -> Dict:
+        return self.profile_tech_stack(tech_stack)
+
+    @staticmethod
+    def tech_stack_key(tech_stack: Dict) -> str:
+        return json.dumps(tech_stack, sort_keys=True)
+
+    def profile_tech_stack(self, tech_stack: Dict) -> Dict:
+        """
+        Complexity, required expertise and likely challenges of a tech stack,
+        taken from the precomputed profiles when analyzing a batch of projects.
+        """
+        if self._tech_profiles is not None:
+            profile = self._tech_profiles.get(self.tech_stack_key(tech_stack))
+            if profile is not None:
+                return profile
         return {
             "complexity_level": self._evaluate_technical_complexity(tech_stack),
             "required_expertise": self._identify_required_expertise(tech_stack),
@@ -122,7 +170,58 @@ class ProjectAnalyzer(BaseTool):
             "testing_environment": ["staging", "qa", "production"]
         }
 
+    def _build_schedule(self) -> Optional[TaskGraph]:
+        tasks = self.project_requirements.get("tasks")
+        if not tasks:
+            return None
+        if self._schedule is None:
+            self._schedule = TaskGraph.from_tasks(tasks).schedule()
+        return self._schedule
+
+    def _run_simulation(self) -> Optional[Dict]:
+        tasks = self.project_requirements.get("tasks")
+        if not tasks:
+            return None
+        if self._simulation is None:
+            settings = self.project_requirements.get("simulation", {})
+            timeline = self.project_requirements.get("timeline", {})
+            budget = self.project_requirements.get("budget", {})
+            total_budget = budget.get("total")
+            self._simulation = simulate_project(
+                tasks,
+                trials=settings.get("trials", DEFAULT_TRIALS),
+                seed=settings.get("seed", DEFAULT_SEED),
+                daily_rate=budget.get("daily_rate"),
+                target_days=self._timeline_days(),
+                budget=total_budget if isinstance(total_budget, (int, float)) else None,
+                start_date=timeline.get("start_date"),
+            )
+        return self._simulation
+
+    def _timeline_days(self) -> Optional[float]:
+        """
+        The timeline's duration in working days. A duration that does not
+        parse, such as 'about 3 months', falls back to the duration of the task
+        schedule.
+        """
+        timeline = self.project_requirements.get("timeline", {})
+        if "duration" not in timeline:
+            return None
+        try:
+            return parse_duration(timeline["duration"])
+        except ValueError:
+            schedule = self._build_schedule()
+            return schedule.project_duration if schedule is not None else None
+
     def _generate_timeline(self) -> Dict:
+        schedule = self._build_schedule()
+        if schedule is not None:
+            timeline = schedule.summary()
+            phases = self._summarize_phases(timeline["tasks"])
+            if phases:
+                timeline["phases"] = phases
+            return timeline
+
         return {
             "planning_phase": "2 weeks",
             "development_phase": "12 weeks",
@@ -130,13 +229,56 @@ class ProjectAnalyzer(BaseTool):
             "deployment_phase": "2 weeks"
         }
 
+    def _summarize_phases(self, task_schedules: Dict[str, Dict]) -> Dict[str, Dict]:
+        phases = {}
+        for task in self.project_requirements.get("tasks", []):
+            if "phase" not in task:
+                continue
+            times = task_schedules[task.get("id") or task["name"]]
+            phase = phases.setdefault(task["phase"], {"start": times["earliest_start"], "finish": times["earliest_finish"]})
+            phase["start"] = min(phase["start"], times["earliest_start"])
+            phase["finish"] = max(phase["finish"], times["earliest_finish"])
+        return phases
+
     def _estimate_costs(self) -> Dict:
-        return {
+        costs = {
             "personnel": 120000,
             "infrastructure": 15000,
             "tools_and_licenses": 5000,
             "contingency": 20000
         }
+        projection = self._project_infrastructure_costs()
+        if projection is not None:
+            costs["infrastructure"] = projection["total_cost"]
+        return costs
+
+    def _project_infrastructure_costs(self) -> Optional[Dict]:
+        workload = dict(self.project_requirements.get("infrastructure") or {})
+        if not workload:
+            return None
+        if self._projection is not None:
+            return self._projection
+        provider = workload.pop("provider", None)
+        if "months" not in workload:
+            days = self._timeline_days()
+            workload["months"] = math.ceil(days / DURATION_UNITS["month"]) if days else 12
+        model = get_cost_model()
+        # An unpriced provider falls back to the cheapest priced one
+        priced, not_priced = model.priced_providers([provider] if provider else None)
+        projected = model.project(workload, priced)
+        cheapest = min(projected, key=lambda name: projected[name]["total_cost"])
+        self._projection = {
+            "provider": cheapest,
+            "months": workload["months"],
+            "price_sheet": model.version,
+            **projected[cheapest]
+        }
+        if not_priced:
+            self._projection["not_priced"] = not_priced
+        ignored = unknown_parameters(workload)
+        if ignored:
+            self._projection["ignored_parameters"] = ignored
+        return self._projection
 
     def _identify_technical_risks(self) -> List[str]:
         return [
@@ -186,11 +328,17 @@ class ProjectAnalyzer(BaseTool):
         return 0.75
 
     def _evaluate_timeline_feasibility(self, timeline: Dict) -> float:
-        # Implement timeline feasibility scoring logic
+        # Probability of finishing within the timeline, when tasks are given
+        simulation = self._run_simulation()
+        if simulation and "on_time_probability" in simulation:
+            return simulation["on_time_probability"]
         return 0.8
 
     def _evaluate_budget_feasibility(self, budget: Dict) -> float:
-        # Implement budget feasibility scoring logic
+        # Probability of staying within the budget, when task costs are given
+        simulation = self._run_simulation()
+        if simulation and "on_budget_probability" in simulation:
+            return simulation["on_budget_probability"]
         return 0.85
 
     def _identify_required_expertise(self, tech_stack: Dict) -> List[str]:
@@ -200,6 +348,9 @@ class ProjectAnalyzer(BaseTool):
         return ["System integration", "Scalability", "Performance optimization"]
 
     def _identify_critical_path(self) -> List[str]:
+        schedule = self._build_schedule()
+        if schedule is not None:
+            return schedule.critical_path()
         return ["Architecture design", "Core feature development", "Integration testing"]
 
     def _identify_potential_delays(self) -> List[str]:
@@ -233,8 +384,18 @@ if __name__ == "__main__":
                 "development": 90000,
                 "infrastructure": 30000,
                 "contingency": 30000
-            }
-        }
+            },
+            "daily_rate": 1000
+        },
+        "tasks": [
+            {"id": "Requirements", "duration": "2 weeks", "phase": "Planning"},
+            {"id": "Architecture design", "duration": "1 week", "depends_on": ["Requirements"], "phase": "Planning"},
+            {"id": "UI design", "duration": "3 weeks", "depends_on": ["Requirements"], "phase": "Development"},
+            {"id": "Core feature development", "duration": "8 weeks", "depends_on": ["Architecture design"], "phase": "Development"},
+            {"id": "ML model training", "duration": "6 weeks", "depends_on": ["Architecture design"], "phase": "Development"},
+            {"id": "Integration testing", "duration": "3 weeks", "depends_on": ["Core feature development", "ML model training", "UI design"], "phase": "Testing"},
+            {"id": "Deployment", "duration": "1 week", "depends_on": ["Integration testing"], "phase": "Deployment"}
+        ]
     }
     
     analyzer = ProjectAnalyzer(
@@ -243,4 +404,13 @@ if __name__ == "__main__":
     )
     
     print("Testing ProjectAnalyzer tool:")
-    print(analyzer.run()) 
\ No newline at end of file
+    print(analyzer.run())
+
+    resources = ProjectAnalyzer(
+        project_requirements={
+            **test_requirements,
+            "infrastructure": {"rps": 50, "database_gb": 20, "growth_per_month": 0.1, "provider": "AWS"}
+        },
+        analysis_type="resource_planning"
+    )
+    print(resources.run()) 
\ No newline at end of file
@@ -1,9 +1,17 @@
-from agency_swarm.tools import BaseTool
 from pydantic import Field
 from typing import Dict, List, Optional
-import json
+import time
+if __name__ == "__main__" and not __package__:
+    # Run as a script: the shared modules live in the agency root
+    import sys
+    from pathlib import Path
+    sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from common.allocation import ResourceAllocator
+from common.async_tool import AsyncTool
+from common.task_store import get_task_store
+from common.tool_stream import build_report
 
-class TeamCoordinator(BaseTool):
+class TeamCoordinator(AsyncTool):
     """
     A tool for coordinating team assignments, managing resources, and tracking project progress.
     This tool helps the CEO manage team dynamics and ensure efficient project execution.
@@ -11,12 +19,26 @@ class TeamCoordinator(BaseTool):
     
     action_type: str = Field(
         ...,
-        description="Type of coordination action: 'assign_task', 'track_progress', 'resource_allocation', or 'performance_review'"
+        description=(
+            "Type of coordination action: 'assign_task', 'update_task', 'track_progress', "
+            "'resource_allocation', or 'performance_review'"
+        )
     )
     
     action_parameters: Dict = Field(
         ...,
-        description="Parameters specific to the action type (e.g., task details, team member info, etc.)"
+        description=(
+            "Parameters specific to the action type (e.g., task details, team member info, etc.). "
+            "assign_task: project_id, assignee, task_details {name, depends_on: [task ids], milestone, "
+            "estimated_days, ...}; "
+            "update_task: task_id, status ('assigned', 'in_progress', 'review', 'blocked', 'completed'), "
+            "assignee, priority; track_progress: project_id, optional assignee/status to list matching tasks; "
+            "resource_allocation: resource_request {resources: [{name, skills, capacity, available_from} or "
+            "{name, type, capacity}], tasks: [{id, duration, skills, infrastructure: [types], depends_on, priority, "
+            "earliest_start}], commitments: [{resource, start, end, project}], changes: [{task_id, ...fields} or "
+            "{task_id, remove: true} or {add: task}]}, times in working days; "
+            "performance_review: team_member (omit for the whole team), optional project_id"
+        )
     )
     
     priority_level: Optional[str] = Field(
@@ -24,12 +46,18 @@ class TeamCoordinator(BaseTool):
         description="Priority level of the action: 'high', 'medium', or 'low'"
     )
 
+    # Resource plan computed once per call and shared by the allocation sections
+    _allocator: Optional[ResourceAllocator] = None
+    _replanned_tasks: int = 0
+
     def run(self) -> str:
         """
         Executes the specified coordination action and returns the result.
         """
         if self.action_type == "assign_task":
             return self._assign_task()
+        elif self.action_type == "update_task":
+            return self._update_task()
         elif self.action_type == "track_progress":
             return self._track_progress()
         elif self.action_type == "resource_allocation":
@@ -42,62 +70,84 @@ class TeamCoordinator(BaseTool):
     def _assign_task(self) -> str:
         task_details = self.action_parameters.get("task_details", {})
         assignee = self.action_parameters.get("assignee", "")
+        task = get_task_store().add_task(
+            project_id=self.action_parameters.get("project_id", ""),
+            name=task_details.get("name", ""),
+            assignee=assignee,
+            priority=self.priority_level,
+            details=task_details,
+            depends_on=task_details.get("depends_on", [])
+        )
         
         assignment = {
-            "task_id": self._generate_task_id(),
+            "task_id": task["task_id"],
+            "project_id": task["project_id"],
             "assignee": assignee,
             "task_details": task_details,
             "priority": self.priority_level,
-            "status": "assigned",
-            "timeline": self._calculate_task_timeline(task_details),
-            "dependencies": self._identify_task_dependencies(task_details),
-            "resources": self._allocate_task_resources(task_details)
+            "status": task["status"],
+            "timeline": lambda: self._calculate_task_timeline(task_details),
+            "dependencies": lambda: self._identify_task_dependencies(task),
+            "resources": lambda: self._allocate_task_resources(task_details)
+        }
+        
+        return build_report(assignment)
+
+    def _update_task(self) -> str:
+        task = get_task_store().update_task(
+            self.action_parameters.get("task_id", ""),
+            status=self.action_parameters.get("status"),
+            assignee=self.action_parameters.get("assignee"),
+            priority=self.action_parameters.get("priority")
+        )
+        
+        update = {
+            "task": task,
+            "dependencies": lambda: self._identify_task_dependencies(task)
         }
         
-        return json.dumps(assignment, indent=2)
+        return build_report(update)
 
     def _track_progress(self) -> str:
         project_id = self.action_parameters.get("project_id", "")
         
         progress_report = {
             "project_id": project_id,
-            "overall_progress": self._calculate_overall_progress(),
-            "team_progress": self._get_team_progress(),
-            "milestones": self._track_milestones(),
-            "bottlenecks": self._identify_bottlenecks(),
-            "recommendations": self._generate_progress_recommendations()
+            "overall_progress": self._calculate_overall_progress,
+            "team_progress": self._get_team_progress,
+            "milestones": self._track_milestones,
+            "bottlenecks": self._identify_bottlenecks,
+            "recommendations": self._generate_progress_recommendations
         }
+        if "assignee" in self.action_parameters or "status" in self.action_parameters:
+            progress_report["tasks"] = self._query_tasks
         
-        return json.dumps(progress_report, indent=2)
+        return build_report(progress_report)
 
     def _allocate_resources(self) -> str:
         resource_request = self.action_parameters.get("resource_request", {})
         
         allocation = {
-            "allocated_resources": self._process_resource_allocation(resource_request),
-            "resource_conflicts": self._identify_resource_conflicts(),
-            "optimization_suggestions": self._suggest_resource_optimization(),
-            "timeline_impact": self._assess_timeline_impact()
+            "allocated_resources": lambda: self._process_resource_allocation(resource_request),
+            "resource_conflicts": self._identify_resource_conflicts,
+            "optimization_suggestions": self._suggest_resource_optimization,
+            "timeline_impact": self._assess_timeline_impact
         }
         
-        return json.dumps(allocation, indent=2)
+        return build_report(allocation)
 
     def _review_performance(self) -> str:
         team_member = self.action_parameters.get("team_member", "")
         
         review = {
             "team_member": team_member,
-            "performance_metrics": self._calculate_performance_metrics(),
-            "achievements": self._list_achievements(),
-            "areas_for_improvement": self._identify_improvement_areas(),
-            "recommendations": self._generate_performance_recommendations()
+            "performance_metrics": self._calculate_performance_metrics,
+            "achievements": self._list_achievements,
+            "areas_for_improvement": self._identify_improvement_areas,
+            "recommendations": self._generate_performance_recommendations
         }
         
-        return json.dumps(review, indent=2)
-
-    def _generate_task_id(self) -> str:
-        # Implementation for generating unique task IDs
-        return "TASK-001"
+        return build_report(review)
 
     def _calculate_task_timeline(self, task_details: Dict) -> Dict:
         return {
@@ -107,8 +157,13 @@ class TeamCoordinator(BaseTool):
             "milestones": ["Design", "Implementation", "Testing"]
         }
 
-    def _identify_task_dependencies(self, task_details: Dict) -> List[str]:
-        return ["Database Setup", "API Development", "Frontend Components"]
+    def _identify_task_dependencies(self, task: Dict) -> List[Dict]:
+        store = get_task_store()
+        dependencies = []
+        for task_id in task["depends_on"]:
+            dependency = store.get_task(task_id)
+            dependencies.append({"task_id": task_id, "name": dependency["name"], "status": dependency["status"]})
+        return dependencies
 
     def _allocate_task_resources(self, task_details: Dict) -> Dict:
         return {
@@ -118,32 +173,34 @@ class TeamCoordinator(BaseTool):
         }
 
     def _calculate_overall_progress(self) -> Dict:
-        return {
-            "percentage_complete": 65,
-            "tasks_completed": 12,
-            "tasks_remaining": 8,
-            "on_track": True
-        }
+        project_id = self.action_parameters.get("project_id", "")
+        progress = get_task_store().progress().project_progress(project_id)
+        if progress is not None:
+            return progress
+
+        return {"status": "not_found", "reason": f"No tasks recorded for project '{project_id}'"}
 
     def _get_team_progress(self) -> Dict:
-        return {
-            "development": {"complete": 70, "status": "on_track"},
-            "design": {"complete": 85, "status": "ahead"},
-            "testing": {"complete": 40, "status": "delayed"}
-        }
+        return get_task_store().progress().member_progress(self.action_parameters.get("project_id", ""))
+
+    def _query_tasks(self) -> List[Dict]:
+        return get_task_store().query(
+            project_id=self.action_parameters.get("project_id", ""),
+            assignee=self.action_parameters.get("assignee"),
+            status=self.action_parameters.get("status"),
+            limit=self.action_parameters.get("limit", 100)
+        )
 
     def _track_milestones(self) -> List[Dict]:
-        return [
-            {"name": "Planning", "status": "completed", "date": "2024-01-10"},
-            {"name": "Development", "status": "in_progress", "date": "2024-02-15"},
-            {"name": "Testing", "status": "pending", "date": "2024-03-01"}
-        ]
+        return get_task_store().progress().milestone_progress(self.action_parameters.get("project_id", ""))
 
     def _identify_bottlenecks(self) -> List[Dict]:
-        return [
-            {"area": "Testing", "cause": "Resource constraint", "impact": "high"},
-            {"area": "Integration", "cause": "Technical complexity", "impact": "medium"}
-        ]
+        store = get_task_store()
+        project_id = self.action_parameters.get("project_id", "")
+        wip = store.progress().projects.get(project_id)
+        if not wip:
+            return []
+        return store.stage_monitor().bottlenecks(project_id, wip, time.time())
 
     def _generate_progress_recommendations(self) -> List[str]:
         return [
@@ -153,7 +210,36 @@ class TeamCoordinator(BaseTool):
             "Review and optimize integration process"
         ]
 
+    def _plan_resources(self) -> Optional[ResourceAllocator]:
+        resource_request = self.action_parameters.get("resource_request", {})
+        if "resources" not in resource_request or "tasks" not in resource_request:
+            return None
+        if self._allocator is None:
+            self._allocator = ResourceAllocator(
+                resource_request["resources"], resource_request.get("commitments", [])
+            ).plan(resource_request["tasks"])
+            for change in resource_request.get("changes", []):
+                self._replanned_tasks += self._apply_allocation_change(change)
+        return self._allocator
+
+    def _apply_allocation_change(self, change: Dict) -> int:
+        # Each change re-plans only the affected tasks around the existing bookings
+        if "add" in change:
+            return self._allocator.add_task(change["add"])
+        task_id = change["task_id"]
+        if change.get("remove"):
+            return self._allocator.remove_task(task_id)
+        fields = {key: value for key, value in change.items() if key != "task_id"}
+        return self._allocator.update_task(task_id, **fields)
+
     def _process_resource_allocation(self, resource_request: Dict) -> Dict:
+        allocator = self._plan_resources()
+        if allocator is not None:
+            allocation = allocator.summary()
+            if resource_request.get("changes"):
+                allocation["replanned_tasks"] = self._replanned_tasks
+            return allocation
+
         return {
             "allocated": {
                 "developers": 2,
@@ -167,6 +253,14 @@ class TeamCoordinator(BaseTool):
         }
 
     def _identify_resource_conflicts(self) -> List[Dict]:
+        allocator = self._plan_resources()
+        if allocator is not None:
+            skill_gaps = [
+                {"task": task_id, "conflict_type": "unassignable", "reason": reason}
+                for task_id, reason in allocator.unassignable.items()
+            ]
+            return allocator.conflicts + skill_gaps
+
         return [
             {
                 "resource": "Senior Developer",
@@ -190,12 +284,12 @@ class TeamCoordinator(BaseTool):
         }
 
     def _calculate_performance_metrics(self) -> Dict:
-        return {
-            "productivity": 85,
-            "code_quality": 90,
-            "collaboration": 88,
-            "timeline_adherence": 82
-        }
+        team_member = self.action_parameters.get("team_member") or None
+        metrics = get_task_store().performance_review(team_member, self.action_parameters.get("project_id"))
+        if metrics is not None:
+            return metrics
+
+        return {"status": "not_found", "reason": f"No completed tasks recorded for {team_member or 'the team'}"}
 
     def _list_achievements(self) -> List[str]:
         return [
@@ -219,13 +313,18 @@ class TeamCoordinator(BaseTool):
 
 
 if __name__ == "__main__":
+    import os
+    os.environ.setdefault("AGENCY_TASK_STORE_PATH", ":memory:")
+
     # Test the TeamCoordinator tool
     test_parameters = {
+        "project_id": "PRJ-001",
         "task_details": {
             "name": "Implement Authentication System",
             "description": "Develop secure user authentication system",
             "requirements": ["OAuth2", "JWT", "Database Integration"],
-            "priority": "high"
+            "priority": "high",
+            "estimated_days": 10
         },
         "assignee": "Senior Developer"
     }
@@ -237,4 +336,21 @@ if __name__ == "__main__":
     )
     
     print("Testing TeamCoordinator tool:")
-    print(coordinator.run()) 
\ No newline at end of file
+    print(coordinator.run()) 
+
+    progress = TeamCoordinator(
+        action_type="track_progress",
+        action_parameters={"project_id": "PRJ-001", "assignee": "Senior Developer"}
+    )
+    print(progress.run())
+
+    for status in ("in_progress", "completed"):
+        TeamCoordinator(
+            action_type="update_task",
+            action_parameters={"task_id": "TASK-001", "status": status}
+        ).run()
+    review = TeamCoordinator(
+        action_type="performance_review",
+        action_parameters={"team_member": "Senior Developer"}
+    )
+    print(review.run())
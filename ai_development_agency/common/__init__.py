@@ -0,0 +1,23 @@
+from .agent_registry import AgentRegistry, LazyAgent
+from .settings_cache import SettingsStore, assistant_content_hash, sync_assistant
+from .prompt_assembly import PromptAssembler
+from .context_window import ContextWindow, ContextManagedThread, install_context_windows
+from .tool_cache import ToolResultCache, cached_run, tool_cache
+from .fan_out import FanOutReply, fan_out_calls, install_fan_out
+from .async_tool import AsyncTool, ConcurrentToolsThread, arun_all, run_concurrently
+from .tool_stream import ToolChunk, build_report, chunk_sink, stream_tool
+from .scheduling import TaskGraph, parse_duration
+from .monte_carlo import simulate_project
+from .portfolio import columnar_summary, run_portfolio
+from .task_store import TaskStore, get_task_store
+from .allocation import IntervalTree, ResourceAllocator
+from .progress import ProgressRollup
+from .bottlenecks import StageMonitor
+from .performance import PerformanceRollup
+from .scoring import WeightedScoring, normalize_weights
+from .tech_catalog import TechCatalog, open_catalog
+from .db_workloads import BenchmarkResults, LatencyHistogram, run_workload
+from .cloud_costs import CloudCostModel, get_cost_model
+from .capacity import CapacitySimulator
+from .component_graph import Call, Component, ComponentGraph
+from .design_cache import DesignSectionCache, design_cache, structural_diff
@@ -0,0 +1,201 @@
+from agency_swarm import Agent
+from .settings_cache import sync_assistant
+from typing import Dict, List, Optional
+import ast
+import importlib
+import importlib.util
+import threading
+
+# Attributes the Agency reads or writes on every agent while it parses the chart
+# and initializes. They live on the placeholder so that building an Agency does
+# not materialize anything.
+AGENCY_DEFAULT_ATTRIBUTES = [
+    "temperature",
+    "top_p",
+    "max_prompt_tokens",
+    "max_completion_tokens",
+    "truncation_strategy",
+]
+
+
+def read_agent_identity(module_path: str, class_name: str) -> Dict[str, str]:
+    """
+    Reads the name and description an agent class passes to Agent.__init__
+    straight from its source file, without importing the module or its tools.
+    """
+    spec = importlib.util.find_spec(module_path)
+    if spec is None or not spec.origin:
+        raise ImportError(f"Agent module '{module_path}' not found")
+
+    with open(spec.origin, "r") as f:
+        tree = ast.parse(f.read(), filename=spec.origin)
+
+    for node in ast.walk(tree):
+        if not isinstance(node, ast.ClassDef) or node.name != class_name:
+            continue
+        for call in ast.walk(node):
+            if not (isinstance(call, ast.Call)
+                    and isinstance(call.func, ast.Attribute)
+                    and call.func.attr == "__init__"):
+                continue
+            identity = {}
+            for keyword in call.keywords:
+                if keyword.arg in ("name", "description"):
+                    identity[keyword.arg] = ast.literal_eval(keyword.value)
+            if "name" in identity:
+                identity.setdefault("description", "")
+                return identity
+
+    raise ValueError(
+        f"Could not read name/description of {class_name} in {spec.origin}; "
+        "pass them to LazyAgent explicitly"
+    )
+
+
+class LazyAgent(Agent):
+    """
+    A placeholder that stands in for an agent inside the agency chart until the
+    first message is routed to it.
+
+    The Agency only needs an agent's name and description to build the chart and
+    the SendMessage tools, so the placeholder carries just those. The real agent
+    (instructions, tools folder, assistant sync with settings.json) is built on
+    first use, after which this object turns into that agent in place, so every
+    reference the Agency holds stays valid.
+    """
+
+    def __init__(self, module_path: str, class_name: str,
+                 name: Optional[str] = None, description: Optional[str] = None):
+        # Agent.__init__ is intentionally not called: it is the expensive part.
+        if name is None or description is None:
+            identity = read_agent_identity(module_path, class_name)
+            name = identity["name"] if name is None else name
+            description = identity["description"] if description is None else description
+
+        self._module_path = module_path
+        self._class_name = class_name
+        self._materialize_lock = threading.RLock()
+        self._oai_requested = False
+        self._pending_shared_instructions = None
+        self._id = None
+
+        self.name = name
+        self.description = description
+        self.tools = []
+        self.files_folder = []
+        self.settings_path = "./settings.json"
+        for attribute in AGENCY_DEFAULT_ATTRIBUTES:
+            setattr(self, attribute, None)
+
+    @property
+    def id(self):
+        # Reading the id after the Agency has asked for initialization means a
+        # thread is about to run against this assistant.
+        if self._oai_requested:
+            return self.materialize().id
+        return self._id
+
+    @id.setter
+    def id(self, value):
+        self._id = value
+
+    def add_shared_instructions(self, instructions: str):
+        if instructions:
+            self._pending_shared_instructions = instructions
+
+    def init_oai(self):
+        # Deferred until first use; see materialize().
+        self._oai_requested = True
+        return self
+
+    def __getattr__(self, item):
+        # Only reached for attributes the placeholder does not carry.
+        if item.startswith("__") or item in ("_module_path", "_class_name", "_materialize_lock"):
+            raise AttributeError(item)
+        return getattr(self.materialize(), item)
+
+    def load_class(self) -> type:
+        """
+        Imports and returns the agent class without building or syncing an agent.
+        """
+        return getattr(importlib.import_module(self._module_path), self._class_name)
+
+    def materialize(self) -> Agent:
+        """
+        Builds the real agent, replays everything the Agency configured on the
+        placeholder, syncs the assistant if the Agency already asked for it
+        (skipping the remote call when its content hash is unchanged), and then
+        swaps this object's class and state for the real agent's.
+        """
+        with self._materialize_lock:
+            if type(self) is not LazyAgent:
+                return self
+
+            agent = self.load_class()()
+            if agent.name != self.name:
+                raise ValueError(
+                    f"{self._class_name} is registered as '{self.name}' but "
+                    f"initializes as '{agent.name}'"
+                )
+
+            for tool in self.tools:
+                agent.add_tool(tool)
+            if self._pending_shared_instructions:
+                agent.add_shared_instructions(self._pending_shared_instructions)
+            agent.settings_path = self.settings_path
+            if self.files_folder:
+                if isinstance(agent.files_folder, str):
+                    agent.files_folder = [agent.files_folder]
+                agent.files_folder += self.files_folder
+            for attribute in AGENCY_DEFAULT_ATTRIBUTES:
+                if getattr(agent, attribute) is None:
+                    setattr(agent, attribute, getattr(self, attribute))
+            if self._shared_state is not None and not agent.shared_state:
+                agent.shared_state = self._shared_state
+            agent.id = self._id if self._id and "temp_id" not in self._id else None
+
+            if self._oai_requested:
+                sync_assistant(agent)
+
+            lock = self._materialize_lock
+            self.__dict__.clear()
+            self.__dict__.update(agent.__dict__)
+            self.__class__ = agent.__class__
+            # Keep the lock so concurrent callers that were waiting on it see
+            # the already-materialized agent.
+            self.__dict__["_materialize_lock"] = lock
+            return self
+
+
+class AgentRegistry:
+    """
+    Keeps the agency's agents as lazy placeholders and tracks which ones have
+    been materialized.
+    """
+
+    def __init__(self):
+        self._agents: Dict[str, LazyAgent] = {}
+
+    def register(self, module_path: str, class_name: str, **identity) -> LazyAgent:
+        agent = LazyAgent(module_path, class_name, **identity)
+        if agent.name in self._agents:
+            raise ValueError(f"Agent '{agent.name}' is already registered")
+        self._agents[agent.name] = agent
+        return agent
+
+    def get(self, name: str) -> Agent:
+        return self._agents[name]
+
+    @property
+    def agents(self) -> List[Agent]:
+        return list(self._agents.values())
+
+    def materialized_names(self) -> List[str]:
+        return [name for name, agent in self._agents.items() if not isinstance(agent, LazyAgent)]
+
+    def materialize_all(self) -> List[Agent]:
+        """
+        Materializes every registered agent, e.g. to warm a long-running server.
+        """
+        return [agent.materialize() if isinstance(agent, LazyAgent) else agent
+                for agent in self._agents.values()]
@@ -0,0 +1,499 @@
+from typing import Dict, Iterable, List, Optional, Tuple
+import heapq
+import random
+from .scheduling import parse_duration
+
+PRIORITY_ORDER = {"high": 0, "medium": 1, "low": 2}
+
+# A resource with capacity c has c lanes, each holding one booking at a time
+Lane = Tuple[str, int]
+
+
+class _Node:
+    __slots__ = ("start", "end", "key", "priority", "max_end", "left", "right")
+
+    def __init__(self, start: float, end: float, key: str, priority: float):
+        self.start = start
+        self.end = end
+        self.key = key
+        self.priority = priority
+        self.max_end = end
+        self.left: Optional["_Node"] = None
+        self.right: Optional["_Node"] = None
+
+
+class IntervalTree:
+    """
+    Half-open intervals [start, end) in a treap ordered by start, where each
+    node also keeps the largest end in its subtree. Overlap queries skip every
+    subtree that ends before the query window, so checking for an overlap is
+    O(log n) and listing k overlaps O(log n + k); inserts and removals are
+    O(log n) expected.
+    """
+
+    def __init__(self, seed: int = 0):
+        self._root: Optional[_Node] = None
+        self._random = random.Random(seed)
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def insert(self, start: float, end: float, key: str):
+        self._root = self._insert(self._root, _Node(start, end, key, self._random.random()))
+        self._size += 1
+
+    def remove(self, start: float, end: float, key: str):
+        self._root = self._remove(self._root, (start, end, key))
+        self._size -= 1
+
+    def overlaps(self, start: float, end: float) -> bool:
+        node = self._root
+        while node is not None:
+            if node.start < end and node.end > start:
+                return True
+            # Go left while it may still hold an overlap; everything right starts later
+            if node.left is not None and node.left.max_end > start:
+                node = node.left
+            elif node.start < end:
+                node = node.right
+            else:
+                return False
+        return False
+
+    def overlapping(self, start: float, end: float) -> List[Tuple[float, float, str]]:
+        found = []
+        stack = [self._root]
+        while stack:
+            node = stack.pop()
+            if node is None or node.max_end <= start:
+                continue
+            stack.append(node.left)
+            if node.start < end:
+                if node.end > start:
+                    found.append((node.start, node.end, node.key))
+                stack.append(node.right)
+        return found
+
+    def first_gap(self, start: float, length: float) -> float:
+        """
+        The earliest time at or after start from which [time, time + length)
+        overlaps nothing, walking only the intervals that end after start, in
+        start order, until a gap is found.
+        """
+        stack: List[_Node] = []
+        node = self._root
+        while stack or node is not None:
+            # Descend left, skipping subtrees that end before the search begins
+            while node is not None and node.max_end > start:
+                stack.append(node)
+                node = node.left
+            if not stack:
+                break
+            node = stack.pop()
+            if node.end > start:
+                if node.start >= start + length:
+                    return start
+                start = node.end
+            node = node.right
+        return start
+
+    def max_end(self) -> float:
+        return self._root.max_end if self._root is not None else float("-inf")
+
+    def _insert(self, node: Optional[_Node], new: _Node) -> _Node:
+        if node is None:
+            return new
+        if (new.start, new.end, new.key) < (node.start, node.end, node.key):
+            node.left = self._insert(node.left, new)
+            if node.left.priority > node.priority:
+                node = self._rotate_right(node)
+        else:
+            node.right = self._insert(node.right, new)
+            if node.right.priority > node.priority:
+                node = self._rotate_left(node)
+        self._update(node)
+        return node
+
+    def _remove(self, node: Optional[_Node], interval: Tuple[float, float, str]) -> Optional[_Node]:
+        if node is None:
+            raise KeyError(f"Interval {interval} not found")
+        current = (node.start, node.end, node.key)
+        if interval < current:
+            node.left = self._remove(node.left, interval)
+        elif interval > current:
+            node.right = self._remove(node.right, interval)
+        elif node.left is None:
+            return node.right
+        elif node.right is None:
+            return node.left
+        elif node.left.priority > node.right.priority:
+            node = self._rotate_right(node)
+            node.right = self._remove(node.right, interval)
+        else:
+            node = self._rotate_left(node)
+            node.left = self._remove(node.left, interval)
+        self._update(node)
+        return node
+
+    def _rotate_right(self, node: _Node) -> _Node:
+        pivot = node.left
+        node.left, pivot.right = pivot.right, node
+        self._update(node)
+        self._update(pivot)
+        return pivot
+
+    def _rotate_left(self, node: _Node) -> _Node:
+        pivot = node.right
+        node.right, pivot.left = pivot.left, node
+        self._update(node)
+        self._update(pivot)
+        return pivot
+
+    @staticmethod
+    def _update(node: _Node):
+        node.max_end = node.end
+        if node.left is not None and node.left.max_end > node.max_end:
+            node.max_end = node.left.max_end
+        if node.right is not None and node.right.max_end > node.max_end:
+            node.max_end = node.right.max_end
+
+
+class ResourceAllocator:
+    """
+    Assigns people and infrastructure to tasks over time, in working days from
+    the start of the plan.
+
+    Every task gets one person who has all of its 'skills', plus one
+    infrastructure resource of each of its 'infrastructure' types, for its
+    whole duration. It starts at the earliest time at or after its
+    dependencies finish (and its 'earliest_start') when all of them have a
+    free lane. Tasks are placed in dependency order, higher priority first;
+    among equally early resources, the least loaded is chosen.
+
+    Existing commitments are booked first; those that exceed a resource's
+    capacity are reported as conflicts. Each lane keeps its bookings in an
+    IntervalTree, so every capacity check is an O(log n) overlap query.
+
+    update_task(), add_task() and remove_task() re-plan incrementally: the
+    bookings of unaffected tasks stay where they are, and only the changed
+    task and its downstream tasks are re-placed.
+    """
+
+    def __init__(self, resources: Iterable[Dict], commitments: Iterable[Dict] = ()):
+        self.resources: Dict[str, Dict] = {}
+        self._lanes: Dict[Lane, IntervalTree] = {}
+        self._load: Dict[Lane, float] = {}
+        self._people_by_skill: Dict[str, set] = {}
+        self._people: List[str] = []
+        self._infrastructure_by_type: Dict[str, List[str]] = {}
+        self._candidates: Dict[frozenset, List[Lane]] = {}
+
+        self.tasks: Dict[str, Dict] = {}
+        self.successors: Dict[str, List[str]] = {}
+        self.placements: Dict[str, Dict] = {}
+        self.unassignable: Dict[str, str] = {}
+        self.conflicts: List[Dict] = []
+        self._placed_lanes: Dict[str, List[Lane]] = {}
+        self._commitment_projects: Dict[str, Optional[str]] = {}
+
+        for resource in resources:
+            self._add_resource(resource)
+        for index, commitment in enumerate(commitments):
+            self._book_commitment(index, commitment)
+
+    def plan(self, tasks: Iterable[Dict]) -> "ResourceAllocator":
+        tasks = [_normalize_task(task) for task in tasks]
+        for task in tasks:
+            if task["id"] in self.tasks:
+                raise ValueError(f"Duplicate task '{task['id']}'")
+            self.tasks[task["id"]] = task
+            self.successors[task["id"]] = []
+        for task in tasks:
+            for dependency in task["depends_on"]:
+                if dependency not in self.tasks:
+                    raise ValueError(f"Unknown task '{dependency}' in dependencies")
+                self.successors[dependency].append(task["id"])
+
+        for task_id in self._placement_order([task["id"] for task in tasks]):
+            self._place(task_id)
+        return self
+
+    def add_task(self, task: Dict) -> int:
+        """
+        Places one new task around the existing bookings. Returns the number
+        of tasks placed.
+        """
+        self.plan([task])
+        return 1
+
+    def update_task(self, task_id: str, **changes) -> int:
+        """
+        Changes a task's duration, skills, infrastructure, priority, depends_on
+        or earliest_start and re-places it and its downstream tasks. Returns
+        the number of tasks re-placed.
+        """
+        if task_id not in self.tasks:
+            raise ValueError(f"Unknown task '{task_id}'")
+        old = self.tasks[task_id]
+        task = _normalize_task({**_denormalize_task(old), **changes, "id": task_id})
+        downstream = self._downstream(task_id)
+        for dependency in task["depends_on"]:
+            if dependency not in self.tasks:
+                raise ValueError(f"Unknown task '{dependency}' in dependencies")
+            if dependency in downstream:
+                raise ValueError(f"Task '{task_id}' cannot depend on its downstream task '{dependency}'")
+        for dependency in old["depends_on"]:
+            self.successors[dependency].remove(task_id)
+        for dependency in task["depends_on"]:
+            self.successors[dependency].append(task_id)
+        self.tasks[task_id] = task
+        return self._replace(downstream)
+
+    def remove_task(self, task_id: str) -> int:
+        """
+        Frees a task's bookings and re-places its downstream tasks, which no
+        longer wait for it. Returns the number of tasks re-placed.
+        """
+        if task_id not in self.tasks:
+            raise ValueError(f"Unknown task '{task_id}'")
+        affected = self._downstream(task_id)
+        self._unbook(task_id)
+        for dependency in self.tasks[task_id]["depends_on"]:
+            self.successors[dependency].remove(task_id)
+        for successor in self.successors.pop(task_id):
+            self.tasks[successor]["depends_on"].remove(task_id)
+        del self.tasks[task_id]
+        affected.remove(task_id)
+        return self._replace(affected)
+
+    def overlapping(self, resource: str, start: float, end: float) -> List[Dict]:
+        """
+        Bookings of a resource that overlap [start, end).
+        """
+        found = []
+        for lane in self._resource_lanes(resource):
+            for booking_start, booking_end, key in self._lanes[lane].overlapping(start, end):
+                found.append({"booking": key, "start": booking_start, "end": booking_end})
+        return sorted(found, key=lambda booking: (booking["start"], booking["booking"]))
+
+    def summary(self) -> Dict:
+        makespan = max((placement["end"] for placement in self.placements.values()), default=0.0)
+        utilization = {}
+        for name, resource in self.resources.items():
+            booked = sum(self._load[lane] for lane in self._resource_lanes(name))
+            available = resource["capacity"] * makespan
+            utilization[name] = round(100 * booked / available, 1) if available else 0.0
+        return {
+            "assignments": {
+                task_id: self.placements[task_id] for task_id in self.tasks if task_id in self.placements
+            },
+            "makespan_days": makespan,
+            "utilization": utilization,
+            "unassignable": dict(self.unassignable),
+        }
+
+    def _add_resource(self, resource: Dict):
+        name = resource["name"]
+        if name in self.resources:
+            raise ValueError(f"Duplicate resource '{name}'")
+        capacity = int(resource.get("capacity", 1))
+        self.resources[name] = {
+            "name": name,
+            "type": resource.get("type"),
+            "skills": set(resource.get("skills", [])),
+            "capacity": capacity,
+        }
+        available_from = float(resource.get("available_from", 0))
+        for slot in range(capacity):
+            lane = (name, slot)
+            self._lanes[lane] = IntervalTree()
+            self._load[lane] = 0.0
+            if available_from > 0:
+                self._lanes[lane].insert(float("-inf"), available_from, "unavailable")
+
+        if resource.get("type"):
+            self._infrastructure_by_type.setdefault(resource["type"], []).append(name)
+        else:
+            self._people.append(name)
+            for skill in self.resources[name]["skills"]:
+                self._people_by_skill.setdefault(skill, set()).add(name)
+
+    def _resource_lanes(self, name: str) -> List[Lane]:
+        return [(name, slot) for slot in range(self.resources[name]["capacity"])]
+
+    def _book_commitment(self, index: int, commitment: Dict):
+        name = commitment["resource"]
+        start, end = float(commitment["start"]), float(commitment["end"])
+        label = commitment.get("label") or commitment.get("task") or f"commitment-{index + 1}"
+        if name not in self.resources:
+            self.conflicts.append({
+                "resource": name,
+                "conflict_type": "unknown_resource",
+                "bookings": [label],
+                "affected_projects": [commitment["project"]] if commitment.get("project") else [],
+            })
+            return
+
+        for lane in self._resource_lanes(name):
+            if not self._lanes[lane].overlaps(start, end):
+                self._lanes[lane].insert(start, end, label)
+                self._load[lane] += end - start
+                self._commitment_projects[label] = commitment.get("project")
+                return
+
+        overlapping = self.overlapping(name, start, end)
+        projects = {commitment.get("project")} | {
+            self._commitment_projects.get(booking["booking"]) for booking in overlapping
+        }
+        self.conflicts.append({
+            "resource": name,
+            "conflict_type": "scheduling",
+            "window": [start, end],
+            "bookings": [label] + [booking["booking"] for booking in overlapping],
+            "affected_projects": sorted(project for project in projects if project),
+        })
+
+    def _placement_order(self, task_ids: List[str]) -> List[str]:
+        # Kahn's algorithm over the given tasks, higher priority first among ready ones
+        task_set = set(task_ids)
+        position = {task_id: i for i, task_id in enumerate(task_ids)}
+        remaining = {
+            task_id: sum(1 for d in self.tasks[task_id]["depends_on"] if d in task_set) for task_id in task_ids
+        }
+        ready = [self._rank(task_id, position) for task_id, count in remaining.items() if count == 0]
+        heapq.heapify(ready)
+        order = []
+        while ready:
+            *_, task_id = heapq.heappop(ready)
+            order.append(task_id)
+            for successor in self.successors[task_id]:
+                if successor in remaining:
+                    remaining[successor] -= 1
+                    if remaining[successor] == 0:
+                        heapq.heappush(ready, self._rank(successor, position))
+        if len(order) != len(task_ids):
+            cycle = sorted(task_id for task_id, count in remaining.items() if count > 0)
+            raise ValueError(f"Task dependencies contain a cycle involving: {cycle}")
+        return order
+
+    def _rank(self, task_id: str, position: Dict[str, int]) -> Tuple[int, int, str]:
+        return PRIORITY_ORDER.get(self.tasks[task_id]["priority"], 1), position[task_id], task_id
+
+    def _place(self, task_id: str):
+        task = self.tasks[task_id]
+        ready = task["earliest_start"]
+        for dependency in task["depends_on"]:
+            if dependency not in self.placements:
+                self.unassignable[task_id] = f"depends on unassignable task '{dependency}'"
+                return
+            ready = max(ready, self.placements[dependency]["end"])
+
+        slots = [self._people_with_skills(task["skills"])]
+        slots += [self._infrastructure_lanes(kind) for kind in task["infrastructure"]]
+        if not slots[0]:
+            self.unassignable[task_id] = f"no one has all of the skills {sorted(task['skills'])}"
+            return
+        for kind, candidates in zip(task["infrastructure"], slots[1:]):
+            if not candidates:
+                self.unassignable[task_id] = f"no infrastructure of type '{kind}'"
+                return
+
+        found = self._earliest_slot(slots, ready, task["duration"])
+        if found is None:
+            self.unassignable[task_id] = "not enough distinct infrastructure resources"
+            return
+        start, lanes = found
+        end = start + task["duration"]
+        for lane in lanes:
+            self._lanes[lane].insert(start, end, task_id)
+            self._load[lane] += task["duration"]
+        self.unassignable.pop(task_id, None)
+        self.placements[task_id] = {"resources": [lane[0] for lane in lanes], "start": start, "end": end}
+        self._placed_lanes[task_id] = lanes
+
+    def _earliest_slot(self, slots: List[List[Lane]], ready: float,
+                       duration: float) -> Optional[Tuple[float, List[Lane]]]:
+        # Moves the start forward until every slot has a lane free for the
+        # whole duration; each round the start only grows, to a booking's end
+        start = ready
+        while True:
+            chosen: List[Lane] = []
+            latest = start
+            for candidates in slots:
+                best = None
+                for lane in candidates:
+                    if lane in chosen:
+                        continue
+                    key = (self._earliest_fit(lane, start, duration), self._load[lane], lane)
+                    if best is None or key < best:
+                        best = key
+                if best is None:
+                    return None
+                chosen.append(best[2])
+                latest = max(latest, best[0])
+            if latest == start:
+                return start, chosen
+            start = latest
+
+    def _earliest_fit(self, lane: Lane, start: float, duration: float) -> float:
+        tree = self._lanes[lane]
+        if duration <= 0 or tree.max_end() <= start:
+            return start
+        return tree.first_gap(start, duration)
+
+    def _people_with_skills(self, skills: frozenset) -> List[Lane]:
+        if skills not in self._candidates:
+            if skills:
+                names = set.intersection(*(self._people_by_skill.get(skill, set()) for skill in skills))
+            else:
+                names = set(self._people)
+            self._candidates[skills] = [lane for name in sorted(names) for lane in self._resource_lanes(name)]
+        return self._candidates[skills]
+
+    def _infrastructure_lanes(self, kind: str) -> List[Lane]:
+        return [lane for name in self._infrastructure_by_type.get(kind, []) for lane in self._resource_lanes(name)]
+
+    def _downstream(self, task_id: str) -> List[str]:
+        seen = {task_id}
+        stack = [task_id]
+        while stack:
+            for successor in self.successors[stack.pop()]:
+                if successor not in seen:
+                    seen.add(successor)
+                    stack.append(successor)
+        return list(seen)
+
+    def _replace(self, task_ids: List[str]) -> int:
+        for task_id in task_ids:
+            self._unbook(task_id)
+        order = {task_id: i for i, task_id in enumerate(self.tasks)}
+        task_ids = sorted(task_ids, key=order.get)
+        for task_id in self._placement_order(task_ids):
+            self._place(task_id)
+        return len(task_ids)
+
+    def _unbook(self, task_id: str):
+        placement = self.placements.pop(task_id, None)
+        self.unassignable.pop(task_id, None)
+        if placement is None:
+            return
+        for lane in self._placed_lanes.pop(task_id):
+            self._lanes[lane].remove(placement["start"], placement["end"], task_id)
+            self._load[lane] -= placement["end"] - placement["start"]
+
+
+def _normalize_task(task: Dict) -> Dict:
+    return {
+        "id": task.get("id") or task["name"],
+        "duration": parse_duration(task.get("duration", 0)),
+        "skills": frozenset(task.get("skills", [])),
+        "infrastructure": list(task.get("infrastructure", [])),
+        "depends_on": list(task.get("depends_on", [])),
+        "earliest_start": float(task.get("earliest_start", 0)),
+        "priority": task.get("priority", "medium"),
+    }
+
+
+def _denormalize_task(task: Dict) -> Dict:
+    return dict(task, skills=sorted(task["skills"]), depends_on=list(task["depends_on"]))
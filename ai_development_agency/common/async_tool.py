@@ -0,0 +1,137 @@
+from agency_swarm.threads import Thread
+from agency_swarm.tools import BaseTool
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, Generator, List
+import asyncio
+import contextvars
+import os
+import threading
+from .tool_output import get_output_format, use_output_format
+from .tool_stream import ToolChunk, chunk_sink, stream_tool
+
+# Shared by every sync tool adapted through AsyncTool.arun()
+TOOL_EXECUTOR = ThreadPoolExecutor(
+    max_workers=int(os.getenv("AGENCY_TOOL_WORKERS", "8")),
+    thread_name_prefix="tool",
+)
+
+
+class AsyncTool(BaseTool):
+    """
+    Base class for the agency's tools: adds an async arun() next to run().
+
+    The default arun() runs the tool's synchronous run() on a shared thread
+    pool, so existing tools need no changes; tools that do real I/O can
+    override arun() with a native coroutine instead.
+    """
+
+    async def arun(self) -> str:
+        loop = asyncio.get_running_loop()
+        # The output format override is per thread and the chunk sink per
+        # context, so carry both over to the worker
+        output_format = get_output_format()
+        context = contextvars.copy_context()
+        return await loop.run_in_executor(TOOL_EXECUTOR, context.run, self._run_with_format, output_format)
+
+    def stream(self) -> Generator[ToolChunk, None, str]:
+        """
+        Runs the tool and yields its report sections as they are built; the
+        generator returns the full output, the same string run() returns.
+        """
+        return stream_tool(self)
+
+    def _run_with_format(self, output_format: str) -> str:
+        with use_output_format(output_format):
+            return self.run()
+
+
+async def arun_all(tools: List[AsyncTool]) -> List[str]:
+    """
+    Awaits arun() of every tool concurrently and returns the results in order.
+    """
+    return list(await asyncio.gather(*(tool.arun() for tool in tools)))
+
+
+def run_concurrently(tools: List[AsyncTool]) -> List[str]:
+    """
+    Runs the tools concurrently from synchronous code and returns their results
+    in order.
+    """
+    return asyncio.run(arun_all(tools))
+
+
+class ConcurrentToolsThread(Thread):
+    """
+    A Thread that runs the tool calls of one assistant turn concurrently.
+
+    agency_swarm executes a turn's tool calls one after another and records
+    each output as soon as execute_tool() returns. So the first time this
+    thread executes a tool call of a run, it starts every call of the turn on
+    the shared tool pool. Each execute_tool() then waits for its own call only,
+    and returns that call's finished string output, so the turn takes as long
+    as its slowest call. SendMessage calls and tools configured with
+    one_call_at_a_time keep their synchronous, one-at-a-time behaviour.
+
+    Report sections are forwarded as they are built to the event handler's
+    on_tool_output_chunk(tool_call, chunk), if it defines one. The assistant
+    itself still receives the whole output once the call finishes, since the
+    API takes a single output per tool call.
+    """
+
+    concurrent_tools = os.getenv("AGENCY_CONCURRENT_TOOLS", "true").lower() == "true"
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._turn_run_id = None
+        self._turn_calls: Dict[str, Future] = {}
+        self._turn_lock = threading.Lock()
+
+    def execute_tool(self, tool_call, recipient_agent=None, event_handler=None, tool_outputs_and_names=None):
+        if self.concurrent_tools:
+            call = self._start_turn(recipient_agent, event_handler).get(tool_call.id)
+            if call is not None:
+                return call.result()
+        return self._execute_with_sink(tool_call, recipient_agent, event_handler, tool_outputs_and_names)
+
+    def _execute_with_sink(self, tool_call, recipient_agent, event_handler, tool_outputs_and_names=None):
+        on_chunk = getattr(event_handler, "on_tool_output_chunk", None)
+        sink = (lambda chunk: on_chunk(tool_call, chunk)) if on_chunk else None
+
+        with chunk_sink(sink):
+            return super().execute_tool(tool_call, recipient_agent, event_handler, tool_outputs_and_names)
+
+    def _start_turn(self, recipient_agent, event_handler) -> Dict[str, Future]:
+        with self._turn_lock:
+            return self._start_turn_locked(recipient_agent, event_handler)
+
+    def _start_turn_locked(self, recipient_agent, event_handler) -> Dict[str, Future]:
+        run = self._run
+        if run is None or run.id == self._turn_run_id:
+            return self._turn_calls
+
+        for call in self._turn_calls.values():
+            call.cancel()
+        self._turn_run_id = run.id
+        self._turn_calls = {}
+
+        required_action = getattr(run, "required_action", None)
+        if required_action is None:
+            return self._turn_calls
+
+        # The output format override is per thread, so carry it over to the
+        # workers, as AsyncTool.arun() does
+        output_format = get_output_format()
+
+        def execute(tool_call):
+            with use_output_format(output_format):
+                return self._execute_with_sink(tool_call, recipient_agent, event_handler)
+
+        functions = {func.__name__: func for func in (recipient_agent or self.recipient_agent).functions}
+        for tool_call in required_action.submit_tool_outputs.tool_calls:
+            tool = functions.get(tool_call.function.name)
+            if tool is None or tool_call.function.name.startswith("SendMessage"):
+                continue
+            if getattr(getattr(tool, "ToolConfig", None), "one_call_at_a_time", False):
+                continue
+            self._turn_calls[tool_call.id] = TOOL_EXECUTOR.submit(execute, tool_call)
+        return self._turn_calls
@@ -0,0 +1,181 @@
+from typing import Dict, List, Optional
+import os
+
+SECONDS_PER_DAY = 86400
+
+# Recent history the queueing statistics are computed over
+WINDOW_DAYS = float(os.getenv("AGENCY_BOTTLENECK_WINDOW_DAYS", "14"))
+WINDOW_BUCKETS = 14
+
+# Utilization from which a stage is reported as a bottleneck
+SATURATION_THRESHOLD = 0.85
+
+# Statuses tasks leave again; 'completed' is where they end up
+STAGES = ["assigned", "in_progress", "review", "blocked"]
+
+
+class SlidingWindow:
+    """
+    Arrivals, departures, time in stage and the people who finished work in
+    a stage over the last window_seconds, kept in a fixed ring of buckets. An
+    event lands in the bucket of its time and expired buckets are reused, so
+    memory stays constant however long the history is.
+    """
+
+    def __init__(self, window_seconds: float, buckets: int):
+        self.bucket_seconds = window_seconds / buckets
+        self.buckets = buckets
+        self._ids = [None] * buckets
+        self._arrivals = [0] * buckets
+        self._departures = [0] * buckets
+        self._timed_departures = [0] * buckets
+        self._dwell = [0.0] * buckets
+        self._service = [0.0] * buckets
+        self._members: List[set] = [set() for _ in range(buckets)]
+
+    def arrive(self, at: float):
+        slot = self._slot(at)
+        if slot is not None:
+            self._arrivals[slot] += 1
+
+    def depart(self, at: float, dwell: Optional[float], service: Optional[float], member: Optional[str]):
+        slot = self._slot(at)
+        if slot is None:
+            return
+        self._departures[slot] += 1
+        if dwell is not None:
+            self._timed_departures[slot] += 1
+            self._dwell[slot] += dwell
+            self._service[slot] += service
+        if member:
+            self._members[slot].add(member)
+
+    def totals(self, now: float) -> Dict:
+        current = int(now // self.bucket_seconds)
+        live = [i for i in range(self.buckets) if self._ids[i] is not None and current - self._ids[i] < self.buckets]
+        members = set()
+        for i in live:
+            members |= self._members[i]
+        return {
+            "arrivals": sum(self._arrivals[i] for i in live),
+            "departures": sum(self._departures[i] for i in live),
+            "timed_departures": sum(self._timed_departures[i] for i in live),
+            "dwell": sum(self._dwell[i] for i in live),
+            "service": sum(self._service[i] for i in live),
+            "members": len(members),
+        }
+
+    def _slot(self, at: float) -> Optional[int]:
+        bucket_id = int(at // self.bucket_seconds)
+        slot = bucket_id % self.buckets
+        if self._ids[slot] != bucket_id:
+            if self._ids[slot] is not None and self._ids[slot] > bucket_id:
+                return None  # older than the window
+            self._ids[slot] = bucket_id
+            self._arrivals[slot] = self._departures[slot] = self._timed_departures[slot] = 0
+            self._dwell[slot] = self._service[slot] = 0.0
+            self._members[slot] = set()
+        return slot
+
+
+class StageMonitor:
+    """
+    Streaming queueing statistics per project and stage (task status) over
+    the task event log.
+
+    Each event is an arrival in its new status and, for status changes, a
+    departure from the old one after old_status_since. Over the sliding
+    window that gives each stage's arrival rate, throughput, time in stage
+    and the number of people finishing work in it; with the stage's current
+    WIP, Little's law gives its cycle time.
+
+    Time in stage includes any wait for a free person. A task's service time
+    is taken as the shorter of its time in stage and the time since its
+    assignee last finished a task in that stage, which is the service time
+    whenever the person was busy back to back. Utilization is then
+    arrival rate * mean service time / people, and approaches 1 as the stage
+    saturates. Besides the windows, only each person's last finish per stage
+    is kept.
+    """
+
+    def __init__(self, window_seconds: float = WINDOW_DAYS * SECONDS_PER_DAY, buckets: int = WINDOW_BUCKETS):
+        self.window_seconds = window_seconds
+        self.buckets = buckets
+        self.last_seq = 0
+        self._windows: Dict[str, Dict[str, SlidingWindow]] = {}
+        self._last_finish: Dict[str, Dict[str, Dict[str, float]]] = {}
+
+    def apply(self, event: Dict):
+        if event["old_status"] != event["new_status"]:
+            self._window(event["project_id"], event["new_status"]).arrive(event["at"])
+            if event["old_status"] is not None:
+                self._depart(event)
+        self.last_seq = event["seq"]
+
+    def _depart(self, event: Dict):
+        at, since, person = event["at"], event["old_status_since"], event["old_assignee"]
+        dwell = service = at - since if since is not None else None
+        finishes = self._last_finish.setdefault(event["project_id"], {}).setdefault(event["old_status"], {})
+        if dwell is not None and person in finishes:
+            service = min(dwell, at - finishes[person])
+        if person:
+            finishes[person] = at
+        self._window(event["project_id"], event["old_status"]).depart(at, dwell, service, person)
+
+    def stage_stats(self, project_id: str, wip: Dict[str, int], now: float) -> Dict[str, Dict]:
+        window_days = self.window_seconds / SECONDS_PER_DAY
+        stats = {}
+        for stage, window in self._windows.get(project_id, {}).items():
+            if stage not in STAGES:
+                continue
+            totals = window.totals(now)
+            arrival_rate = totals["arrivals"] / window_days
+            throughput = totals["departures"] / window_days
+            timed = totals["timed_departures"]
+            stage_days = totals["dwell"] / timed / SECONDS_PER_DAY if timed else None
+            service_days = totals["service"] / timed / SECONDS_PER_DAY if timed else None
+            utilization = None
+            if service_days is not None and totals["members"]:
+                utilization = arrival_rate * service_days / totals["members"]
+            stats[stage] = {
+                "arrival_rate_per_day": round(arrival_rate, 3),
+                "throughput_per_day": round(throughput, 3),
+                "mean_time_in_stage_days": _round(stage_days),
+                "mean_service_days": _round(service_days),
+                "wip": wip.get(stage, 0),
+                "cycle_time_days": _round(wip.get(stage, 0) / throughput if throughput else None),
+                "people": totals["members"],
+                "utilization": _round(utilization),
+            }
+        return stats
+
+    def bottlenecks(self, project_id: str, wip: Dict[str, int], now: float,
+                    threshold: float = SATURATION_THRESHOLD) -> List[Dict]:
+        """
+        Stages whose utilization is at or above threshold, most saturated first.
+        """
+        found = []
+        for stage, stats in self.stage_stats(project_id, wip, now).items():
+            utilization = stats["utilization"]
+            if utilization is None or utilization < threshold:
+                continue
+            found.append({
+                "area": stage,
+                "cause": (
+                    f"{stats['arrival_rate_per_day']} tasks/day arrive while {stats['people']} people take "
+                    f"{stats['mean_service_days']} days each (utilization {utilization:.0%})"
+                ),
+                "impact": "high" if utilization >= 1 else "medium",
+                "metrics": stats,
+            })
+        return sorted(found, key=lambda bottleneck: -bottleneck["metrics"]["utilization"])
+
+    def _window(self, project_id: str, stage: str) -> SlidingWindow:
+        stages = self._windows.setdefault(project_id, {})
+        if stage not in stages:
+            stages[stage] = SlidingWindow(self.window_seconds, self.buckets)
+        return stages[stage]
+
+
+def _round(value: Optional[float]) -> Optional[float]:
+    return round(value, 3) if value is not None else None
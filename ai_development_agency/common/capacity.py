@@ -0,0 +1,219 @@
+from typing import Dict, List, Optional, Tuple
+import heapq
+import math
+import numpy as np
+
+# The request path of the system design, in order. service_ms is the mean time
+# one request occupies a worker, service_cv its coefficient of variation (1 is
+# exponential, 0 constant), concurrency the workers per replica, and hit_ratio
+# the share of requests a tier answers itself without going further.
+DEFAULT_TIERS = [
+    {"name": "Load Balancer", "service_ms": 0.3, "service_cv": 0.5, "concurrency": 64},
+    {"name": "Backend API", "service_ms": 15.0, "service_cv": 1.0, "concurrency": 4},
+    {"name": "Cache", "service_ms": 0.3, "service_cv": 0.5, "concurrency": 1, "hit_ratio": 0.8},
+    {"name": "Database Layer", "service_ms": 8.0, "service_cv": 1.5, "concurrency": 8},
+]
+
+DEFAULT_REQUESTS = 20_000
+# Share of the simulated requests discarded while the queues fill from empty
+WARMUP_FRACTION = 0.1
+# Replica additions tried before a plan gives up on its target
+MAX_STEPS = 200
+
+
+def tier_specs(tiers: Optional[List[Dict]] = None) -> List[Dict]:
+    """
+    Complete tiers from partial ones: a tier named like a default one takes
+    that tier's profile for any field it leaves out.
+    """
+    defaults = {tier["name"]: tier for tier in DEFAULT_TIERS}
+    specs = []
+    for tier in tiers or DEFAULT_TIERS:
+        spec = {"service_cv": 1.0, "concurrency": 1, "hit_ratio": 0.0, **defaults.get(tier["name"], {}), **tier}
+        if "service_ms" not in spec:
+            raise ValueError(f"Tier '{spec['name']}' needs a 'service_ms'")
+        if not 0 <= spec["hit_ratio"] < 1:
+            raise ValueError(f"Tier '{spec['name']}' hit_ratio must be in [0, 1)")
+        specs.append(spec)
+    return specs
+
+
+def _service_times(rng: np.random.Generator, mean: float, cv: float, size: int) -> np.ndarray:
+    # Gamma keeps the mean and matches the requested variability; cv 1 is exponential
+    if cv <= 0:
+        return np.full(size, float(mean))
+    shape = 1.0 / cv ** 2
+    return rng.gamma(shape, mean / shape, size)
+
+
+def _fcfs(arrivals: np.ndarray, services: np.ndarray, servers: int) -> np.ndarray:
+    """
+    Start times at a first-come first-served queue with identical servers:
+    each request, in arrival order, takes whichever server frees up first.
+    """
+    order = np.argsort(arrivals, kind="stable")
+    starts = np.empty(len(arrivals))
+    if servers >= len(arrivals):
+        starts[:] = arrivals
+        return starts
+    free = [0.0] * servers
+    ordered_starts = []
+    for arrival, service in zip(arrivals[order].tolist(), services[order].tolist()):
+        start = arrival if arrival > free[0] else free[0]
+        heapq.heapreplace(free, start + service)
+        ordered_starts.append(start)
+    starts[order] = ordered_starts
+    return starts
+
+
+class CapacitySimulator:
+    """
+    A discrete-event simulation of requests through a chain of replicated
+    tiers, each a first-come first-served queue in front of replicas x
+    concurrency workers; a tier with a hit_ratio answers that share of its
+    requests and passes the rest on.
+
+    Arrivals (Poisson), service times and cache hits are drawn once up
+    front, so every replica configuration is measured against the same
+    requests and comparisons between them are not noise. Each tier's result
+    is cached by the replica counts up to and including it: adding a replica
+    to one tier only re-simulates that tier and the ones after it.
+    """
+
+    def __init__(self, arrival_rate: float, tiers: Optional[List[Dict]] = None,
+                 requests: int = DEFAULT_REQUESTS, seed: int = 0):
+        if arrival_rate <= 0:
+            raise ValueError("arrival_rate must be positive")
+        self.arrival_rate = float(arrival_rate)
+        self.tiers = tier_specs(tiers)
+        self.requests = requests
+        rng = np.random.default_rng(seed)
+        # Milliseconds throughout
+        self._arrivals = np.cumsum(rng.exponential(1000.0 / self.arrival_rate, requests))
+        self._services = [
+            _service_times(rng, tier["service_ms"], tier["service_cv"], requests) for tier in self.tiers
+        ]
+        self._continues = [rng.random(requests) >= tier["hit_ratio"] for tier in self.tiers]
+        self._measured = np.arange(requests) >= int(requests * WARMUP_FRACTION)
+        self._span_ms = self._arrivals[-1] - self._arrivals[int(requests * WARMUP_FRACTION)]
+        self._cache: Dict[Tuple[int, ...], Dict] = {}
+
+    def offered_load(self) -> List[float]:
+        """
+        Workers each tier keeps busy on average: its arrival rate times its
+        mean service time, in Erlangs.
+        """
+        load, share = [], 1.0
+        for tier in self.tiers:
+            load.append(self.arrival_rate * share * tier["service_ms"] / 1000)
+            share *= 1 - tier["hit_ratio"]
+        return load
+
+    def minimum_replicas(self, floor: int = 1) -> List[int]:
+        """
+        The fewest replicas per tier that keep every queue stable (utilization below 1).
+        """
+        return [
+            max(floor, math.floor(load / tier["concurrency"]) + 1)
+            for load, tier in zip(self.offered_load(), self.tiers)
+        ]
+
+    def _tier(self, replicas: Tuple[int, ...]) -> Dict:
+        if replicas in self._cache:
+            return self._cache[replicas]
+        k = len(replicas) - 1
+        if k == 0:
+            visiting = np.ones(self.requests, dtype=bool)
+            arrivals = self._arrivals
+        else:
+            upstream = self._tier(replicas[:-1])
+            visiting = upstream["visiting"] & self._continues[k - 1]
+            arrivals = upstream["departures"][visiting]
+        services = self._services[k][visiting]
+        starts = _fcfs(arrivals, services, replicas[-1] * self.tiers[k]["concurrency"])
+
+        departures = np.zeros(self.requests)
+        waits = np.zeros(self.requests)
+        departures[visiting] = starts + services
+        waits[visiting] = starts - arrivals
+        result = {"visiting": visiting, "departures": departures, "waits": waits}
+        self._cache[replicas] = result
+        return result
+
+    def run(self, replicas: List[int]) -> Dict:
+        """
+        Per-tier utilization, queueing delay and time in tier, and end-to-end
+        latency over the measured (post-warmup) requests, in milliseconds.
+        """
+        if len(replicas) != len(self.tiers):
+            raise ValueError(f"Expected replica counts for {len(self.tiers)} tiers, got {len(replicas)}")
+        replicas = [int(count) for count in replicas]
+        final = self._tier(tuple(replicas))
+        latency = final["departures"] - self._arrivals
+        # Requests answered early leave at their last tier's departure
+        for k in range(len(self.tiers) - 1):
+            done = self._tier(tuple(replicas[:k + 1]))
+            answered = done["visiting"] & ~self._continues[k]
+            latency[answered] = done["departures"][answered] - self._arrivals[answered]
+
+        tiers = []
+        for k, tier in enumerate(self.tiers):
+            result = self._tier(tuple(replicas[:k + 1]))
+            measured = result["visiting"] & self._measured
+            waits = result["waits"][measured]
+            in_tier = waits + self._services[k][measured]
+            servers = replicas[k] * tier["concurrency"]
+            tiers.append({
+                "name": tier["name"],
+                "replicas": replicas[k],
+                "workers": servers,
+                "arrival_rate": round(len(waits) / self._span_ms * 1000, 2),
+                "utilization": round(float(self._services[k][measured].sum() / (servers * self._span_ms)), 3),
+                "mean_queueing_delay_ms": round(float(waits.mean()), 3),
+                "p99_queueing_delay_ms": round(float(np.percentile(waits, 99)), 3),
+                "p99_latency_ms": round(float(np.percentile(in_tier, 99)), 3),
+            })
+
+        measured = latency[self._measured]
+        return {
+            "arrival_rate": self.arrival_rate,
+            "tiers": tiers,
+            "latency_ms": {
+                "mean": round(float(measured.mean()), 3),
+                "p50": round(float(np.percentile(measured, 50)), 3),
+                "p95": round(float(np.percentile(measured, 95)), 3),
+                "p99": round(float(np.percentile(measured, 99)), 3),
+            },
+        }
+
+    def plan(self, target_p99_ms: float, min_replicas: int = 1,
+             start: Optional[List[int]] = None) -> Dict:
+        """
+        Replica counts meeting an end-to-end p99 target. Starts from the
+        fewest replicas that keep every queue stable (or from start, if
+        higher) and adds one replica at a time to the tier with the longest
+        p99 queueing delay until the target is met. When queueing is gone
+        and the target is still missed, the service times alone exceed it
+        and the plan says so.
+        """
+        replicas = self.minimum_replicas(min_replicas)
+        if start is not None:
+            replicas = [max(count, floor) for count, floor in zip(replicas, start)]
+        for _ in range(MAX_STEPS):
+            result = self.run(replicas)
+            if result["latency_ms"]["p99"] <= target_p99_ms:
+                return {"target_p99_ms": target_p99_ms, "meets_target": True, **result}
+            delays = [tier["p99_queueing_delay_ms"] for tier in result["tiers"]]
+            worst = int(np.argmax(delays))
+            if delays[worst] <= 0:
+                break
+            replicas[worst] += 1
+        return {
+            "target_p99_ms": target_p99_ms,
+            "meets_target": False,
+            "reason": (
+                "service times alone exceed the target" if max(delays) <= 0
+                else f"not met within {MAX_STEPS} added replicas"
+            ),
+            **result,
+        }
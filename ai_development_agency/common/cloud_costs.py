@@ -0,0 +1,273 @@
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+import hashlib
+import json
+import os
+import threading
+import numpy as np
+
+PRICE_SHEET_PATH = os.getenv("AGENCY_CLOUD_PRICE_SHEET") or os.path.join(
+    os.path.dirname(__file__), "cloud_prices.json"
+)
+
+DEFAULT_WORKLOAD = {
+    "rps": 100,                    # average requests per second in the first month
+    "peak_to_average": 3.0,        # capacity is sized for the peak
+    "cpu_ms_per_request": 20,
+    "response_kb": 50,             # sent back per request, billed as egress
+    "storage_gb": 100,             # object storage
+    "database_gb": 50,
+    "db_hot_fraction": 0.25,       # share of the database that must fit in memory
+    "db_cpu_ms_per_request": 2,
+    "db_replicas": 1,              # billed database copies, e.g. 2 for a standby
+    "growth_per_month": 0.05,      # traffic and data grow by this share every month
+    "months": 12,
+    "min_instances": 2,
+    "target_utilization": 0.6,
+}
+COMPONENTS = ["compute", "storage", "egress", "database"]
+SECONDS_PER_MONTH = 730 * 3600
+
+with open(__file__, "rb") as _source:
+    # Part of cost_model_version(), so cached projections do not outlive the pricing code
+    _SOURCE_SHA256 = hashlib.sha256(_source.read()).hexdigest()[:16]
+
+
+def unknown_parameters(workload: Optional[Dict]) -> List[str]:
+    """
+    Keys of a workload that are not workload parameters, which workload_spec() ignores.
+    """
+    return sorted(set(workload or {}) - set(DEFAULT_WORKLOAD))
+
+
+def workload_spec(workload: Optional[Dict] = None) -> Dict:
+    """
+    A complete workload from a partial one; see DEFAULT_WORKLOAD for the
+    parameters and their defaults. Other keys are ignored (see
+    unknown_parameters()).
+    """
+    spec = {**DEFAULT_WORKLOAD, **{k: v for k, v in (workload or {}).items() if k in DEFAULT_WORKLOAD}}
+    if int(spec["months"]) < 1:
+        raise ValueError("months must be at least 1")
+    spec["months"] = int(spec["months"])
+    return spec
+
+
+class CloudCostModel:
+    """
+    Monthly cloud bills projected from a price sheet and workload parameters.
+
+    Every workload parameter is a column, so a batch of configurations is
+    priced as configurations x months arrays: compute takes the cheapest
+    instance type able to serve the peak CPU (at least min_instances of
+    it), egress walks the provider's tiers with one clip per tier, and the
+    database takes the cheapest tier that holds the hot data set in memory,
+    with as many nodes as the query CPU needs. A what-if sweep over thousands of configurations is a
+    handful of array operations per provider rather than a Python loop.
+    """
+
+    def __init__(self, sheet: Dict, sha256: Optional[str] = None):
+        self.version = sheet.get("version")
+        self.sha256 = sha256 or hashlib.sha256(json.dumps(sheet, sort_keys=True).encode("utf-8")).hexdigest()
+        self.currency = sheet.get("currency", "USD")
+        self.hours_per_month = sheet.get("hours_per_month", 730)
+        self._prices = {}
+        for provider, prices in sheet["providers"].items():
+            egress = prices["egress"]
+            upper = np.array([np.inf if tier["up_to_gb"] is None else tier["up_to_gb"] for tier in egress])
+            self._prices[provider] = {
+                "compute_names": [kind["name"] for kind in prices["compute"]],
+                "compute_vcpu": np.array([kind["vcpu"] for kind in prices["compute"]], dtype=np.float64),
+                "compute_hourly": np.array([kind["hourly"] for kind in prices["compute"]], dtype=np.float64),
+                "storage": prices["storage_gb_month"],
+                "egress_lower": np.concatenate([[0.0], upper[:-1]]),
+                "egress_upper": upper,
+                "egress_price": np.array([tier["price"] for tier in egress], dtype=np.float64),
+                "db_names": [tier["name"] for tier in prices["managed_db"]],
+                "db_vcpu": np.array([tier["vcpu"] for tier in prices["managed_db"]], dtype=np.float64),
+                "db_memory": np.array([tier["memory_gb"] for tier in prices["managed_db"]], dtype=np.float64),
+                "db_hourly": np.array([tier["hourly"] for tier in prices["managed_db"]], dtype=np.float64),
+                "db_storage": prices["db_storage_gb_month"],
+            }
+
+    @property
+    def providers(self) -> List[str]:
+        return list(self._prices)
+
+    def priced_providers(self, providers: Optional[Iterable[str]] = None) -> Tuple[List[str], List[str]]:
+        """
+        The requested providers the sheet has prices for (every provider it
+        prices when none of them, or none were requested), and the requested
+        ones it has no prices for.
+        """
+        providers = list(providers or [])
+        priced = [provider for provider in providers if provider in self._prices]
+        return priced or self.providers, [provider for provider in providers if provider not in self._prices]
+
+    def evaluate(self, configs: Dict[str, np.ndarray], months: int,
+                 providers: Optional[Iterable[str]] = None) -> Dict[str, Dict[str, np.ndarray]]:
+        """
+        Costs of N configurations over a horizon: {provider: {component:
+        N x months array, 'total', 'instance_type', 'instances', 'db_tier',
+        'db_nodes'}}. configs maps each workload parameter but 'months' to a
+        length-N array (or a scalar shared by all).
+        """
+        columns = {
+            name: np.atleast_1d(np.asarray(configs.get(name, default), dtype=np.float64))
+            for name, default in DEFAULT_WORKLOAD.items() if name != "months"
+        }
+        size = max(len(column) for column in columns.values())
+        c = {name: np.broadcast_to(column, (size,))[:, None] for name, column in columns.items()}
+
+        growth = (1 + c["growth_per_month"]) ** np.arange(months)[None, :]
+        rps = c["rps"] * growth
+        peak = rps * c["peak_to_average"] / c["target_utilization"]
+        vcpu = peak * c["cpu_ms_per_request"] / 1000
+        db_vcpu = peak * c["db_cpu_ms_per_request"] / 1000
+        hot_gb = c["database_gb"] * growth * c["db_hot_fraction"]
+        egress_gb = rps * c["response_kb"] * SECONDS_PER_MONTH / 2 ** 20
+
+        providers = list(providers or self.providers)
+        unknown = [provider for provider in providers if provider not in self._prices]
+        if unknown:
+            raise ValueError(f"No prices for {unknown}, the price sheet covers {self.providers}")
+        projections = {}
+        for provider in providers:
+            p = self._prices[provider]
+
+            instances = np.maximum(c["min_instances"][..., None], np.ceil(vcpu[..., None] / p["compute_vcpu"]))
+            compute_options = instances * p["compute_hourly"] * self.hours_per_month
+            instance_type = compute_options.argmin(axis=-1)
+            compute = np.take_along_axis(compute_options, instance_type[..., None], axis=-1)[..., 0]
+
+            billed = np.clip(egress_gb[..., None] - p["egress_lower"], 0, p["egress_upper"] - p["egress_lower"])
+            egress = billed @ p["egress_price"]
+
+            memory_nodes = np.ceil(hot_gb[..., None] / p["db_memory"])
+            nodes = np.maximum(np.maximum(1, memory_nodes), np.ceil(db_vcpu[..., None] / p["db_vcpu"]))
+            # The hot set must fit one node's memory; it is only sharded once the largest tier is too small
+            fits = (memory_nodes <= 1) | (p["db_memory"] == p["db_memory"].max())
+            db_options = np.where(fits, nodes * p["db_hourly"] * self.hours_per_month, np.inf)
+            db_tier = db_options.argmin(axis=-1)
+            database = c["db_replicas"] * (
+                np.take_along_axis(db_options, db_tier[..., None], axis=-1)[..., 0]
+                + c["database_gb"] * growth * p["db_storage"]
+            )
+
+            storage = c["storage_gb"] * growth * p["storage"]
+            projections[provider] = {
+                "compute": compute,
+                "storage": storage,
+                "egress": egress,
+                "database": database,
+                "total": compute + storage + egress + database,
+                "instance_type": instance_type,
+                "instances": np.take_along_axis(instances, instance_type[..., None], axis=-1)[..., 0],
+                "db_tier": db_tier,
+                "db_nodes": np.take_along_axis(nodes, db_tier[..., None], axis=-1)[..., 0],
+            }
+        return projections
+
+    def project(self, workload: Optional[Dict] = None,
+                providers: Optional[Iterable[str]] = None) -> Dict[str, Dict]:
+        """
+        One workload's monthly bill per provider over its horizon, with the
+        first and last month broken down by component and the instances and
+        database tier chosen for them.
+        """
+        spec = workload_spec(workload)
+        projections = self.evaluate(spec, spec["months"], providers)
+        report = {}
+        for provider, costs in projections.items():
+            p = self._prices[provider]
+
+            def month(m):
+                breakdown = {component: round(float(costs[component][0, m]), 2) for component in COMPONENTS}
+                breakdown["total"] = round(float(costs["total"][0, m]), 2)
+                breakdown["instances"] = (
+                    f"{int(costs['instances'][0, m])} x {p['compute_names'][costs['instance_type'][0, m]]}"
+                )
+                breakdown["database_nodes"] = (
+                    f"{int(costs['db_nodes'][0, m])} x {p['db_names'][costs['db_tier'][0, m]]}"
+                )
+                return breakdown
+
+            report[provider] = {
+                "monthly_cost": [round(float(cost), 2) for cost in costs["total"][0]],
+                "total_cost": round(float(costs["total"][0].sum()), 2),
+                "first_month": month(0),
+                "last_month": month(spec["months"] - 1),
+            }
+        return report
+
+    def sweep(self, workload: Optional[Dict], grid: Dict[str, Sequence[float]],
+              providers: Optional[Iterable[str]] = None) -> Dict:
+        """
+        Every combination of the grid's values ({parameter: [values]}) on top
+        of a base workload, priced in one batch: the configurations as
+        parameter columns, each provider's total over the horizon and its
+        last-month bill, and the cheapest provider per configuration.
+        """
+        spec = workload_spec(workload)
+        unknown = set(grid) - (set(DEFAULT_WORKLOAD) - {"months"})
+        if unknown:
+            raise ValueError(f"Cannot sweep {sorted(unknown)}; 'months' is the horizon, not a parameter")
+        mesh = np.meshgrid(*[np.asarray(values, dtype=np.float64) for values in grid.values()], indexing="ij")
+        configs = {**spec, **{name: axis.ravel() for name, axis in zip(grid, mesh)}}
+        projections = self.evaluate(configs, spec["months"], providers)
+        names = list(projections)
+        totals = np.stack([projections[name]["total"].sum(axis=1) for name in names])
+        return {
+            "configurations": {name: configs[name] for name in grid},
+            "total_cost": dict(zip(names, totals)),
+            "last_month_cost": {name: projections[name]["total"][:, -1] for name in names},
+            "cheapest": np.asarray(names)[totals.argmin(axis=0)],
+        }
+
+    def scaling_curves(self, workload: Optional[Dict], grid: Dict[str, Sequence[float]],
+                       providers: Optional[Iterable[str]] = None) -> Dict[str, Dict]:
+        """
+        How each provider's bill responds to one parameter at a time, the
+        others held at the base workload: {parameter: {'values': [...],
+        'total_cost': {provider: [...]}, 'last_month_cost': {...}}}.
+        """
+        curves = {}
+        for name, values in grid.items():
+            result = self.sweep(workload, {name: values}, providers)
+            curves[name] = {
+                "values": [float(value) for value in values],
+                "total_cost": {p: np.round(cost, 2).tolist() for p, cost in result["total_cost"].items()},
+                "last_month_cost": {p: np.round(cost, 2).tolist() for p, cost in result["last_month_cost"].items()},
+            }
+        return curves
+
+
+_models: Dict[str, Tuple[Tuple[int, int], CloudCostModel]] = {}
+_models_lock = threading.Lock()
+
+
+def get_cost_model(sheet_path: Optional[str] = None) -> CloudCostModel:
+    """
+    The cost model for a price sheet (AGENCY_CLOUD_PRICE_SHEET, or the bundled
+    cloud_prices.json), loaded on first use and again whenever the file
+    changes. Later calls only stat the file.
+    """
+    sheet_path = sheet_path or PRICE_SHEET_PATH
+    stat = os.stat(sheet_path)
+    signature = (stat.st_mtime_ns, stat.st_size)
+    with _models_lock:
+        cached = _models.get(sheet_path)
+        if cached is None or cached[0] != signature:
+            with open(sheet_path, "rb") as sheet:
+                raw = sheet.read()
+            cached = (signature, CloudCostModel(json.loads(raw), hashlib.sha256(raw).hexdigest()))
+            _models[sheet_path] = cached
+        return cached[1]
+
+
+def cost_model_version(sheet_path: Optional[str] = None) -> str:
+    """
+    The price sheet's version and content hash and this module's source
+    hash, for the cache keys of tools whose results include projections.
+    """
+    model = get_cost_model(sheet_path)
+    return f"{model.version}:{model.sha256}:{_SOURCE_SHA256}"
@@ -0,0 +1,264 @@
+from dataclasses import dataclass, fields
+from typing import Dict, Iterable, List, Optional
+import numpy as np
+
+# Hops listed per request path, largest contribution first
+DEFAULT_TOP_HOPS = 5
+
+
+@dataclass
+class Component:
+    name: str
+    latency_ms: float = 0.0  # time spent in the component itself, excluding the calls it makes
+    kind: str = "service"
+
+
+@dataclass
+class Call:
+    source: str
+    target: str
+    mode: str = "sync"  # "sync" waits for the target; "async" hands off and starts a path of its own
+    fan_out: float = 1.0  # calls to the target per request through the source
+    parallel: bool = False  # fanned-out calls run concurrently, so the caller waits for one
+    latency_ms: float = 0.0  # network time per call
+    protocol: Optional[str] = None
+    data_format: Optional[str] = None
+
+    @property
+    def multiplier(self) -> float:
+        return 1.0 if self.parallel else self.fan_out
+
+
+class ComponentGraph:
+    """
+    Components and the calls between them, with the end-to-end latency of
+    every request path.
+
+    A component's latency as seen by its callers is its own time plus, for
+    every synchronous call it makes, the call's multiplier times the network
+    time and the callee's latency. Over the synchronous calls (a DAG) that is
+    L = M @ own, where M[u, v] counts how many times a request entering at u
+    passes through v: M = (I - A)^-1 for the call multipliers A, filled in
+    reverse topological order. Row M[r] is then every hop's share of path r,
+    and changing one component's latency by d moves every latency by
+    d * M[:, v], so edits cost one vector update instead of a re-walk.
+    Adding or removing calls rebuilds M on next use.
+    """
+
+    def __init__(self, components: Iterable[Component] = (), calls: Iterable[Call] = ()):
+        self.components: Dict[str, Component] = {}
+        self.calls: List[Call] = []
+        self._index: Dict[str, int] = {}
+        self._multipliers: Optional[np.ndarray] = None
+        self._latency: Optional[np.ndarray] = None
+        self._outgoing: Dict[int, List[Call]] = {}
+        # Synchronous calls with network time, and the index of each one's caller
+        self._timed_calls: List[Call] = []
+        self._call_sources = np.zeros(0, dtype=np.intp)
+        for component in components:
+            self.add_component(component)
+        for call in calls:
+            self.add_call(call)
+
+    @classmethod
+    def from_dicts(cls, components: Iterable[Dict], interactions: Iterable[Dict]) -> "ComponentGraph":
+        """
+        A graph from {name, latency_ms, kind} components and {from, to, mode,
+        fan_out, parallel, latency_ms, protocol, data_format} interactions.
+        Other keys (a description, a technology) are ignored, and latency_ms
+        defaults to 0.
+        """
+        graph = cls()
+        for component in components:
+            if "name" not in component:
+                raise ValueError(f"Component {component} has no 'name'")
+            graph.add_component(Component(**_known_fields(Component, component)))
+        for interaction in interactions:
+            missing = [key for key in ("from", "to") if key not in interaction]
+            if missing:
+                raise ValueError(f"Interaction {interaction} has no {' or '.join(repr(key) for key in missing)}")
+            graph.add_call(Call(interaction["from"], interaction["to"], **_known_fields(Call, interaction)))
+        return graph
+
+    def add_component(self, component: Component):
+        if component.name in self.components:
+            raise ValueError(f"Component '{component.name}' is already in the graph")
+        self._index[component.name] = len(self._index)
+        self.components[component.name] = component
+        self._invalidate()
+
+    def add_call(self, call: Call):
+        for name in (call.source, call.target):
+            if name not in self.components:
+                raise ValueError(f"Call {call.source} -> {call.target} names unknown component '{name}'")
+        if call.mode not in ("sync", "async"):
+            raise ValueError(f"Call mode must be 'sync' or 'async', got '{call.mode}'")
+        self.calls.append(call)
+        self._invalidate()
+
+    def remove_call(self, source: str, target: str):
+        self.calls = [call for call in self.calls if (call.source, call.target) != (source, target)]
+        self._invalidate()
+
+    def set_latency(self, name: str, latency_ms: float):
+        """
+        Changes a component's own latency, updating every path through it in place.
+        """
+        component = self.components[name]
+        delta = latency_ms - component.latency_ms
+        component.latency_ms = latency_ms
+        if self._latency is not None:
+            self._latency += delta * self._multipliers[:, self._index[name]]
+
+    def set_call_latency(self, source: str, target: str, latency_ms: float):
+        """
+        Changes the network time of the calls from source to target, updating every path through them in place.
+        """
+        for call in self.calls:
+            if (call.source, call.target) != (source, target):
+                continue
+            delta = latency_ms - call.latency_ms
+            call.latency_ms = latency_ms
+            if self._latency is not None and call.mode == "sync":
+                self._latency += delta * call.multiplier * self._multipliers[:, self._index[source]]
+
+    def latency(self, name: str) -> float:
+        """
+        End-to-end latency of a request entering at the named component.
+        """
+        self._evaluate()
+        return float(self._latency[self._index[name]])
+
+    def entry_points(self) -> List[str]:
+        """
+        Components no synchronous call waits on: where requests enter, and
+        where asynchronous hand-offs start their own paths.
+        """
+        called = {call.target for call in self.calls if call.mode == "sync"}
+        return [name for name in self.components if name not in called]
+
+    def breakdown(self, entry: str, top: int = DEFAULT_TOP_HOPS) -> Dict:
+        """
+        A request path's latency split over the hops it passes through
+        (components, and calls with network time), largest first, and the
+        chain of components leading to the dominant one.
+        """
+        if entry not in self._index:
+            raise ValueError(f"Unknown component '{entry}'")
+        self._evaluate()
+        names = list(self.components)
+        row = self._multipliers[self._index[entry]]
+        total = float(self._latency[self._index[entry]])
+
+        own = np.array([component.latency_ms for component in self.components.values()])
+        component_ms = row * own
+        network_ms = row[self._call_sources] * np.array(
+            [call.multiplier * call.latency_ms for call in self._timed_calls]
+        ) if self._timed_calls else np.zeros(0)
+        contributions = np.concatenate([component_ms, network_ms])
+        candidates = np.flatnonzero(contributions)
+        ranked = candidates[np.argsort(-contributions[candidates], kind="stable")][:top]
+        labels = names + [f"{call.source} -> {call.target}" for call in self._timed_calls]
+        hops = [(float(contributions[i]), labels[i]) for i in ranked]
+
+        dominant = names[int(np.argmax(component_ms))] if component_ms.max() > 0 else entry
+        return {
+            "entry": entry,
+            "latency_ms": round(total, 3),
+            "dominant_hop": hops[0][1] if hops else entry,
+            "path_to_dominant_component": self._path(entry, dominant),
+            "hops": [
+                {"hop": hop, "ms": round(ms, 3), "share": round(ms / total, 3) if total else 0.0}
+                for ms, hop in hops[:top]
+            ],
+        }
+
+    def budgets(self, budgets: Dict[str, float], top: int = DEFAULT_TOP_HOPS) -> Dict[str, Dict]:
+        """
+        Each entry's breakdown against its latency budget: the slack, and
+        the budget handed down to each hop in proportion to its share.
+        """
+        report = {}
+        for entry, budget_ms in budgets.items():
+            breakdown = self.breakdown(entry, top)
+            breakdown["budget_ms"] = budget_ms
+            breakdown["slack_ms"] = round(budget_ms - breakdown["latency_ms"], 3)
+            breakdown["within_budget"] = breakdown["slack_ms"] >= 0
+            for hop in breakdown["hops"]:
+                hop["budget_ms"] = round(budget_ms * hop["share"], 3)
+            report[entry] = breakdown
+        return report
+
+    def _invalidate(self):
+        self._multipliers = self._latency = None
+
+    def _sync_calls(self) -> Dict[int, List[Call]]:
+        outgoing: Dict[int, List[Call]] = {}
+        for call in self.calls:
+            if call.mode == "sync":
+                outgoing.setdefault(self._index[call.source], []).append(call)
+        return outgoing
+
+    def _evaluate(self):
+        if self._latency is not None:
+            return
+        count = len(self.components)
+        outgoing = self._sync_calls()
+        self._outgoing = outgoing
+        self._timed_calls = [call for calls in outgoing.values() for call in calls if call.latency_ms]
+        self._call_sources = np.array([self._index[call.source] for call in self._timed_calls], dtype=np.intp)
+        multipliers = np.zeros((count, count))
+        for u in self._reverse_topological_order(outgoing):
+            multipliers[u, u] = 1.0
+            for call in outgoing.get(u, []):
+                multipliers[u] += call.multiplier * multipliers[self._index[call.target]]
+
+        own = np.array([component.latency_ms for component in self.components.values()], dtype=np.float64)
+        for u, calls in outgoing.items():
+            own[u] += sum(call.multiplier * call.latency_ms for call in calls)
+        self._multipliers = multipliers
+        self._latency = multipliers @ own
+
+    def _reverse_topological_order(self, outgoing: Dict[int, List[Call]]) -> List[int]:
+        # Kahn's algorithm from the callees up: a component comes after everything it calls
+        pending = [0] * len(self.components)
+        callers: Dict[int, List[int]] = {}
+        for u, calls in outgoing.items():
+            for call in calls:
+                v = self._index[call.target]
+                pending[u] += 1
+                callers.setdefault(v, []).append(u)
+        ready = [u for u, count in enumerate(pending) if count == 0]
+        order = []
+        while ready:
+            v = ready.pop()
+            order.append(v)
+            for u in callers.get(v, []):
+                pending[u] -= 1
+                if pending[u] == 0:
+                    ready.append(u)
+        if len(order) < len(self.components):
+            names = list(self.components)
+            stuck = sorted(names[u] for u, count in enumerate(pending) if count)
+            raise ValueError(f"Synchronous calls form a cycle, which these components are in or call into: {stuck}")
+        return order
+
+    def _path(self, entry: str, target: str) -> List[str]:
+        # Follows, from the entry, the call that carries the most of the target's weight
+        names = list(self.components)
+        outgoing = self._outgoing
+        t = self._index[target]
+        path, u = [entry], self._index[entry]
+        while u != t:
+            call = max(
+                (call for call in outgoing.get(u, []) if self._multipliers[self._index[call.target], t]),
+                key=lambda call: call.multiplier * self._multipliers[self._index[call.target], t]
+            )
+            u = self._index[call.target]
+            path.append(names[u])
+        return path
+
+
+def _known_fields(dataclass_type: type, values: Dict) -> Dict:
+    names = {field.name for field in fields(dataclass_type)} - {"source", "target"}
+    return {key: value for key, value in values.items() if key in names}
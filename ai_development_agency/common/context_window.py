@@ -0,0 +1,416 @@
+from agency_swarm.threads import Thread
+from dataclasses import dataclass, field
+from typing import Callable, Dict, FrozenSet, List, Optional
+import logging
+import math
+import re
+import threading
+from .async_tool import ConcurrentToolsThread
+from .tokens import count_schema_tokens, count_tokens
+
+logger = logging.getLogger(__name__)
+
+WORD_PATTERN = re.compile(r"[a-z0-9][a-z0-9_\-]{3,}")
+STOPWORDS = frozenset(
+    "that this with from have will your about what which their there would could "
+    "should these those been were into more than then them they also only some "
+    "such when where each other over very just make like need please".split()
+)
+
+
+def extract_keywords(text: str) -> FrozenSet[str]:
+    return frozenset(w for w in WORD_PATTERN.findall(text.lower()) if w not in STOPWORDS)
+
+
+@dataclass
+class ContextEntry:
+    entry_id: int
+    role: str
+    content: str
+    tokens: int
+    turn: int
+    keywords: FrozenSet[str]
+    message_id: Optional[str] = None
+    tool_call_id: Optional[str] = None
+    pinned: bool = False
+    last_referenced_turn: int = field(default=0)
+
+
+def extractive_summary(entries: List[ContextEntry], previous_summary: str,
+                       max_tokens: int, max_line_chars: int = 160) -> str:
+    """
+    Default summarizer: one line per evicted entry (its first sentence), appended
+    to the previous summary. The oldest lines are dropped once the summary
+    exceeds max_tokens. Pass an LLM-backed callable with the same signature to
+    ContextWindow for abstractive summaries.
+    """
+    lines = previous_summary.splitlines() if previous_summary else []
+    for entry in entries:
+        first_sentence = re.split(r"(?<=[.!?])\s|\n", entry.content.strip(), maxsplit=1)[0]
+        if len(first_sentence) > max_line_chars:
+            first_sentence = first_sentence[:max_line_chars - 3] + "..."
+        lines.append(f"- [turn {entry.turn}] {entry.role}: {first_sentence}")
+
+    line_tokens = [count_tokens(line) + 1 for line in lines]
+    total = sum(line_tokens)
+    start = 0
+    while total > max_tokens and start < len(lines):
+        total -= line_tokens[start]
+        start += 1
+    return "\n".join(lines[start:])
+
+
+class ContextWindow:
+    """
+    Keeps a thread's prompt under max_prompt_tokens.
+
+    Tokens are counted once per message as it arrives, so the running total is
+    maintained incrementally. When the total crosses the high watermark, the
+    lowest-scoring entries (a mix of recency and keyword relevance to the latest
+    messages) are evicted until it drops below the low watermark, and folded
+    into a rolling summary. The most recent entries and explicitly pinned entries
+    are never evicted; tool outputs stay pinned while later messages keep
+    referencing them, and are only evicted once nothing unpinned is left.
+    Evicting down to the low watermark in small steps avoids the latency spikes
+    of re-truncating the whole history on every turn.
+    """
+
+    def __init__(
+        self,
+        max_prompt_tokens: int = 25000,
+        reserved_tokens: int = 0,
+        keep_recent: int = 4,
+        summary_max_tokens: int = 1000,
+        high_watermark: float = 0.95,
+        low_watermark: float = 0.8,
+        recency_half_life: float = 6.0,
+        recency_weight: float = 0.6,
+        relevance_weight: float = 0.4,
+        pin_turns: int = 3,
+        reference_min_terms: int = 5,
+        summarizer: Callable[[List[ContextEntry], str, int], str] = extractive_summary,
+        model: str = "gpt-4o",
+    ):
+        self.max_prompt_tokens = max_prompt_tokens
+        self.reserved_tokens = reserved_tokens
+        self.keep_recent = keep_recent
+        self.summary_max_tokens = summary_max_tokens
+        self.high_watermark = high_watermark
+        self.low_watermark = low_watermark
+        self.recency_half_life = recency_half_life
+        self.recency_weight = recency_weight
+        self.relevance_weight = relevance_weight
+        self.pin_turns = pin_turns
+        self.reference_min_terms = reference_min_terms
+        self.summarizer = summarizer
+        self.model = model
+
+        self.entries: List[ContextEntry] = []
+        self.summary = ""
+        self.summary_tokens = 0
+        self.turn = 0
+        self._message_tokens = 0
+        self._next_id = 0
+        self._evicted: List[ContextEntry] = []
+        # Id of the newest evicted message, and of the oldest message a store
+        # that only drops a prefix of the conversation still replays
+        self._newest_evicted_message: Optional[int] = None
+        self.replayed_from: Optional[int] = None
+
+    @property
+    def total_tokens(self) -> int:
+        return self.reserved_tokens + self._message_tokens + self.summary_tokens
+
+    def add(self, role: str, content: str, message_id: Optional[str] = None,
+            tool_call_id: Optional[str] = None) -> ContextEntry:
+        """
+        Records a message, updates tool output references and evicts if the
+        window is over its high watermark.
+        """
+        if role == "user":
+            self.turn += 1
+        entry = ContextEntry(
+            entry_id=self._next_id,
+            role=role,
+            content=content,
+            tokens=count_tokens(content, self.model),
+            turn=self.turn,
+            keywords=extract_keywords(content),
+            message_id=message_id,
+            tool_call_id=tool_call_id,
+            last_referenced_turn=self.turn,
+        )
+        self._next_id += 1
+        self._mark_references(entry)
+        self.entries.append(entry)
+        self._message_tokens += entry.tokens
+
+        if self.total_tokens > self.high_watermark * self.max_prompt_tokens:
+            self.evict()
+        return entry
+
+    def pin(self, entry_id: int, pinned: bool = True):
+        for entry in self.entries:
+            if entry.entry_id == entry_id:
+                entry.pinned = pinned
+                return
+        raise KeyError(f"No context entry with id {entry_id}")
+
+    def is_pinned(self, entry: ContextEntry) -> bool:
+        if entry.pinned:
+            return True
+        return entry.role == "tool" and self.turn - entry.last_referenced_turn < self.pin_turns
+
+    def score(self, entry: ContextEntry, query_keywords: FrozenSet[str]) -> float:
+        recency = math.exp(-(self.turn - entry.turn) / self.recency_half_life)
+        if entry.keywords and query_keywords:
+            relevance = len(entry.keywords & query_keywords) / len(entry.keywords)
+        else:
+            relevance = 0.0
+        return self.recency_weight * recency + self.relevance_weight * relevance
+
+    def evict(self) -> List[ContextEntry]:
+        """
+        Evicts the lowest-scoring unpinned entries until the window is below its
+        low watermark and folds them into the rolling summary.
+        """
+        target = self.low_watermark * self.max_prompt_tokens
+        recent = self.entries[-self.keep_recent:] if self.keep_recent else []
+        query_keywords = frozenset().union(*(entry.keywords for entry in recent))
+        recent_ids = {entry.entry_id for entry in recent}
+
+        candidates = [
+            entry for entry in self.entries
+            if entry.entry_id not in recent_ids and not self.is_pinned(entry)
+        ]
+        candidates.sort(key=lambda entry: self.score(entry, query_keywords))
+        # If unpinned entries are not enough, tool outputs pinned by reference
+        # (never explicitly pinned ones) go next, least recently referenced first
+        referenced = [
+            entry for entry in self.entries
+            if entry.entry_id not in recent_ids and not entry.pinned and self.is_pinned(entry)
+        ]
+        referenced.sort(key=lambda entry: (entry.last_referenced_turn, self.score(entry, query_keywords)))
+
+        evicted = []
+        freed = 0
+        for entry in candidates + referenced:
+            if self.total_tokens - freed <= target:
+                break
+            evicted.append(entry)
+            freed += entry.tokens
+
+        if not evicted:
+            return []
+
+        evicted_ids = {entry.entry_id for entry in evicted}
+        self.entries = [entry for entry in self.entries if entry.entry_id not in evicted_ids]
+        self._message_tokens -= freed
+        evicted.sort(key=lambda entry: entry.entry_id)
+        self.summary = self.summarizer(evicted, self.summary, self.summary_max_tokens)
+        self.summary_tokens = count_tokens(self.summary, self.model)
+        self._evicted.extend(evicted)
+        evicted_messages = [entry.entry_id for entry in evicted if entry.message_id]
+        if evicted_messages:
+            self._newest_evicted_message = max(evicted_messages[-1], self._newest_evicted_message or 0)
+        return evicted
+
+    def fold_older_messages(self) -> Optional[int]:
+        """
+        For stores that can only drop the oldest messages: folds the unpinned
+        messages older than the newest evicted one into the summary, and
+        returns how many of the latest messages to replay (None if nothing was
+        evicted). Pinned messages older than that are sent with render_context.
+        """
+        cutoff = self._newest_evicted_message
+        if cutoff is None:
+            return None
+        older = [
+            entry for entry in self.entries
+            if entry.message_id and entry.entry_id < cutoff and not self.is_pinned(entry)
+        ]
+        if older:
+            older_ids = {entry.entry_id for entry in older}
+            self.entries = [entry for entry in self.entries if entry.entry_id not in older_ids]
+            self._message_tokens -= sum(entry.tokens for entry in older)
+            self.summary = self.summarizer(older, self.summary, self.summary_max_tokens)
+            self.summary_tokens = count_tokens(self.summary, self.model)
+        self.replayed_from = cutoff + 1
+        return max(1, sum(1 for entry in self.entries if entry.message_id and entry.entry_id > cutoff))
+
+    def pop_evicted(self) -> List[ContextEntry]:
+        """
+        Returns the entries evicted since the last call, for the caller to remove
+        from wherever the conversation is stored.
+        """
+        evicted, self._evicted = self._evicted, []
+        return evicted
+
+    def render_context(self, include_tool_outputs: bool = True) -> str:
+        """
+        Renders the rolling summary, pinned messages older than the replayed
+        ones and the pinned tool outputs as text that can be sent with the next
+        request.
+        """
+        sections = []
+        if self.summary:
+            sections.append("Summary of earlier conversation:\n" + self.summary)
+        if self.replayed_from is not None:
+            for entry in self.entries:
+                if entry.message_id and entry.entry_id < self.replayed_from:
+                    sections.append(f"Earlier {entry.role} message (pinned):\n{entry.content}")
+        if include_tool_outputs:
+            pinned = [entry for entry in self.entries if entry.role == "tool" and self.is_pinned(entry)]
+            for entry in pinned:
+                sections.append(f"Tool output {entry.tool_call_id or entry.entry_id} (still referenced):\n{entry.content}")
+        return "\n\n".join(sections)
+
+    def _mark_references(self, new_entry: ContextEntry):
+        for entry in self.entries:
+            if entry.role != "tool":
+                continue
+            if entry.tool_call_id and entry.tool_call_id in new_entry.content:
+                entry.last_referenced_turn = self.turn
+            elif len(entry.keywords & new_entry.keywords) >= self.reference_min_terms:
+                entry.last_referenced_turn = self.turn
+
+
+class ContextManagedThread(ConcurrentToolsThread):
+    """
+    A Thread that keeps its conversation inside the recipient agent's
+    max_prompt_tokens with a ContextWindow.
+
+    Messages stay in the OpenAI thread. Each run is sent a last_messages
+    truncation strategy that leaves out everything up to the newest evicted
+    message, and the rolling summary plus still-referenced tool outputs (which
+    the API does not replay from earlier runs) as additional instructions.
+    With delete_evicted, evicted messages are instead deleted from the thread
+    for good before the next run.
+    """
+
+    def __init__(self, agent, recipient_agent, window_options: Optional[Dict] = None,
+                 delete_evicted: bool = False):
+        super().__init__(agent, recipient_agent)
+        self.window_options = window_options or {}
+        self.delete_evicted = delete_evicted
+        self.context_window: Optional[ContextWindow] = None
+        self._window_lock = threading.Lock()
+        self._last_assistant_message_id = None
+
+    @classmethod
+    def from_thread(cls, thread: Thread, window_options: Optional[Dict] = None,
+                    delete_evicted: bool = False) -> "ContextManagedThread":
+        managed = cls(thread.agent, thread.recipient_agent, window_options, delete_evicted)
+        managed.id = thread.id
+        return managed
+
+    def _get_context_window(self, recipient_agent) -> ContextWindow:
+        with self._window_lock:
+            if self.context_window is None:
+                options = dict(self.window_options)
+                options.setdefault("max_prompt_tokens", recipient_agent.max_prompt_tokens or 25000)
+                options.setdefault("model", recipient_agent.model)
+                # Instructions and tool schemas are part of every prompt
+                options.setdefault(
+                    "reserved_tokens",
+                    count_tokens(recipient_agent.instructions or "")
+                    + count_schema_tokens(recipient_agent.get_oai_tools()),
+                )
+                self.context_window = ContextWindow(**options)
+            return self.context_window
+
+    def create_message(self, message, role: str = "user", attachments=None):
+        message_obj = super().create_message(message, role, attachments)
+        window = self._get_context_window(self.recipient_agent)
+        window.add(role, message_text(message), message_id=message_obj.id)
+        evicted = window.pop_evicted()
+        if not self.delete_evicted:
+            return message_obj
+        # No run is active while a message is created, so evicted messages
+        # can be removed from the thread now
+        for entry in evicted:
+            if entry.message_id:
+                try:
+                    self.client.beta.threads.messages.delete(
+                        message_id=entry.message_id, thread_id=self.id
+                    )
+                except Exception as e:
+                    logger.warning("Could not delete evicted message %s: %s", entry.message_id, e)
+        return message_obj
+
+    def submit_tool_outputs(self, tool_outputs, event_handler=None, poll=True):
+        window = self._get_context_window(self.recipient_agent)
+        for tool_output in tool_outputs:
+            window.add("tool", str(tool_output["output"]), tool_call_id=tool_output["tool_call_id"])
+        return super().submit_tool_outputs(tool_outputs, event_handler, poll)
+
+    def _get_last_assistant_message(self):
+        message = super()._get_last_assistant_message()
+        if message.id != self._last_assistant_message_id:
+            self._last_assistant_message_id = message.id
+            window = self._get_context_window(self.recipient_agent)
+            window.add("assistant", message_text(message.content), message_id=message.id)
+        return message
+
+    def _create_run(self, recipient_agent, additional_instructions=None, *args, **kwargs):
+        window = self._get_context_window(recipient_agent)
+        if not self.delete_evicted and not isinstance(recipient_agent, _TruncatedAgent):
+            replayed = window.fold_older_messages()
+            if replayed is not None:
+                recipient_agent = _TruncatedAgent(
+                    recipient_agent, {"type": "last_messages", "last_messages": replayed}
+                )
+        context = window.render_context()
+        if context and context not in (additional_instructions or ""):
+            additional_instructions = "\n\n".join(filter(None, [additional_instructions, context]))
+        return super()._create_run(recipient_agent, additional_instructions, *args, **kwargs)
+
+
+class _TruncatedAgent:
+    """
+    The recipient agent as one run sees it, with its own truncation strategy,
+    so the shared agent is never modified.
+    """
+
+    def __init__(self, agent, truncation_strategy: Dict):
+        self._agent = agent
+        self.truncation_strategy = truncation_strategy
+
+    def __getattr__(self, name):
+        return getattr(self._agent, name)
+
+
+def message_text(content) -> str:
+    """
+    Extracts the text of a message given as a string, a list of content parts
+    (dicts) or a list of OpenAI content blocks.
+    """
+    if isinstance(content, str):
+        return content
+    parts = []
+    for part in content or []:
+        if isinstance(part, dict):
+            if part.get("type") == "text":
+                text = part.get("text")
+                parts.append(text if isinstance(text, str) else (text or {}).get("value", ""))
+        elif getattr(part, "type", None) == "text":
+            parts.append(part.text.value)
+    return "\n".join(parts)
+
+
+def install_context_windows(agency, delete_evicted: bool = False, **window_options):
+    """
+    Replaces every plain Thread of an Agency, including the main user thread,
+    with a ContextManagedThread.
+    """
+    for agent_name, threads in agency.agents_and_threads.items():
+        if agent_name == "main_thread":
+            continue
+        for recipient_name, thread in threads.items():
+            if type(thread) is Thread:
+                threads[recipient_name] = ContextManagedThread.from_thread(thread, window_options, delete_evicted)
+
+    if type(agency.main_thread) is Thread:
+        agency.main_thread = ContextManagedThread.from_thread(agency.main_thread, window_options, delete_evicted)
+        agency.agents_and_threads["main_thread"] = agency.main_thread
+    return agency
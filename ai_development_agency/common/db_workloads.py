@@ -0,0 +1,414 @@
+from array import array
+from datetime import datetime, timezone
+from typing import Dict, List, Optional
+import hashlib
+import json
+import os
+import platform
+import shutil
+import sqlite3
+import tempfile
+import threading
+import time
+import numpy as np
+
+# Two significant digits: 64-128 sub-buckets per power of two, so any
+# recorded latency is reported within 1/64 (1.6%) of its true value
+SUB_BUCKET_BITS = 7
+SUB_BUCKETS = 1 << SUB_BUCKET_BITS
+HALF_BUCKETS = SUB_BUCKETS // 2
+# Up to 2^47 ns (about 39 hours); longer latencies land in the top bucket
+MAX_MAGNITUDE = 40
+BUCKETS = SUB_BUCKETS + MAX_MAGNITUDE * HALF_BUCKETS
+
+PERCENTILES = [50, 90, 95, 99, 99.9]
+
+# Read fraction of the named workload shapes, after the YCSB core workloads
+WORKLOAD_SHAPES = {"read_heavy": 0.95, "mixed": 0.5, "write_heavy": 0.05, "read_only": 1.0}
+DEFAULT_WORKLOAD = {
+    "shape": "read_heavy",
+    "records": 10_000,
+    "operations": 20_000,
+    "value_bytes": 512,
+    "key_distribution": "zipfian",
+    "seed": 0,
+}
+# Accepted range of each numeric workload setting, and of the data loaded
+# (records x value_bytes), so a request cannot exhaust memory or disk
+WORKLOAD_LIMITS = {"records": (1, 1_000_000), "operations": (1, 1_000_000), "value_bytes": (1, 65_536)}
+MAX_DATA_BYTES = 256 * 1024 * 1024
+
+
+class LatencyHistogram:
+    """
+    An HDR-style log-linear latency histogram in nanoseconds.
+
+    Values below 128 get a bucket each; above that, every power of two is
+    split into 64 equal buckets, so precision is relative and a fixed 2.7k
+    counters cover nanoseconds to hours. Percentiles report the highest
+    value equivalent to the bucket they fall in, as HdrHistogram does.
+    """
+
+    def __init__(self):
+        self.counts = np.zeros(BUCKETS, dtype=np.int64)
+        self.min_ns: Optional[int] = None
+        self.max_ns: Optional[int] = None
+        self.total_ns = 0
+
+    @property
+    def count(self) -> int:
+        return int(self.counts.sum())
+
+    def record_many(self, values_ns: np.ndarray):
+        values = np.asarray(values_ns, dtype=np.int64)
+        if not len(values):
+            return
+        values = np.maximum(values, 0)
+        np.add.at(self.counts, bucket_index(values), 1)
+        self.min_ns = int(values.min()) if self.min_ns is None else min(self.min_ns, int(values.min()))
+        self.max_ns = int(values.max()) if self.max_ns is None else max(self.max_ns, int(values.max()))
+        self.total_ns += int(values.sum())
+
+    def percentile(self, p: float) -> Optional[int]:
+        count = self.count
+        if not count:
+            return None
+        target = max(1, int(np.ceil(p / 100 * count)))
+        index = int(np.searchsorted(np.cumsum(self.counts), target))
+        return min(highest_equivalent_value(index), self.max_ns)
+
+    def summary(self) -> Dict:
+        """
+        Count, mean and percentiles in microseconds.
+        """
+        count = self.count
+        if not count:
+            return {"count": 0}
+        return {
+            "count": count,
+            "mean_us": round(self.total_ns / count / 1000, 2),
+            **{f"p{p:g}_us": round(self.percentile(p) / 1000, 2) for p in PERCENTILES},
+            "max_us": round(self.max_ns / 1000, 2),
+        }
+
+    def to_dict(self) -> Dict:
+        nonzero = np.flatnonzero(self.counts)
+        return {
+            "buckets": nonzero.tolist(),
+            "counts": self.counts[nonzero].tolist(),
+            "min_ns": self.min_ns,
+            "max_ns": self.max_ns,
+            "total_ns": self.total_ns,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "LatencyHistogram":
+        histogram = cls()
+        histogram.counts[data["buckets"]] = data["counts"]
+        histogram.min_ns = data["min_ns"]
+        histogram.max_ns = data["max_ns"]
+        histogram.total_ns = data["total_ns"]
+        return histogram
+
+
+def bucket_index(values: np.ndarray) -> np.ndarray:
+    # frexp's exponent is the bit length, exact for values below 2^53
+    bit_length = np.frexp(values.astype(np.float64))[1].astype(np.int64)
+    magnitude = np.clip(bit_length - SUB_BUCKET_BITS, 0, MAX_MAGNITUDE)
+    top = np.minimum(values >> magnitude, SUB_BUCKETS - 1)
+    return np.where(magnitude == 0, values, SUB_BUCKETS + (magnitude - 1) * HALF_BUCKETS + top - HALF_BUCKETS)
+
+
+def highest_equivalent_value(index: int) -> int:
+    if index < SUB_BUCKETS:
+        return index
+    magnitude = (index - SUB_BUCKETS) // HALF_BUCKETS + 1
+    top = (index - SUB_BUCKETS) % HALF_BUCKETS + HALF_BUCKETS
+    return ((top + 1) << magnitude) - 1
+
+
+class SQLiteBackend:
+    """
+    Relational stand-in: documents as JSON text in a SQLite table keyed by
+    an integer primary key, with the task store's WAL settings.
+    """
+    name = "sqlite"
+
+    def __init__(self, directory: str):
+        self._connection = sqlite3.connect(os.path.join(directory, "bench.db"), isolation_level=None)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.execute("CREATE TABLE records (id INTEGER PRIMARY KEY, category INTEGER, body TEXT)")
+
+    def load(self, documents: List[Dict]):
+        with self._connection:
+            self._connection.execute("BEGIN")
+            self._connection.executemany(
+                "INSERT INTO records VALUES (?, ?, ?)",
+                ((d["id"], d["category"], json.dumps(d)) for d in documents),
+            )
+
+    def read(self, key: int) -> Dict:
+        (body,) = self._connection.execute("SELECT body FROM records WHERE id = ?", (key,)).fetchone()
+        return json.loads(body)
+
+    def write(self, document: Dict):
+        # One autocommitted transaction per write
+        self._connection.execute(
+            "INSERT OR REPLACE INTO records VALUES (?, ?, ?)",
+            (document["id"], document["category"], json.dumps(document)),
+        )
+
+    def close(self):
+        self._connection.close()
+
+
+class DocumentBackend:
+    """
+    Document-store stand-in: JSON-encoded documents in process memory with a
+    secondary index on 'category', maintained on every write.
+    """
+    name = "document"
+
+    def __init__(self, directory: str):
+        self._documents: Dict[int, bytes] = {}
+        self._by_category: Dict[int, set] = {}
+
+    def load(self, documents: List[Dict]):
+        for document in documents:
+            self.write(document)
+
+    def read(self, key: int) -> Dict:
+        return json.loads(self._documents[key])
+
+    def write(self, document: Dict):
+        key = document["id"]
+        previous = self._documents.get(key)
+        if previous is not None:
+            self._by_category[json.loads(previous)["category"]].discard(key)
+        self._documents[key] = json.dumps(document).encode("utf-8")
+        self._by_category.setdefault(document["category"], set()).add(key)
+
+    def close(self):
+        self._documents.clear()
+        self._by_category.clear()
+
+
+class LogKeyValueBackend:
+    """
+    Key-value stand-in in the Bitcask style: every write appends the value to
+    a log file and points an in-memory key directory at it; a read is one
+    seek and read. Writes are flushed to the OS but not fsynced, matching
+    SQLite's synchronous=NORMAL between checkpoints.
+    """
+    name = "key_value"
+
+    def __init__(self, directory: str):
+        self._file = open(os.path.join(directory, "bench.log"), "a+b", buffering=0)
+        self._keydir: Dict[int, tuple] = {}
+        self._end = 0
+        # Reads and writes share the file position
+        self._lock = threading.Lock()
+
+    def load(self, documents: List[Dict]):
+        for document in documents:
+            self.write(document)
+
+    def read(self, key: int) -> Dict:
+        offset, length = self._keydir[key]
+        # os.pread would avoid the lock, but it does not exist on Windows
+        with self._lock:
+            self._file.seek(offset)
+            value = self._file.read(length)
+        return json.loads(value)
+
+    def write(self, document: Dict):
+        value = json.dumps(document).encode("utf-8")
+        with self._lock:
+            self._file.write(value)
+            self._keydir[document["id"]] = (self._end, len(value))
+            self._end += len(value)
+
+    def close(self):
+        self._file.close()
+
+
+BACKENDS = {backend.name: backend for backend in (SQLiteBackend, DocumentBackend, LogKeyValueBackend)}
+
+
+def workload_spec(workload: Optional[Dict] = None) -> Dict:
+    """
+    A complete workload from a partial one: 'shape' (read_heavy, mixed,
+    write_heavy, read_only) or an explicit 'read_fraction', plus records,
+    operations, value_bytes, key_distribution (zipfian or uniform) and seed.
+    """
+    spec = {**DEFAULT_WORKLOAD, **(workload or {})}
+    for key, (low, high) in WORKLOAD_LIMITS.items():
+        try:
+            spec[key] = int(spec[key])
+        except (TypeError, ValueError):
+            raise ValueError(f"Workload {key} must be a whole number, got {spec[key]!r}")
+        if not low <= spec[key] <= high:
+            raise ValueError(f"Workload {key} must be between {low} and {high}, got {spec[key]}")
+    if spec["records"] * spec["value_bytes"] > MAX_DATA_BYTES:
+        raise ValueError(f"Workload records x value_bytes must be at most {MAX_DATA_BYTES} bytes")
+    if "read_fraction" not in spec:
+        if spec["shape"] not in WORKLOAD_SHAPES:
+            raise ValueError(f"Unknown workload shape '{spec['shape']}', expected one of {list(WORKLOAD_SHAPES)}")
+        spec["read_fraction"] = WORKLOAD_SHAPES[spec["shape"]]
+    if spec["key_distribution"] not in ("zipfian", "uniform"):
+        raise ValueError("key_distribution must be 'zipfian' or 'uniform'")
+    return spec
+
+
+def operation_plan(spec: Dict):
+    """
+    The keys and read/write choices of a workload, drawn up front from its
+    seed so every backend and every rerun sees the same operations.
+    """
+    rng = np.random.default_rng(spec["seed"])
+    records, operations = spec["records"], spec["operations"]
+    if spec["key_distribution"] == "zipfian":
+        # YCSB's default skew; scrambled so hot keys are spread over the key space
+        weights = 1.0 / np.arange(1, records + 1) ** 0.99
+        keys = rng.permutation(records)[rng.choice(records, size=operations, p=weights / weights.sum())]
+    else:
+        keys = rng.integers(0, records, size=operations)
+    reads = rng.random(operations) < spec["read_fraction"]
+    return keys.tolist(), reads.tolist()
+
+
+def run_workload(backend_name: str, workload: Optional[Dict] = None) -> Dict:
+    """
+    Loads a fresh backend with the workload's records, then times each
+    operation individually. Returns throughput and read/write histograms.
+    """
+    spec = workload_spec(workload)
+    keys, reads = operation_plan(spec)
+    payload = "x" * spec["value_bytes"]
+    documents = [{"id": key, "category": key % 16, "version": 0, "payload": payload} for key in range(spec["records"])]
+
+    directory = tempfile.mkdtemp(prefix="agency_db_bench_")
+    backend = BACKENDS[backend_name](directory)
+    try:
+        start = time.perf_counter()
+        backend.load(documents)
+        load_seconds = time.perf_counter() - start
+
+        read_ns, write_ns = array("q"), array("q")
+        clock = time.perf_counter_ns
+        started = clock()
+        for version, (key, is_read) in enumerate(zip(keys, reads), start=1):
+            if is_read:
+                before = clock()
+                backend.read(key)
+                read_ns.append(clock() - before)
+            else:
+                document = {"id": key, "category": key % 16, "version": version, "payload": payload}
+                before = clock()
+                backend.write(document)
+                write_ns.append(clock() - before)
+        elapsed_ns = clock() - started
+    finally:
+        backend.close()
+        shutil.rmtree(directory, ignore_errors=True)
+
+    read_histogram, write_histogram = LatencyHistogram(), LatencyHistogram()
+    read_histogram.record_many(np.frombuffer(read_ns, dtype=np.int64))
+    write_histogram.record_many(np.frombuffer(write_ns, dtype=np.int64))
+    return {
+        "backend": backend_name,
+        "workload": spec,
+        "load_records_per_second": int(spec["records"] / load_seconds) if load_seconds else None,
+        "throughput_ops_per_second": int(spec["operations"] / (elapsed_ns / 1e9)),
+        "read": read_histogram,
+        "write": write_histogram,
+    }
+
+
+def environment() -> Dict:
+    """
+    What the numbers depend on besides the workload; results are only reused
+    on a matching environment.
+    """
+    return {
+        "machine": platform.machine(),
+        "system": platform.system(),
+        "python": platform.python_version(),
+        "sqlite": sqlite3.sqlite_version,
+        "cpus": os.cpu_count(),
+    }
+
+
+class BenchmarkResults:
+    """
+    Persisted workload results in SQLite, keyed by backend, workload and
+    environment, so a measurement is taken once and cited afterwards.
+    """
+
+    def __init__(self, path: str = ":memory:"):
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        with self._lock, self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS results (key TEXT PRIMARY KEY, backend TEXT NOT NULL, "
+                "workload TEXT NOT NULL, environment TEXT NOT NULL, measured_at TEXT NOT NULL, result TEXT NOT NULL)"
+            )
+
+    def measure(self, backend_name: str, workload: Optional[Dict] = None, rerun: bool = False) -> Dict:
+        """
+        The stored result for this backend, workload and environment, running
+        the workload first when there is none (or rerun is set).
+        """
+        spec = workload_spec(workload)
+        env = environment()
+        key = hashlib.sha256(
+            json.dumps([backend_name, spec, env], sort_keys=True).encode("utf-8")
+        ).hexdigest()
+        with self._lock:
+            if not rerun:
+                row = self._connection.execute("SELECT result FROM results WHERE key = ?", (key,)).fetchone()
+                if row is not None:
+                    return _decode(json.loads(row[0]))
+
+        result = run_workload(backend_name, spec)
+        result["environment"] = env
+        result["measured_at"] = datetime.now(timezone.utc).isoformat(timespec="seconds")
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?, ?)",
+                (key, backend_name, json.dumps(spec, sort_keys=True), json.dumps(env, sort_keys=True),
+                 result["measured_at"], json.dumps(_encode(result))),
+            )
+        return result
+
+    def close(self):
+        with self._lock:
+            self._connection.close()
+
+
+def _encode(result: Dict) -> Dict:
+    return {**result, "read": result["read"].to_dict(), "write": result["write"].to_dict()}
+
+
+def _decode(result: Dict) -> Dict:
+    return {
+        **result,
+        "read": LatencyHistogram.from_dict(result["read"]),
+        "write": LatencyHistogram.from_dict(result["write"]),
+    }
+
+
+_results: Optional[BenchmarkResults] = None
+_results_lock = threading.Lock()
+
+
+def get_benchmark_results() -> BenchmarkResults:
+    """
+    The agency's benchmark results, opened on first use at AGENCY_DB_BENCHMARK_PATH.
+    """
+    global _results
+    with _results_lock:
+        if _results is None:
+            _results = BenchmarkResults(os.getenv("AGENCY_DB_BENCHMARK_PATH", "db_benchmarks.db"))
+        return _results
@@ -0,0 +1,153 @@
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+import copy
+import hashlib
+import json
+import os
+import threading
+
+# Keys that identify the items of a list of dicts, so list diffs match items
+# by identity rather than by position; a tuple identifies by several keys.
+IDENTITY_KEYS = ["name", "entry", "stage", "layer", "component", "hop", ("from", "to")]
+
+_MISSING = object()
+
+
+class DesignSectionCache:
+    """
+    Design sections cached by the requirement fields they read, and the last
+    document built under each design id.
+
+    A section's key covers its design type, the tool's code version and the
+    values of only the fields it depends on, so a run after one field
+    changed finds every section that does not read that field cached and
+    recomputes the rest. A section with no declared dependencies depends on
+    every field. Sections are kept in an LRU of max_entries.
+    """
+
+    def __init__(self, max_entries: int = 1024):
+        self.max_entries = max_entries
+        self._sections: "OrderedDict[str, Any]" = OrderedDict()
+        self._documents: Dict[Tuple[str, str], Tuple[Dict, Dict]] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def section_key(design_type: str, section: str, version: str, inputs: Dict,
+                    dependencies: Optional[Iterable[str]]) -> str:
+        if dependencies is not None:
+            inputs = {field: inputs.get(field) for field in dependencies}
+        material = json.dumps([design_type, section, version, inputs], sort_keys=True, default=str)
+        return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+    def section(self, key: str, compute: Callable[[], Any]) -> Tuple[Any, bool]:
+        """
+        The cached value under key, or compute()'s result stored under it;
+        and whether it was computed.
+        """
+        with self._lock:
+            if key in self._sections:
+                self._sections.move_to_end(key)
+                return self._sections[key], False
+        value = compute()
+        with self._lock:
+            self._sections[key] = value
+            while len(self._sections) > self.max_entries:
+                self._sections.popitem(last=False)
+        return value, True
+
+    def previous(self, design_id: str, design_type: str) -> Optional[Tuple[Dict, Dict]]:
+        """
+        The inputs and document of the last design built under this id and type.
+        """
+        with self._lock:
+            return self._documents.get((design_id, design_type))
+
+    def remember(self, design_id: str, design_type: str, inputs: Dict, document: Dict):
+        # A snapshot, so a caller editing its requirements in place still diffs against what was built
+        inputs = copy.deepcopy(inputs)
+        with self._lock:
+            self._documents[(design_id, design_type)] = (inputs, document)
+
+    def clear(self):
+        with self._lock:
+            self._sections.clear()
+            self._documents.clear()
+
+
+def changed_fields(old: Dict, new: Dict) -> List[str]:
+    """
+    Top-level fields added, removed or changed between two inputs.
+    """
+    return sorted(field for field in set(old) | set(new) if old.get(field, _MISSING) != new.get(field, _MISSING))
+
+
+def structural_diff(old: Any, new: Any) -> List[Dict]:
+    """
+    JSON-Patch-style operations turning old into new: {'op': 'add' |
+    'remove' | 'replace', 'path', 'value', 'old'}. Dicts are compared key by
+    key, and lists of dicts that share an identity key (IDENTITY_KEYS)
+    item by item; other lists are compared by position when their lengths
+    match, and replaced whole otherwise. Paths are JSON Pointers, with a
+    list item named by its identity where it has one.
+    """
+    operations: List[Dict] = []
+    _diff(old, new, "", operations)
+    return operations
+
+
+def _diff(old: Any, new: Any, path: str, operations: List[Dict]):
+    if isinstance(old, dict) and isinstance(new, dict):
+        for key in old:
+            if key not in new:
+                operations.append({"op": "remove", "path": _join(path, key), "old": old[key]})
+        for key in new:
+            if key not in old:
+                operations.append({"op": "add", "path": _join(path, key), "value": new[key]})
+            else:
+                _diff(old[key], new[key], _join(path, key), operations)
+    elif isinstance(old, list) and isinstance(new, list):
+        identity = _identity(old + new)
+        if identity is not None:
+            old_items = {_identify(item, identity): item for item in old}
+            new_items = {_identify(item, identity): item for item in new}
+            if len(old_items) == len(old) and len(new_items) == len(new):
+                for name, item in old_items.items():
+                    if name not in new_items:
+                        operations.append({"op": "remove", "path": _join(path, name), "old": item})
+                for name, item in new_items.items():
+                    if name not in old_items:
+                        operations.append({"op": "add", "path": _join(path, name), "value": item})
+                    else:
+                        _diff(old_items[name], item, _join(path, name), operations)
+                return
+        if len(old) == len(new):
+            for index, (old_item, new_item) in enumerate(zip(old, new)):
+                _diff(old_item, new_item, _join(path, index), operations)
+        elif old != new:
+            operations.append({"op": "replace", "path": path or "/", "old": old, "value": new})
+    elif old != new:
+        operations.append({"op": "replace", "path": path or "/", "old": old, "value": new})
+
+
+def _identity(items: List) -> Optional[Any]:
+    if not items or not all(isinstance(item, dict) for item in items):
+        return None
+    for key in IDENTITY_KEYS:
+        keys = key if isinstance(key, tuple) else (key,)
+        if all(all(k in item for k in keys) for item in items):
+            return key
+    return None
+
+
+def _identify(item: Dict, identity: Any) -> str:
+    if isinstance(identity, tuple):
+        return "->".join(str(item[key]) for key in identity)
+    return str(item[identity])
+
+
+def _join(path: str, segment: Any) -> str:
+    # JSON Pointer escaping (RFC 6901)
+    return f"{path}/{str(segment).replace('~', '~0').replace('/', '~1')}"
+
+
+design_cache = DesignSectionCache(max_entries=int(os.getenv("AGENCY_DESIGN_CACHE_SIZE", "1024")))
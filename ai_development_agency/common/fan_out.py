@@ -0,0 +1,211 @@
+from agency_swarm.tools import BaseTool
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from enum import Enum
+from pydantic import BaseModel, Field, field_validator
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+import inspect
+import logging
+import os
+import threading
+import time
+from .tool_output import encode_output
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_CONCURRENCY = int(os.getenv("AGENCY_FAN_OUT_CONCURRENCY", "8"))
+DEFAULT_TIMEOUT = float(os.getenv("AGENCY_FAN_OUT_TIMEOUT", "300"))
+
+# How often the coordinator re-checks deadlines of calls that started late
+POLL_INTERVAL = 0.25
+
+
+@dataclass
+class FanOutReply:
+    recipient: str
+    status: str  # "ok", "timeout" or "error"
+    reply: Optional[str]
+    seconds: float
+
+
+def fan_out_calls(calls: List[Tuple[str, Callable[[], Any]]], max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+                  timeout: Optional[float] = DEFAULT_TIMEOUT,
+                  on_timeout: Optional[Callable[[str], None]] = None) -> List[FanOutReply]:
+    """
+    Runs (recipient, call) pairs concurrently, at most max_concurrency at a time,
+    and returns their replies in the order the calls were given.
+
+    The timeout applies to each call from the moment it starts, so calls queued
+    behind the concurrency limit are not penalized. A call that times out is
+    reported as such and on_timeout(recipient) is invoked so the caller can
+    cancel the underlying work; Python threads themselves cannot be stopped.
+    """
+    replies: List[Optional[FanOutReply]] = [None] * len(calls)
+    if not calls:
+        return []
+
+    started: Dict[int, float] = {}
+
+    def invoke(index: int, call: Callable[[], Any]):
+        started[index] = time.monotonic()
+        return _drain(call())
+
+    executor = ThreadPoolExecutor(max_workers=max(1, min(max_concurrency, len(calls))),
+                                  thread_name_prefix="fan-out")
+    futures = {executor.submit(invoke, index, call): index for index, (_, call) in enumerate(calls)}
+    pending = set(futures)
+    try:
+        while pending:
+            wait_for = None
+            if timeout is not None:
+                now = time.monotonic()
+                deadlines = [started[futures[f]] + timeout for f in pending if futures[f] in started]
+                wait_for = min([POLL_INTERVAL] + [max(0.0, d - now) for d in deadlines])
+            done, pending = wait(pending, timeout=wait_for, return_when=FIRST_COMPLETED)
+
+            for future in done:
+                index = futures[future]
+                recipient = calls[index][0]
+                seconds = round(time.monotonic() - started.get(index, time.monotonic()), 3)
+                try:
+                    replies[index] = FanOutReply(recipient, "ok", future.result(), seconds)
+                except Exception as e:
+                    replies[index] = FanOutReply(recipient, "error", f"Error: {e}", seconds)
+
+            if timeout is None:
+                continue
+            now = time.monotonic()
+            for future in list(pending):
+                index = futures[future]
+                if index in started and now - started[index] >= timeout:
+                    pending.discard(future)
+                    recipient = calls[index][0]
+                    replies[index] = FanOutReply(recipient, "timeout", None, round(now - started[index], 3))
+                    if on_timeout:
+                        on_timeout(recipient)
+    finally:
+        # Do not wait for timed-out calls; they finish (or get cancelled) in the background
+        executor.shutdown(wait=False)
+
+    return replies
+
+
+def _drain(output: Any) -> Any:
+    # Thread.get_completion is a generator that returns the final reply
+    if not inspect.isgenerator(output):
+        return output
+    try:
+        while True:
+            next(output)
+    except StopIteration as e:
+        return e.value
+
+
+def create_fan_out_tool(agent, recipient_agents: List, agents_and_threads: Dict,
+                        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+                        timeout: Optional[float] = DEFAULT_TIMEOUT) -> type:
+    """
+    Creates a FanOutMessage tool for agent, restricted to the recipients its
+    SendMessage tool can reach, that consults several of them at once.
+    """
+    recipient_names = [recipient.name for recipient in recipient_agents]
+    recipients = Enum("recipient", {name: name for name in recipient_names})
+    agent_descriptions = "".join(
+        f"{recipient.name}: {recipient.description}\n" for recipient in recipient_agents if recipient.description
+    )
+
+    class Delegation(BaseModel):
+        recipient: recipients = Field(..., description=agent_descriptions)
+        message: str = Field(
+            ...,
+            description="The task for this recipient, including all the context it needs from the conversation."
+        )
+
+    class FanOutMessage(BaseTool):
+        """
+        Sends independent tasks to several agents at once and returns all their replies,
+        in the order the tasks were given, once every agent has answered or timed out.
+        Use it instead of consecutive SendMessage calls when the tasks do not depend on
+        each other's results, e.g. consulting every specialist on a new project. Each
+        recipient may appear only once.
+        """
+
+        delegations: List[Delegation] = Field(
+            ...,
+            description="One task per recipient agent"
+        )
+
+        additional_instructions: Optional[str] = Field(
+            None,
+            description="Context or instructions from the conversation shared with every recipient"
+        )
+
+        @field_validator("delegations")
+        @classmethod
+        def check_recipients(cls, value):
+            names = [delegation.recipient.value for delegation in value]
+            if not names:
+                raise ValueError("At least one delegation is required.")
+            duplicates = sorted({name for name in names if names.count(name) > 1})
+            if duplicates:
+                raise ValueError(f"Each recipient can only be called once, got duplicates: {duplicates}")
+            return value
+
+        def run(self) -> str:
+            caller = self._caller_agent.name
+            threads = {d.recipient.value: agents_and_threads[caller][d.recipient.value] for d in self.delegations}
+            parent_run_id = self._tool_call.id if self._tool_call else None
+
+            calls = [
+                (d.recipient.value, _completion(threads[d.recipient.value], d.message,
+                                                self.additional_instructions, parent_run_id))
+                for d in self.delegations
+            ]
+            replies = fan_out_calls(calls, max_concurrency=max_concurrency, timeout=timeout,
+                                    on_timeout=lambda recipient: _cancel_in_background(threads[recipient]))
+            return encode_output([
+                {"recipient": r.recipient, "status": r.status, "seconds": r.seconds, "reply": r.reply}
+                for r in replies
+            ])
+
+    FanOutMessage._caller_agent = agent
+    return FanOutMessage
+
+
+def _completion(thread, message: str, additional_instructions: Optional[str], parent_run_id: Optional[str]):
+    return lambda: thread.get_completion(
+        message=message,
+        additional_instructions=additional_instructions,
+        parent_run_id=parent_run_id,
+    )
+
+
+def _cancel_in_background(thread):
+    def cancel():
+        try:
+            thread.cancel_run()
+        except Exception as e:
+            logger.warning("Could not cancel timed-out run on thread %s: %s", getattr(thread, "id", None), e)
+
+    threading.Thread(target=cancel, daemon=True).start()
+
+
+def install_fan_out(agency, agent_names: Iterable[str],
+                    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+                    timeout: Optional[float] = DEFAULT_TIMEOUT) -> List[str]:
+    """
+    Gives each named agent a FanOutMessage tool over the recipients it can
+    already message. Agents with fewer than two recipients are skipped. Returns
+    the names of the agents that got the tool.
+    """
+    installed = []
+    for name in agent_names:
+        threads = agency.agents_and_threads.get(name, {})
+        if len(threads) < 2:
+            continue
+        caller = threads[next(iter(threads))].agent
+        recipient_agents = [thread.recipient_agent for thread in threads.values()]
+        caller.add_tool(create_fan_out_tool(caller, recipient_agents, agency.agents_and_threads,
+                                            max_concurrency=max_concurrency, timeout=timeout))
+        installed.append(name)
+    return installed
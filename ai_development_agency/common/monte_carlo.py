@@ -0,0 +1,136 @@
+from typing import Dict, List, Optional
+import numpy as np
+from .scheduling import TaskGraph, parse_duration
+
+DEFAULT_TRIALS = 100_000
+DEFAULT_SEED = 0
+# Trials per vectorized pass; bounds memory at tasks x chunk_size floats
+DEFAULT_CHUNK_SIZE = 10_000
+PERCENTILES = [50, 80, 95]
+
+# Spread around the most likely duration when a task gives no range
+DEFAULT_OPTIMISTIC = 0.8
+DEFAULT_PESSIMISTIC = 1.5
+
+
+def _triangular(rng: np.random.Generator, low: np.ndarray, mode: np.ndarray, high: np.ndarray,
+                size: int) -> np.ndarray:
+    """
+    Samples a (len(mode), size) float32 matrix of triangular draws by inverse
+    transform, one row per task so that each task's trials are contiguous.
+    Rows without a spread (low == high) stay at their mode.
+
+    float32 halves memory traffic and is far more precise than the estimates
+    being sampled; this is about 2.5x faster than Generator.triangular.
+    """
+    samples = np.repeat(mode.astype(np.float32)[:, None], size, axis=1)
+    spread = high > low
+    if not spread.any():
+        return samples
+
+    a = low[spread].astype(np.float32)[:, None]
+    c = mode[spread].astype(np.float32)[:, None]
+    b = high[spread].astype(np.float32)[:, None]
+    u = rng.random((int(spread.sum()), size), dtype=np.float32)
+    below_mode = np.sqrt(u * ((b - a) * (c - a)))
+    below_mode += a
+    above_mode = np.sqrt((1 - u) * ((b - a) * (b - c)))
+    np.subtract(b, above_mode, out=above_mode)
+    samples[spread] = np.where(u < (c - a) / (b - a), below_mode, above_mode)
+    return samples
+
+
+def _range(task: Dict, key: str, value: float, optimistic: float, pessimistic: float, parse=float):
+    if key in task:
+        low, high = (parse(v) for v in task[key])
+    else:
+        low, high = value * optimistic, value * pessimistic
+    return min(low, value), max(high, value)
+
+
+def simulate_project(tasks: List[Dict], trials: int = DEFAULT_TRIALS, seed: Optional[int] = DEFAULT_SEED,
+                     chunk_size: int = DEFAULT_CHUNK_SIZE, daily_rate: Optional[float] = None,
+                     target_days: Optional[float] = None, budget: Optional[float] = None,
+                     start_date: Optional[str] = None) -> Dict:
+    """
+    Monte Carlo schedule and cost risk over a task DAG.
+
+    Each task's duration is drawn from a triangular distribution over its
+    'duration_range' [optimistic, pessimistic] (default 0.8x to 1.5x its
+    'duration'), and its cost from its 'cost' and 'cost_range' plus its (or the
+    project's) daily rate times the sampled duration. Every chunk of trials is
+    propagated through the DAG in one vectorized pass in topological order.
+
+    Returns P50/P80/P95 of the project duration (and completion date when a
+    start date is given) and of the total cost, plus the probability of
+    meeting target_days and budget when they are given.
+    """
+    if trials < 1:
+        raise ValueError(f"Invalid number of trials {trials}, expected at least 1")
+    graph = TaskGraph.from_tasks(tasks).schedule()
+    by_id = {task.get("id") or task["name"]: task for task in tasks}
+    order = graph.order
+    index = {task_id: i for i, task_id in enumerate(order)}
+    predecessors = [np.array([index[p] for p in graph.predecessors[t]], dtype=np.intp) for t in order]
+
+    mode = np.array([graph.durations[t] for t in order])
+    duration_ranges = [
+        _range(by_id[t], "duration_range", graph.durations[t], DEFAULT_OPTIMISTIC, DEFAULT_PESSIMISTIC, parse_duration)
+        for t in order
+    ]
+    low = np.array([r[0] for r in duration_ranges])
+    high = np.array([r[1] for r in duration_ranges])
+
+    fixed_cost = np.array([float(by_id[t].get("cost", 0)) for t in order])
+    cost_ranges = [_range(by_id[t], "cost_range", fixed_cost[i], 1.0, 1.0) for i, t in enumerate(order)]
+    cost_low = np.array([r[0] for r in cost_ranges])
+    cost_high = np.array([r[1] for r in cost_ranges])
+    rates = np.array([float(by_id[t].get("daily_rate", daily_rate or 0)) for t in order])
+    has_costs = bool(fixed_cost.any() or rates.any())
+
+    rng = np.random.default_rng(seed)
+    durations = np.empty(trials)
+    costs = np.empty(trials)
+    for chunk_start in range(0, trials, chunk_size):
+        size = min(chunk_size, trials - chunk_start)
+        sampled = _triangular(rng, low, mode, high, size)
+
+        # Finish times, task by task in topological order, all trials at once
+        finish = np.empty_like(sampled)
+        for i, preds in enumerate(predecessors):
+            if len(preds) == 0:
+                finish[i] = sampled[i]
+            elif len(preds) == 1:
+                np.add(finish[preds[0]], sampled[i], out=finish[i])
+            else:
+                np.add(finish[preds].max(axis=0), sampled[i], out=finish[i])
+
+        chunk = slice(chunk_start, chunk_start + size)
+        durations[chunk] = finish.max(axis=0)
+        if has_costs:
+            costs[chunk] = _triangular(rng, cost_low, fixed_cost, cost_high, size).sum(axis=0) + rates.astype(np.float32) @ sampled
+
+    result = {
+        "trials": trials,
+        "seed": seed,
+        "duration_days": _distribution(durations),
+    }
+    if start_date:
+        result["completion_date"] = {
+            key: str(np.busday_offset(np.datetime64(start_date, "D"), int(np.ceil(days)), roll="forward"))
+            for key, days in result["duration_days"].items() if key.startswith("p")
+        }
+    if target_days is not None:
+        result["on_time_probability"] = round(float((durations <= target_days).mean()), 4)
+    if has_costs:
+        result["cost"] = _distribution(costs)
+        if budget is not None:
+            result["on_budget_probability"] = round(float((costs <= budget).mean()), 4)
+    return result
+
+
+def _distribution(samples: np.ndarray) -> Dict[str, float]:
+    values = np.percentile(samples, PERCENTILES)
+    summary = {f"p{p}": round(float(v), 2) for p, v in zip(PERCENTILES, values)}
+    summary["mean"] = round(float(samples.mean()), 2)
+    return summary
@@ -0,0 +1,236 @@
+from array import array
+from typing import Dict, List, Optional, Tuple
+import math
+import numpy as np
+
+SECONDS_PER_DAY = 86400
+
+COMPLETED = "completed"
+STARTED = "in_progress"
+# A task moving from one of these back to active work is rework
+REWORK_FROM = ("review", "completed")
+REWORK_TO = ("assigned", "in_progress")
+
+LEAD_TIME_PERCENTILES = [50, 85, 95]
+THROUGHPUT_WINDOW_DAYS = 28
+
+
+class MemberColumns:
+    """
+    One member's (or team's) completed tasks as parallel columns (completion time, lead
+    time, cycle time, estimate error), one row per task, written as completions are
+    logged. Reviews read the columns as NumPy views without copying them.
+    """
+
+    def __init__(self):
+        # Row of each task number, and the task number in each row
+        self.rows: Dict[int, int] = {}
+        self.tasks = array("q")
+        self.completed_at = array("d")
+        self.lead_days = array("d")
+        self.cycle_days = array("d")
+        # actual cycle time in working days / estimate - 1, NaN for tasks
+        # without an estimate
+        self.estimate_error = array("d")
+        self.rework = 0
+
+    def put(self, task: int, completed_at: float, lead_days: float, cycle_days: float, estimate_error: float):
+        """
+        Appends the task's row, or overwrites it when the task was completed before.
+        """
+        row = self.rows.get(task)
+        if row is None:
+            self.rows[task] = len(self.tasks)
+            self.tasks.append(task)
+            self.completed_at.append(completed_at)
+            self.lead_days.append(lead_days)
+            self.cycle_days.append(cycle_days)
+            self.estimate_error.append(estimate_error)
+            return
+        self.completed_at[row] = completed_at
+        self.lead_days[row] = lead_days
+        self.cycle_days[row] = cycle_days
+        self.estimate_error[row] = estimate_error
+
+    def remove(self, task: int):
+        """
+        Drops the task's row, moving the last row into its place.
+        """
+        row = self.rows.pop(task, None)
+        if row is None:
+            return
+        last = len(self.tasks) - 1
+        if row != last:
+            moved = self.tasks[last]
+            self.rows[moved] = row
+            for column in (self.tasks, self.completed_at, self.lead_days, self.cycle_days, self.estimate_error):
+                column[row] = column[last]
+        for column in (self.tasks, self.completed_at, self.lead_days, self.cycle_days, self.estimate_error):
+            column.pop()
+
+    def column(self, name: str) -> np.ndarray:
+        return np.frombuffer(getattr(self, name), dtype=np.float64)
+
+
+class PerformanceRollup:
+    """
+    Per-project, per-member delivery statistics materialized from the task
+    store's event log.
+
+    Task creation and start times and estimates are kept in columns indexed
+    by task number, so apply() is O(1): a completion writes one row to its
+    assignee's MemberColumns and a task sent back from review or reopened
+    after completion counts as rework for whoever had it. Completing a
+    reopened task again replaces its earlier row, so every task is counted
+    once. Each row also goes
+    to its project's team columns and to the columns for everyone, so a
+    member or team review reads a single set of columns.
+
+    Reviews read the columns through buffer views, which must not outlive
+    the call; TaskStore.performance_review() runs them under the store lock
+    so no event is appended meanwhile.
+    """
+
+    def __init__(self):
+        self.last_seq = 0
+        self.members: Dict[str, Dict[str, MemberColumns]] = {}
+        self.teams: Dict[str, MemberColumns] = {}
+        self.everyone = MemberColumns()
+        self._created_at = array("d")
+        self._started_at = array("d")
+        self._estimate_days = array("d")
+        # Project and assignee each completed task's row was written for
+        self._completed_by: Dict[int, Tuple[str, str]] = {}
+
+    def apply(self, event: Dict):
+        number = event["task_id"]
+        self._grow(number)
+        if math.isnan(self._created_at[number]):
+            self._created_at[number] = event["at"]
+        estimate = event["estimate_days"]
+        # Logs written before estimates were coerced may hold them as text
+        if event["old_status"] is None and isinstance(estimate, (int, float)) and estimate > 0:
+            self._estimate_days[number] = estimate
+
+        old_status, new_status = event["old_status"], event["new_status"]
+        if new_status == STARTED and math.isnan(self._started_at[number]):
+            self._started_at[number] = event["at"]
+        if old_status in REWORK_FROM and new_status in REWORK_TO and event["old_assignee"]:
+            for columns in self._columns(event["project_id"], event["old_assignee"]):
+                columns.rework += 1
+        if new_status == COMPLETED and old_status != COMPLETED:
+            self._complete(number, event)
+        self.last_seq = event["seq"]
+
+    def review(self, member: Optional[str] = None, project_id: Optional[str] = None,
+               now: Optional[float] = None) -> Optional[Dict]:
+        """
+        Throughput, lead-time distribution, estimate accuracy and rework rate
+        for one member (or the whole team when member is None), in one project
+        or across all of them. None when nobody in scope has completed a task.
+        """
+        selected = self._select(member, project_id)
+        if not selected:
+            return None
+        completed_at = _concatenate(selected, "completed_at")
+        if not len(completed_at):
+            return None
+        lead_days = _concatenate(selected, "lead_days")
+        cycle_days = _concatenate(selected, "cycle_days")
+        estimate_error = _concatenate(selected, "estimate_error")
+        estimated = estimate_error[~np.isnan(estimate_error)]
+        rework = sum(columns.rework for columns in selected)
+
+        now = completed_at.max() if now is None else now
+        recent = int(np.count_nonzero(completed_at >= now - THROUGHPUT_WINDOW_DAYS * SECONDS_PER_DAY))
+        percentiles = np.percentile(lead_days, LEAD_TIME_PERCENTILES)
+        return {
+            "tasks_completed": len(completed_at),
+            "throughput_per_week": round(recent / THROUGHPUT_WINDOW_DAYS * 7, 2),
+            "lead_time_days": {
+                "mean": round(float(lead_days.mean()), 2),
+                **{f"p{p}": round(float(value), 2) for p, value in zip(LEAD_TIME_PERCENTILES, percentiles)},
+            },
+            "cycle_time_days": {"mean": round(float(cycle_days.mean()), 2)},
+            "estimate_accuracy": {
+                "tasks_estimated": len(estimated),
+                # Positive bias means tasks take longer than estimated
+                "bias": round(float(estimated.mean()), 3) if len(estimated) else None,
+                "mean_absolute_error": round(float(np.abs(estimated).mean()), 3) if len(estimated) else None,
+                "within_20_percent": round(float(np.mean(np.abs(estimated) <= 0.2)), 3) if len(estimated) else None,
+            },
+            "rework_rate": round(rework / len(completed_at), 3),
+        }
+
+    def _complete(self, number: int, event: Dict):
+        at = event["at"]
+        started_at = self._started_at[number]
+        lead_days = (at - self._created_at[number]) / SECONDS_PER_DAY
+        cycle_days = (at - started_at) / SECONDS_PER_DAY if not math.isnan(started_at) else lead_days
+        estimate = self._estimate_days[number]
+        # Estimates are in working days, so weekends do not count against them
+        estimate_error = (
+            _working_days(started_at if not math.isnan(started_at) else self._created_at[number], at) / estimate - 1
+            if not math.isnan(estimate) else math.nan
+        )
+
+        completed_by = (event["project_id"], event["new_assignee"])
+        columns = self._columns(*completed_by)
+        previous = self._completed_by.get(number)
+        if previous is not None and previous != completed_by:
+            for earlier in self._columns(*previous):
+                if not any(earlier is current for current in columns):
+                    earlier.remove(number)
+        self._completed_by[number] = completed_by
+        for current in columns:
+            current.put(number, at, lead_days, cycle_days, estimate_error)
+
+    def _columns(self, project_id: str, member: str) -> List[MemberColumns]:
+        members = self.members.setdefault(project_id, {})
+        if member not in members:
+            members[member] = MemberColumns()
+        if project_id not in self.teams:
+            self.teams[project_id] = MemberColumns()
+        return [members[member], self.teams[project_id], self.everyone]
+
+    def _select(self, member: Optional[str], project_id: Optional[str]) -> List[MemberColumns]:
+        if member is None:
+            if project_id is None:
+                return [self.everyone]
+            return [self.teams[project_id]] if project_id in self.teams else []
+        projects = [project_id] if project_id is not None else list(self.members)
+        return [self.members[p][member] for p in projects if member in self.members.get(p, {})]
+
+    def _grow(self, number: int):
+        missing = number + 1 - len(self._created_at)
+        if missing > 0:
+            padding = array("d", [math.nan]) * missing
+            self._created_at.extend(padding)
+            self._started_at.extend(padding)
+            self._estimate_days.extend(padding)
+
+
+def _working_days(start: float, end: float) -> float:
+    """
+    Monday-to-Friday days between two Unix timestamps (UTC), with fractions
+    of a day for partial days.
+    """
+    start_day, end_day = int(start // SECONDS_PER_DAY), int(end // SECONDS_PER_DAY)
+    weeks, extra = divmod(end_day - start_day, 7)
+    days = float(weeks * 5 + sum(_is_weekday(start_day + i) for i in range(extra)))
+    if _is_weekday(start_day):
+        days -= start % SECONDS_PER_DAY / SECONDS_PER_DAY
+    if _is_weekday(end_day):
+        days += end % SECONDS_PER_DAY / SECONDS_PER_DAY
+    return days
+
+
+def _is_weekday(day: int) -> bool:
+    # Day 0, 1970-01-01, was a Thursday
+    return (day + 3) % 7 < 5
+
+
+def _concatenate(selected, name: str) -> np.ndarray:
+    if len(selected) == 1:
+        return selected[0].column(name)
+    return np.concatenate([columns.column(name) for columns in selected])
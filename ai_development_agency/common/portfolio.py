@@ -0,0 +1,72 @@
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+import multiprocessing
+import os
+
+# Worker processes for batch analyses; 0 uses one per CPU
+PORTFOLIO_WORKERS = int(os.getenv("AGENCY_PORTFOLIO_WORKERS", "0")) or os.cpu_count() or 1
+
+# Precomputation shared by every job, installed once per worker process
+_shared: Dict[str, Any] = {}
+
+
+def _install_shared(shared: Dict[str, Any]):
+    global _shared
+    _shared = shared
+
+
+def _call_with_shared(worker: Callable[[Any, Dict[str, Any]], Any], item: Any) -> Any:
+    return worker(item, _shared)
+
+
+def run_portfolio(worker: Callable[[Any, Dict[str, Any]], Any], items: Sequence[Any],
+                  shared: Optional[Dict[str, Any]] = None, max_workers: Optional[int] = None) -> List[Any]:
+    """
+    Runs worker(item, shared) for every item in a process pool and returns the
+    results in order.
+
+    worker must be a module-level function so it can be pickled. shared holds
+    the precomputation common to all items; it is sent to each worker process
+    once, when the process starts, rather than with every item. Small batches,
+    or max_workers=1, run in this process.
+
+    Workers are spawned rather than forked: tools run on the agency's thread
+    pool, and a fork taken while another thread holds a lock would leave that
+    lock held in the child.
+    """
+    shared = shared or {}
+    max_workers = min(max_workers or PORTFOLIO_WORKERS, len(items))
+    if max_workers <= 1:
+        return [worker(item, shared) for item in items]
+
+    # A few chunks per worker keeps them busy without one item per round trip
+    chunksize = max(1, len(items) // (max_workers * 4))
+    with ProcessPoolExecutor(max_workers, mp_context=multiprocessing.get_context("spawn"),
+                             initializer=_install_shared, initargs=(shared,)) as executor:
+        return list(executor.map(partial(_call_with_shared, worker), items, chunksize=chunksize))
+
+
+def columnar_summary(rows: List[Dict[str, Any]], columns: List[str],
+                     rank_by: List[Tuple[str, bool]]) -> Dict[str, List[Any]]:
+    """
+    Ranks rows and lays them out as one list per column, plus a 'rank' column.
+
+    rank_by is a list of (column, descending) pairs, applied in order; rows
+    missing a ranking value sort after those that have one.
+    """
+    def sort_key(row: Dict[str, Any]):
+        key = []
+        for column, descending in rank_by:
+            value = row.get(column)
+            if value is None:
+                key.append((1, 0))
+            else:
+                key.append((0, -value if descending else value))
+        return key
+
+    ranked = sorted(rows, key=sort_key)
+    summary = {"rank": list(range(1, len(ranked) + 1))}
+    for column in columns:
+        summary[column] = [row.get(column) for row in ranked]
+    return summary
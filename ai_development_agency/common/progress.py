@@ -0,0 +1,119 @@
+from datetime import datetime, timezone
+from typing import Dict, List, Optional
+
+COMPLETED = "completed"
+BLOCKED = "blocked"
+NOT_STARTED = "assigned"
+
+
+class ProgressRollup:
+    """
+    Per-project, per-member and per-milestone task counts by status,
+    materialized from the task store's event log.
+
+    Every event moves one task from its old (assignee, status) bucket to its
+    new one, so apply() is O(1) regardless of history length, and reports read
+    the counts directly. A snapshot records the counts and the sequence number
+    of the last applied event, so a restart only replays the events after it.
+    """
+
+    def __init__(self):
+        self.last_seq = 0
+        self.projects: Dict[str, Dict[str, int]] = {}
+        self.members: Dict[str, Dict[str, Dict[str, int]]] = {}
+        self.milestones: Dict[str, Dict[str, Dict[str, int]]] = {}
+        self.milestone_completed_at: Dict[str, Dict[str, float]] = {}
+
+    def apply(self, event: Dict):
+        project_id = event["project_id"]
+        milestone = event["milestone"]
+        if event["old_status"] is not None:
+            self._move(project_id, event["old_assignee"], milestone, event["old_status"], -1)
+        self._move(project_id, event["new_assignee"], milestone, event["new_status"], 1)
+
+        if milestone is not None:
+            counts = self.milestones[project_id][milestone]
+            completed_at = self.milestone_completed_at.setdefault(project_id, {})
+            if counts.get(COMPLETED, 0) == sum(counts.values()):
+                completed_at.setdefault(milestone, event["at"])
+            else:
+                completed_at.pop(milestone, None)
+        self.last_seq = event["seq"]
+
+    def project_progress(self, project_id: str) -> Optional[Dict]:
+        counts = self.projects.get(project_id)
+        if not counts:
+            return None
+        total = sum(counts.values())
+        completed = counts.get(COMPLETED, 0)
+        return {
+            "percentage_complete": round(100 * completed / total, 1),
+            "tasks_completed": completed,
+            "tasks_remaining": total - completed,
+            "tasks_by_status": dict(counts),
+            "on_track": counts.get(BLOCKED, 0) == 0
+        }
+
+    def member_progress(self, project_id: str) -> Dict[str, Dict]:
+        return {
+            assignee: {
+                "complete": round(100 * counts.get(COMPLETED, 0) / sum(counts.values()), 1),
+                "tasks": sum(counts.values()),
+                "status": "blocked" if counts.get(BLOCKED) else "on_track"
+            }
+            for assignee, counts in self.members.get(project_id, {}).items()
+        }
+
+    def milestone_progress(self, project_id: str) -> List[Dict]:
+        milestones = []
+        completed_at = self.milestone_completed_at.get(project_id, {})
+        for name, counts in self.milestones.get(project_id, {}).items():
+            total = sum(counts.values())
+            completed = counts.get(COMPLETED, 0)
+            if completed == total:
+                status = "completed"
+            elif counts.get(NOT_STARTED, 0) == total:
+                status = "pending"
+            else:
+                status = "in_progress"
+            milestone = {"name": name, "status": status, "tasks": total, "tasks_completed": completed}
+            if name in completed_at:
+                milestone["date"] = datetime.fromtimestamp(completed_at[name], timezone.utc).date().isoformat()
+            milestones.append(milestone)
+        return milestones
+
+    def snapshot(self) -> Dict:
+        return {
+            "last_seq": self.last_seq,
+            "projects": self.projects,
+            "members": self.members,
+            "milestones": self.milestones,
+            "milestone_completed_at": self.milestone_completed_at,
+        }
+
+    @classmethod
+    def from_snapshot(cls, snapshot: Dict) -> "ProgressRollup":
+        rollup = cls()
+        rollup.last_seq = snapshot["last_seq"]
+        rollup.projects = snapshot["projects"]
+        rollup.members = snapshot["members"]
+        rollup.milestones = snapshot["milestones"]
+        rollup.milestone_completed_at = snapshot["milestone_completed_at"]
+        return rollup
+
+    def _move(self, project_id: str, assignee: str, milestone: Optional[str], status: str, delta: int):
+        _add(self.projects.setdefault(project_id, {}), status, delta)
+        _add(self.members.setdefault(project_id, {}).setdefault(assignee, {}), status, delta)
+        if not self.members[project_id][assignee]:
+            del self.members[project_id][assignee]
+        if milestone is not None:
+            _add(self.milestones.setdefault(project_id, {}).setdefault(milestone, {}), status, delta)
+
+
+def _add(counts: Dict[str, int], status: str, delta: int):
+    # Statuses with no tasks are dropped, so reports only list the ones in use
+    count = counts.get(status, 0) + delta
+    if count:
+        counts[status] = count
+    else:
+        counts.pop(status, None)
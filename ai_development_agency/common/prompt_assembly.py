@@ -0,0 +1,98 @@
+from typing import Dict, Tuple
+from .tokens import count_tokens
+
+# OpenAI only caches prompts whose shared prefix is at least this long, and
+# then in increments of PROMPT_CACHE_INCREMENT tokens
+PROMPT_CACHE_MIN_TOKENS = 1024
+PROMPT_CACHE_INCREMENT = 128
+
+# Same separator Agent.add_shared_instructions puts between the two parts
+SEPARATOR = "\n\n"
+
+
+def normalize_prompt_text(text: str) -> str:
+    """
+    Normalizes line endings and trailing whitespace so that the same source text
+    always produces byte-identical prompt text.
+    """
+    lines = text.replace("\r\n", "\n").replace("\r", "\n").split("\n")
+    return "\n".join(line.rstrip() for line in lines).strip("\n")
+
+
+class PromptAssembler:
+    """
+    Lays out every agent's instructions as one byte-identical shared prefix (the
+    agency manifesto) followed by the agent-specific suffix (its instructions.md).
+
+    Keeping the shared part first and stable lets provider-side prefix caching
+    reuse it across all agents instead of reprocessing it on every turn.
+    """
+
+    def __init__(self, shared_prefix: str):
+        self.shared_prefix = normalize_prompt_text(shared_prefix)
+
+    @classmethod
+    def from_file(cls, path: str) -> "PromptAssembler":
+        with open(path, "r") as f:
+            return cls(f.read())
+
+    def assemble(self, agent_instructions: str) -> str:
+        suffix = normalize_prompt_text(agent_instructions)
+        if not self.shared_prefix:
+            return suffix
+        return self.shared_prefix + SEPARATOR + suffix
+
+    def split(self, instructions: str) -> Tuple[str, str]:
+        """
+        Splits assembled instructions into (shared prefix, agent suffix). The
+        prefix is empty if the instructions do not start with the shared prefix.
+        """
+        if self.shared_prefix and instructions.startswith(self.shared_prefix):
+            return self.shared_prefix, instructions[len(self.shared_prefix):].lstrip("\n")
+        return "", instructions
+
+    def report(self, agent_instructions: Dict[str, str], max_prompt_tokens: int = 25000,
+               model: str = "gpt-4o") -> Dict:
+        """
+        Reports, per agent, how many instruction tokens are the shared prefix and
+        the agent suffix, how many the provider can serve from its prompt cache on
+        each turn after the first, and what share of max_prompt_tokens they take.
+
+        Cached tokens still count towards max_prompt_tokens, but they are not
+        reprocessed, which is what saves latency and cost on every turn.
+        agent_instructions may hold either assembled or agent-only instructions.
+        """
+        prefix_tokens = count_tokens(self.shared_prefix + SEPARATOR, model) if self.shared_prefix else 0
+
+        agents = {}
+        for name, instructions in agent_instructions.items():
+            _, suffix = self.split(normalize_prompt_text(instructions))
+            suffix_tokens = count_tokens(suffix, model)
+            total_tokens = prefix_tokens + suffix_tokens
+            cached_tokens = cacheable_tokens(total_tokens)
+            agents[name] = {
+                "shared_prefix_tokens": prefix_tokens,
+                "agent_suffix_tokens": suffix_tokens,
+                "instruction_tokens": total_tokens,
+                "cached_tokens_per_turn": cached_tokens,
+                "uncached_tokens_per_turn": total_tokens - cached_tokens,
+                "share_of_max_prompt_tokens": round(total_tokens / max_prompt_tokens, 4),
+            }
+
+        return {
+            "max_prompt_tokens": max_prompt_tokens,
+            "shared_prefix_tokens": prefix_tokens,
+            # Whether the prefix alone is long enough to be cached across agents
+            "shared_prefix_cacheable_across_agents": cacheable_tokens(prefix_tokens) > 0,
+            "tokens_saved_per_turn": sum(a["cached_tokens_per_turn"] for a in agents.values()),
+            "agents": agents,
+        }
+
+
+def cacheable_tokens(prefix_tokens: int) -> int:
+    """
+    Number of tokens of a stable prompt prefix the provider serves from cache.
+    """
+    if prefix_tokens < PROMPT_CACHE_MIN_TOKENS:
+        return 0
+    return prefix_tokens - prefix_tokens % PROMPT_CACHE_INCREMENT
@@ -0,0 +1,223 @@
+from typing import Dict, Iterable, List, Optional
+import heapq
+import re
+
+# Working days per unit, for durations given as text ("2 weeks", "3 days")
+DURATION_UNITS = {"day": 1, "week": 5, "month": 21}
+
+
+def parse_duration(value) -> float:
+    """
+    Parses a task duration in working days: a number, or text such as
+    '3 days', '2 weeks' or '1.5 months'.
+    """
+    if isinstance(value, (int, float)):
+        return float(value)
+    match = re.fullmatch(r"\s*(\d+(?:\.\d+)?)\s*([a-zA-Z]+?)s?\s*", str(value))
+    if not match or match.group(2).lower() not in DURATION_UNITS:
+        raise ValueError(f"Invalid task duration '{value}', expected e.g. 5, '3 days' or '2 weeks'")
+    return float(match.group(1)) * DURATION_UNITS[match.group(2).lower()]
+
+
+class TaskGraph:
+    """
+    Critical path scheduling over a DAG of tasks.
+
+    schedule() computes earliest/latest start and finish, slack and the
+    critical path in O(V+E). Earliest starts depend only on a task's upstream
+    and the remaining path length ("tail") only on its downstream, so after
+    update_duration() only the changed task's descendants (earliest starts)
+    and ancestors (tails) are revisited, stopping wherever a value does not
+    change.
+    """
+
+    def __init__(self):
+        self.durations: Dict[str, float] = {}
+        self.predecessors: Dict[str, List[str]] = {}
+        self.successors: Dict[str, List[str]] = {}
+        self.order: List[str] = []
+        self._position: Dict[str, int] = {}
+        self._earliest_start: Dict[str, float] = {}
+        self._tail: Dict[str, float] = {}
+        self._scheduled = False
+
+    @classmethod
+    def from_tasks(cls, tasks: Iterable[Dict]) -> "TaskGraph":
+        """
+        Builds a graph from task dicts with an 'id' (or 'name'), a 'duration'
+        and an optional 'depends_on' list of task ids.
+        """
+        graph = cls()
+        tasks = list(tasks)
+        for task in tasks:
+            graph.add_task(task.get("id") or task["name"], parse_duration(task.get("duration", 0)))
+        for task in tasks:
+            for dependency in task.get("depends_on", []):
+                graph.add_dependency(task.get("id") or task["name"], dependency)
+        return graph
+
+    def add_task(self, task_id: str, duration: float):
+        if task_id in self.durations:
+            raise ValueError(f"Duplicate task '{task_id}'")
+        if duration < 0:
+            raise ValueError(f"Task '{task_id}' has a negative duration")
+        self.durations[task_id] = duration
+        self.predecessors[task_id] = []
+        self.successors[task_id] = []
+        self._scheduled = False
+
+    def add_dependency(self, task_id: str, depends_on: str):
+        for name in (task_id, depends_on):
+            if name not in self.durations:
+                raise ValueError(f"Unknown task '{name}' in dependencies")
+        self.predecessors[task_id].append(depends_on)
+        self.successors[depends_on].append(task_id)
+        self._scheduled = False
+
+    def schedule(self) -> "TaskGraph":
+        """
+        Full forward and backward pass over the graph in topological order.
+        """
+        self.order = self._topological_order()
+        self._position = {task_id: i for i, task_id in enumerate(self.order)}
+
+        for task_id in self.order:
+            self._earliest_start[task_id] = self._compute_earliest_start(task_id)
+        for task_id in reversed(self.order):
+            self._tail[task_id] = self._compute_tail(task_id)
+
+        self._scheduled = True
+        return self
+
+    def update_duration(self, task_id: str, duration: float) -> int:
+        """
+        Changes one task's estimate and incrementally updates the schedule.
+        Returns the number of tasks whose values were recomputed.
+        """
+        if duration < 0:
+            raise ValueError(f"Task '{task_id}' has a negative duration")
+        if not self._scheduled:
+            self.durations[task_id] = duration
+            self.schedule()
+            return len(self.order)
+        if self.durations[task_id] == duration:
+            return 0
+        self.durations[task_id] = duration
+
+        # Descendants' earliest starts, visited in topological order
+        recomputed = 0
+        heap = [(self._position[s], s) for s in self.successors[task_id]]
+        heapq.heapify(heap)
+        seen = set()
+        while heap:
+            _, current = heapq.heappop(heap)
+            if current in seen:
+                continue
+            seen.add(current)
+            recomputed += 1
+            earliest_start = self._compute_earliest_start(current)
+            if earliest_start != self._earliest_start[current]:
+                self._earliest_start[current] = earliest_start
+                for successor in self.successors[current]:
+                    heapq.heappush(heap, (self._position[successor], successor))
+
+        # The task's own and its ancestors' tails, in reverse topological order
+        heap = [(-self._position[task_id], task_id)]
+        seen = set()
+        while heap:
+            _, current = heapq.heappop(heap)
+            if current in seen:
+                continue
+            seen.add(current)
+            recomputed += 1
+            tail = self._compute_tail(current)
+            if tail != self._tail[current] or current == task_id:
+                self._tail[current] = tail
+                for predecessor in self.predecessors[current]:
+                    heapq.heappush(heap, (-self._position[predecessor], predecessor))
+
+        return recomputed
+
+    @property
+    def project_duration(self) -> float:
+        self._ensure_scheduled()
+        return max((self._tail[t] for t in self.order if not self.predecessors[t]), default=0.0)
+
+    def task_schedule(self, task_id: str, project_duration: Optional[float] = None) -> Dict[str, float]:
+        self._ensure_scheduled()
+        if project_duration is None:
+            project_duration = self.project_duration
+        duration = self.durations[task_id]
+        earliest_start = self._earliest_start[task_id]
+        latest_start = project_duration - self._tail[task_id]
+        return {
+            "duration": duration,
+            "earliest_start": earliest_start,
+            "earliest_finish": earliest_start + duration,
+            "latest_start": latest_start,
+            "latest_finish": latest_start + duration,
+            # Rounded, since forward and backward sums of fractional durations
+            # can differ in the last bits (-1e-16 instead of 0)
+            "slack": max(0.0, round(latest_start - earliest_start, 9)),
+        }
+
+    def summary(self) -> Dict:
+        """
+        The whole schedule: project duration, every task's times and slack, and
+        the critical path.
+        """
+        project_duration = self.project_duration
+        return {
+            "project_duration_days": project_duration,
+            "tasks": {task_id: self.task_schedule(task_id, project_duration) for task_id in self.order},
+            "critical_path": self.critical_path(),
+        }
+
+    def critical_path(self) -> List[str]:
+        """
+        One longest chain of zero-slack tasks from a start task to an end task.
+        """
+        self._ensure_scheduled()
+        # Each tail is its task's duration plus the largest successor tail, so
+        # following the largest tail stays on a longest chain without
+        # comparing sums of fractional durations for equality
+        current: Optional[str] = max(
+            (t for t in self.order if not self.predecessors[t]), key=lambda t: self._tail[t], default=None
+        )
+        path = []
+        while current is not None:
+            path.append(current)
+            current = max(self.successors[current], key=lambda s: self._tail[s], default=None)
+        return path
+
+    def _ensure_scheduled(self):
+        if not self._scheduled:
+            self.schedule()
+
+    def _compute_earliest_start(self, task_id: str) -> float:
+        return max(
+            (self._earliest_start[p] + self.durations[p] for p in self.predecessors[task_id]),
+            default=0.0,
+        )
+
+    def _compute_tail(self, task_id: str) -> float:
+        return self.durations[task_id] + max((self._tail[s] for s in self.successors[task_id]), default=0.0)
+
+    def _topological_order(self) -> List[str]:
+        # Kahn's algorithm, keeping insertion order among ready tasks
+        remaining = {task_id: len(preds) for task_id, preds in self.predecessors.items()}
+        ready = [task_id for task_id, count in remaining.items() if count == 0]
+        order = []
+        while ready:
+            next_ready = []
+            for task_id in ready:
+                order.append(task_id)
+                for successor in self.successors[task_id]:
+                    remaining[successor] -= 1
+                    if remaining[successor] == 0:
+                        next_ready.append(successor)
+            ready = next_ready
+        if len(order) != len(self.durations):
+            cycle = sorted(task_id for task_id, count in remaining.items() if count > 0)
+            raise ValueError(f"Task dependencies contain a cycle involving: {cycle}")
+        return order
@@ -0,0 +1,149 @@
+from typing import Dict, Iterable, List, Optional, Union
+import numpy as np
+
+Weights = Union[List[str], Dict[str, float]]
+
+
+def normalize_weights(criteria: Weights) -> Dict[str, float]:
+    """
+    {criterion: weight} summing to 1 from a weight dictionary, or equal
+    weights from a plain list of criteria.
+    """
+    if not isinstance(criteria, dict):
+        criteria = {criterion: 1.0 for criterion in criteria}
+    weights = {criterion: float(weight) for criterion, weight in criteria.items()}
+    if any(weight < 0 for weight in weights.values()):
+        raise ValueError(f"Criterion weights must not be negative: {weights}")
+    total = sum(weights.values())
+    if total <= 0:
+        raise ValueError("At least one criterion needs a positive weight")
+    return {criterion: weight / total for criterion, weight in weights.items()}
+
+
+class WeightedScoring:
+    """
+    Weighted multi-criteria ranking of candidates held as a candidates x
+    criteria matrix.
+
+    Each criterion column is min-max normalized to [0, 1] (inverted for
+    criteria where lower is better, missing scores counting as the worst), so
+    a candidate's score is the weighted sum of its row and lies in [0, 1].
+    Scores that are not numbers, such as 'High', count as missing and are
+    listed in non_numeric.
+
+    Sensitivity analysis asks, per criterion, how far its weight can move
+    (the others fixed) before another candidate overtakes the winner. The
+    winner w and a candidate j swap when S_j + d * N_jk = S_w + d * N_wk
+    (renormalizing the weights scales every score alike), so the closest flip
+    in each direction is a ratio over one column: every criterion against
+    every candidate is solved in a few array operations.
+    """
+
+    def __init__(self, candidates: Dict[str, Dict[str, float]], criteria: Weights,
+                 lower_is_better: Iterable[str] = ()):
+        self.weights = normalize_weights(criteria)
+        self.criteria = list(self.weights)
+        self.names = list(candidates)
+        if not self.names:
+            raise ValueError("No candidates to score")
+        self.non_numeric = [
+            {"candidate": name, "criterion": criterion, "score": candidates[name][criterion]}
+            for name in self.names for criterion in self.criteria
+            if candidates[name].get(criterion) is not None and not _is_number(candidates[name][criterion])
+        ]
+        self.values = np.array(
+            [[_as_float(candidates[name].get(criterion)) for criterion in self.criteria] for name in self.names],
+            dtype=np.float64,
+        ).reshape(len(self.names), len(self.criteria))
+        lower_is_better = set(lower_is_better)
+        self.normalized = _normalize(self.values, [criterion in lower_is_better for criterion in self.criteria])
+        self._weight_vector = np.array([self.weights[criterion] for criterion in self.criteria])
+        self.scores = self.normalized @ self._weight_vector
+        # Stable, so ties keep the candidates' given order
+        self.order = np.argsort(-self.scores, kind="stable")
+
+    @property
+    def winner(self) -> str:
+        return self.names[self.order[0]]
+
+    def ranking(self, top: Optional[int] = None) -> List[Dict]:
+        ranked = self.order if top is None else self.order[:top]
+        return [
+            {"rank": rank, "name": self.names[i], "score": round(float(self.scores[i]), 4)}
+            for rank, i in enumerate(ranked, start=1)
+        ]
+
+    def contributions(self, name: str) -> Dict[str, float]:
+        """
+        The weighted share each criterion adds to a candidate's score, largest first.
+        """
+        row = self.normalized[self.names.index(name)] * self._weight_vector
+        return {
+            self.criteria[k]: round(float(row[k]), 4)
+            for k in np.argsort(-row, kind="stable")
+        }
+
+    def sensitivity(self) -> List[Dict]:
+        """
+        Per criterion, the weight at which the winner changes when that weight
+        alone is raised or lowered, and the candidate that takes over; None
+        when no weight in that direction changes the winner.
+        """
+        w = self.order[0]
+        gap = self.scores[w] - self.scores                # >= 0
+        diff = self.normalized - self.normalized[w]       # candidates x criteria
+        with np.errstate(divide="ignore", invalid="ignore"):
+            delta = gap[:, None] / diff
+        up = np.where(diff > 0, delta, np.inf)
+        down = np.where((diff < 0) & (delta > -self._weight_vector), delta, -np.inf)
+        up[w] = np.inf
+        down[w] = -np.inf
+        up_at = up.argmin(axis=0)
+        down_at = down.argmax(axis=0)
+
+        analysis = []
+        for k, criterion in enumerate(self.criteria):
+            weight = self._weight_vector[k]
+            raise_by = up[up_at[k], k]
+            lower_by = down[down_at[k], k]
+            analysis.append({
+                "criterion": criterion,
+                "weight": round(float(weight), 4),
+                "flips_above": _share(weight + raise_by, weight) if np.isfinite(raise_by) else None,
+                "winner_above": self.names[up_at[k]] if np.isfinite(raise_by) else None,
+                "flips_below": _share(weight + lower_by, weight) if np.isfinite(lower_by) else None,
+                "winner_below": self.names[down_at[k]] if np.isfinite(lower_by) else None,
+            })
+        return analysis
+
+
+def _share(new_weight: float, weight: float) -> float:
+    # The changed weight as a share of the new total, the scale weights are reported in
+    return round(float(new_weight / (1 - weight + new_weight)), 4)
+
+
+def _normalize(values: np.ndarray, lower_is_better: List[bool]) -> np.ndarray:
+    missing = np.isnan(values)
+    low = np.where(missing, np.inf, values).min(axis=0)
+    high = np.where(missing, -np.inf, values).max(axis=0)
+    span = high - low
+    with np.errstate(divide="ignore", invalid="ignore"):
+        # A criterion every candidate scores the same on shifts all scores alike
+        normalized = np.where(span > 0, (values - low) / span, 1.0)
+    flip = np.array(lower_is_better, dtype=bool)
+    normalized[:, flip] = np.where(span[flip] > 0, 1.0 - normalized[:, flip], 1.0)
+    # Missing scores rank last on their criterion
+    normalized[missing] = 0.0
+    return normalized
+
+
+def _is_number(value) -> bool:
+    try:
+        float(value)
+    except (TypeError, ValueError):
+        return False
+    return True
+
+
+def _as_float(value) -> float:
+    return float(value) if value is not None and _is_number(value) else np.nan
@@ -0,0 +1,182 @@
+from agency_swarm import Agent
+from openai.types.beta import Assistant
+from contextlib import contextmanager
+from typing import Dict, List, Optional
+import hashlib
+import json
+import os
+import tempfile
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+
+def assistant_content_hash(agent: Agent) -> str:
+    """
+    Hashes everything that decides whether the remote assistant is up to date:
+    instructions, tool schemas, model and temperature (plus name and description,
+    which are sent with the same update).
+    """
+    tools = sorted(
+        (json.dumps(tool, sort_keys=True) for tool in agent.get_oai_tools())
+    )
+    content = {
+        "name": agent.name,
+        "description": agent.description,
+        "instructions": agent.instructions,
+        "tools": tools,
+        "model": agent.model,
+        "temperature": agent.temperature,
+    }
+    encoded = json.dumps(content, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+class SettingsStore:
+    """
+    Locked, atomic access to settings.json and its content-hash index.
+
+    The index lives next to the settings file (settings.index.json) and maps each
+    agent name to its assistant id and the content hash it was last synced with.
+    Every read-modify-write holds an exclusive lock on settings.json.lock, and
+    files are replaced with os.replace so readers never see a partial write.
+    """
+
+    def __init__(self, settings_path: str):
+        self.settings_path = settings_path
+        root, _ = os.path.splitext(settings_path)
+        self.index_path = root + ".index.json"
+        self.lock_path = settings_path + ".lock"
+
+    @contextmanager
+    def locked(self):
+        directory = os.path.dirname(os.path.abspath(self.lock_path))
+        os.makedirs(directory, exist_ok=True)
+        with open(self.lock_path, "a+") as lock_file:
+            if fcntl:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+            else:
+                lock_file.seek(0)
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)
+            try:
+                yield
+            finally:
+                if fcntl:
+                    fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+                else:
+                    lock_file.seek(0)
+                    msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+
+    def read_settings(self) -> List[Dict]:
+        return self._read_json(self.settings_path, [])
+
+    def read_index(self) -> Dict[str, Dict]:
+        return self._read_json(self.index_path, {})
+
+    def find_record(self, name: str, assistant_id: Optional[str] = None) -> Optional[Dict]:
+        for record in self.read_settings():
+            if record.get("name") == name and (assistant_id is None or record.get("id") == assistant_id):
+                return record
+        return None
+
+    def save_assistant(self, record: Dict, content_hash: Optional[str] = None):
+        """
+        Inserts or replaces an assistant record (matched by id, then by name) and,
+        if given, records the content hash it was synced with. Must be called
+        while holding locked().
+        """
+        settings = self.read_settings()
+        for i, existing in enumerate(settings):
+            if existing.get("id") == record["id"]:
+                settings[i] = record
+                break
+        else:
+            for i, existing in enumerate(settings):
+                if existing.get("name") == record["name"]:
+                    settings[i] = record
+                    break
+            else:
+                settings.append(record)
+        self._write_json(self.settings_path, settings, indent=4)
+
+        if content_hash is not None:
+            index = self.read_index()
+            index[record["name"]] = {"id": record["id"], "content_hash": content_hash}
+            self._write_json(self.index_path, index, indent=2)
+
+    def _read_json(self, path: str, default):
+        if not os.path.isfile(path):
+            return default
+        with open(path, "r") as f:
+            content = f.read()
+        return json.loads(content) if content.strip() else default
+
+    def _write_json(self, path: str, data, indent: int):
+        directory = os.path.dirname(os.path.abspath(path))
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".tmp-", suffix=".json")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(data, f, indent=indent)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+
+def normalize_model_settings(agent: Agent):
+    """
+    The sampling settings Agent.init_oai adjusts for the model: o-series
+    models take no temperature or top_p, other models no reasoning_effort.
+    Applied before hashing, so a cached agent ends up configured as a synced one.
+    """
+    if agent.model.startswith("o"):
+        agent.temperature = None
+        agent.top_p = None
+    else:
+        agent.reasoning_effort = None
+
+
+def sync_assistant(agent: Agent, force: bool = False) -> Agent:
+    """
+    Replacement for Agent.init_oai that skips the remote round-trip when the
+    agent's content hash matches the one recorded for its assistant.
+
+    Changed (or new) agents go through the regular init_oai, with its settings
+    writes redirected to the locked, atomic store.
+    """
+    store = SettingsStore(agent.get_settings_path())
+    normalize_model_settings(agent)
+    content_hash = assistant_content_hash(agent)
+
+    if not force and not agent.id:
+        entry = store.read_index().get(agent.name)
+        record = store.find_record(agent.name, entry["id"]) if entry else None
+        if record and entry["content_hash"] == content_hash:
+            agent.assistant = Assistant.model_validate(record)
+            agent.id = record["id"]
+            if agent.assistant.tool_resources:
+                agent.tool_resources = agent.assistant.tool_resources.model_dump()
+            return agent
+
+    def save_settings():
+        with store.locked():
+            store.save_assistant(agent.assistant.model_dump())
+
+    # init_oai writes settings through these two methods
+    agent._save_settings = save_settings
+    agent._update_settings = save_settings
+    try:
+        agent.init_oai()
+    finally:
+        del agent._save_settings
+        del agent._update_settings
+
+    with store.locked():
+        store.save_assistant(agent.assistant.model_dump(), content_hash)
+    return agent
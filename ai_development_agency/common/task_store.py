@@ -0,0 +1,413 @@
+from datetime import datetime, timezone
+from typing import Dict, Iterable, List, Optional
+import json
+import os
+import sqlite3
+import threading
+import time
+from .bottlenecks import StageMonitor
+from .performance import PerformanceRollup
+from .progress import ProgressRollup
+from .scheduling import parse_duration
+
+TASK_STATUSES = ["assigned", "in_progress", "review", "blocked", "completed"]
+
+# Events between progress snapshots; a restart replays at most this many
+SNAPSHOT_EVERY = int(os.getenv("AGENCY_ROLLUP_SNAPSHOT_EVERY", "10000"))
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS tasks (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    project_id TEXT NOT NULL,
+    name TEXT NOT NULL,
+    assignee TEXT NOT NULL,
+    status TEXT NOT NULL,
+    priority TEXT,
+    details TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS task_dependencies (
+    task_id INTEGER NOT NULL,
+    depends_on INTEGER NOT NULL,
+    PRIMARY KEY (task_id, depends_on)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS tasks_by_project_status ON tasks (project_id, status, assignee);
+CREATE INDEX IF NOT EXISTS tasks_by_project_assignee ON tasks (project_id, assignee, status);
+CREATE INDEX IF NOT EXISTS tasks_by_assignee ON tasks (assignee, status);
+CREATE INDEX IF NOT EXISTS tasks_by_status ON tasks (status, assignee);
+CREATE TABLE IF NOT EXISTS task_events (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    task_id INTEGER NOT NULL,
+    project_id TEXT NOT NULL,
+    milestone TEXT,
+    old_assignee TEXT,
+    new_assignee TEXT NOT NULL,
+    old_status TEXT,
+    new_status TEXT NOT NULL,
+    at REAL NOT NULL,
+    status_since REAL,
+    old_status_since REAL,
+    estimate_days REAL
+);
+CREATE INDEX IF NOT EXISTS task_events_by_task ON task_events (task_id, seq);
+CREATE INDEX IF NOT EXISTS task_events_by_time ON task_events (at);
+CREATE TABLE IF NOT EXISTS progress_snapshots (
+    seq INTEGER PRIMARY KEY,
+    state TEXT NOT NULL
+);
+"""
+
+
+def parse_estimate(value) -> Optional[float]:
+    """
+    A task's estimated_days in working days ('2 weeks' is 10), or None when
+    it is missing, not a duration or not positive.
+    """
+    if value is None or isinstance(value, bool):
+        return None
+    try:
+        days = parse_duration(value)
+    except ValueError:
+        return None
+    return days if days > 0 else None
+
+
+def format_task_id(number: int) -> str:
+    return f"TASK-{number:03d}"
+
+
+def parse_task_id(task_id) -> int:
+    """
+    Accepts 'TASK-042', '42' or 42.
+    """
+    text = str(task_id).strip().upper()
+    if text.startswith("TASK-"):
+        text = text[len("TASK-"):]
+    if not text.isdigit():
+        raise ValueError(f"Invalid task id '{task_id}', expected e.g. 'TASK-001'")
+    return int(text)
+
+
+class TaskStore:
+    """
+    Tasks, their assignees, status and dependencies in an embedded SQLite
+    database, so TeamCoordinator state survives between calls and restarts.
+
+    Task numbers come from an AUTOINCREMENT key, so they only ever grow, even
+    after deletions. Every creation, status change and reassignment is also
+    appended to an event log, from which progress(), stage_monitor() and
+    performance_review() materialize rollups. Every combination of project,
+    assignee and status filters is served by an index whose leading columns
+    match all the filters, so queries and progress counts stay proportional
+    to the matching tasks rather than to the whole store.
+    """
+
+    def __init__(self, path: str = ":memory:"):
+        self.path = path
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        self._connection.row_factory = sqlite3.Row
+        if path != ":memory:":
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            # Durable at checkpoints rather than every commit; WAL keeps the file consistent
+            self._connection.execute("PRAGMA synchronous=NORMAL")
+        # Lets migrations and backfills coerce estimates the way add_task() does
+        self._connection.create_function("parse_estimate", 1, parse_estimate, deterministic=True)
+        self._rollup: Optional[ProgressRollup] = None
+        self._snapshot_seq = 0
+        self._monitor: Optional[StageMonitor] = None
+        self._performance: Optional[PerformanceRollup] = None
+        with self._lock, self._connection:
+            self._migrate()
+            self._connection.executescript(SCHEMA)
+            self._backfill_events()
+
+    def add_task(self, project_id: str, name: str, assignee: str, status: str = "assigned",
+                 priority: Optional[str] = None, details: Optional[Dict] = None,
+                 depends_on: Iterable = ()) -> Dict:
+        self._validate_status(status)
+        dependencies = sorted({parse_task_id(task_id) for task_id in depends_on})
+        now = time.time()
+        with self._lock, self._connection:
+            self._ensure_exist(dependencies)
+            cursor = self._connection.execute(
+                "INSERT INTO tasks (project_id, name, assignee, status, priority, details, created_at, updated_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (project_id, name, assignee, status, priority, json.dumps(details or {}), now, now),
+            )
+            number = cursor.lastrowid
+            self._connection.executemany(
+                "INSERT INTO task_dependencies VALUES (?, ?)", [(number, d) for d in dependencies]
+            )
+            self._record_event(
+                number, project_id, (details or {}).get("milestone"), None, assignee, None, status, now, now, None,
+                parse_estimate((details or {}).get("estimated_days"))
+            )
+        return self.get_task(number)
+
+    def update_task(self, task_id, status: Optional[str] = None, assignee: Optional[str] = None,
+                    priority: Optional[str] = None) -> Dict:
+        number = parse_task_id(task_id)
+        changes = {"status": status, "assignee": assignee, "priority": priority}
+        changes = {column: value for column, value in changes.items() if value is not None}
+        if "status" in changes:
+            self._validate_status(changes["status"])
+        with self._lock, self._connection:
+            self._ensure_exist([number])
+            if changes:
+                current = self._connection.execute(
+                    "SELECT project_id, assignee, status, details FROM tasks WHERE id = ?", (number,)
+                ).fetchone()
+                now = time.time()
+                assignments = ", ".join(f"{column} = ?" for column in changes)
+                self._connection.execute(
+                    f"UPDATE tasks SET {assignments}, updated_at = ? WHERE id = ?",
+                    (*changes.values(), now, number),
+                )
+                new_assignee = changes.get("assignee", current["assignee"])
+                new_status = changes.get("status", current["status"])
+                if (new_assignee, new_status) != (current["assignee"], current["status"]):
+                    # When the task entered its current status, for time-in-stage statistics;
+                    # events logged before this was recorded fall back to their own time
+                    previous = self._connection.execute(
+                        "SELECT COALESCE(status_since, at) FROM task_events WHERE task_id = ? ORDER BY seq DESC LIMIT 1",
+                        (number,),
+                    ).fetchone()
+                    since = previous[0] if previous else None
+                    self._record_event(
+                        number, current["project_id"], json.loads(current["details"]).get("milestone"),
+                        current["assignee"], new_assignee, current["status"], new_status, now,
+                        now if new_status != current["status"] else since, since
+                    )
+        return self.get_task(number)
+
+    def get_task(self, task_id) -> Optional[Dict]:
+        number = parse_task_id(task_id)
+        with self._lock:
+            row = self._connection.execute("SELECT * FROM tasks WHERE id = ?", (number,)).fetchone()
+            if row is None:
+                return None
+            return self._to_dict(row, self._dependencies([number])[number])
+
+    def query(self, project_id: Optional[str] = None, assignee: Optional[str] = None,
+              status: Optional[str] = None, limit: Optional[int] = None) -> List[Dict]:
+        """
+        Tasks matching all of the given filters, oldest first.
+        """
+        where, parameters = self._filters(project_id, assignee, status)
+        sql = f"SELECT * FROM tasks{where} ORDER BY id"
+        if limit is not None:
+            sql += " LIMIT ?"
+            parameters.append(limit)
+        with self._lock:
+            rows = self._connection.execute(sql, parameters).fetchall()
+            dependencies = self._dependencies([row["id"] for row in rows])
+            return [self._to_dict(row, dependencies[row["id"]]) for row in rows]
+
+    def count_by_status(self, project_id: Optional[str] = None, assignee: Optional[str] = None) -> Dict[str, int]:
+        where, parameters = self._filters(project_id, assignee, None)
+        with self._lock:
+            rows = self._connection.execute(
+                f"SELECT status, COUNT(*) FROM tasks{where} GROUP BY status", parameters
+            ).fetchall()
+        return {status: count for status, count in rows}
+
+    def events(self, after_seq: int = 0, task_id=None, limit: Optional[int] = None) -> List[Dict]:
+        """
+        Logged task events after a sequence number, oldest first, optionally
+        for one task only.
+        """
+        sql = "SELECT * FROM task_events WHERE seq > ?"
+        parameters: list = [after_seq]
+        if task_id is not None:
+            sql += " AND task_id = ?"
+            parameters.append(parse_task_id(task_id))
+        sql += " ORDER BY seq"
+        if limit is not None:
+            sql += " LIMIT ?"
+            parameters.append(limit)
+        with self._lock:
+            return [dict(row) for row in self._connection.execute(sql, parameters)]
+
+    def progress(self) -> ProgressRollup:
+        """
+        The progress rollup, brought up to date with any events logged since
+        it was last read (by this or another process). On first use it starts
+        from the latest snapshot and replays only the events after it.
+        """
+        with self._lock:
+            if self._rollup is None:
+                row = self._connection.execute(
+                    "SELECT state FROM progress_snapshots ORDER BY seq DESC LIMIT 1"
+                ).fetchone()
+                self._rollup = ProgressRollup.from_snapshot(json.loads(row[0])) if row else ProgressRollup()
+                self._snapshot_seq = self._rollup.last_seq
+
+            rows = self._connection.execute(
+                "SELECT * FROM task_events WHERE seq > ? ORDER BY seq", (self._rollup.last_seq,)
+            )
+            for row in rows:
+                self._rollup.apply(row)
+            if self._rollup.last_seq - self._snapshot_seq >= SNAPSHOT_EVERY:
+                self._save_snapshot()
+            return self._rollup
+
+    def stage_monitor(self) -> StageMonitor:
+        """
+        Sliding-window queueing statistics per project and stage, brought up to
+        date with any new events. On first use only the events inside the
+        window are read.
+        """
+        with self._lock:
+            if self._monitor is None:
+                self._monitor = StageMonitor()
+                rows = self._connection.execute(
+                    "SELECT * FROM task_events WHERE at >= ? ORDER BY seq", (time.time() - self._monitor.window_seconds,)
+                )
+                for row in rows:
+                    self._monitor.apply(row)
+                last_seq = self._connection.execute("SELECT MAX(seq) FROM task_events").fetchone()[0]
+                self._monitor.last_seq = last_seq or 0
+
+            rows = self._connection.execute(
+                "SELECT * FROM task_events WHERE seq > ? ORDER BY seq", (self._monitor.last_seq,)
+            )
+            for row in rows:
+                self._monitor.apply(row)
+            return self._monitor
+
+    def performance_review(self, member: Optional[str] = None, project_id: Optional[str] = None) -> Optional[Dict]:
+        """
+        Delivery metrics for one member, or the whole team when member is None,
+        from per-member rollups brought up to date with any new events. The
+        first call reads the event log once; later ones only the new events.
+        """
+        with self._lock:
+            if self._performance is None:
+                self._performance = PerformanceRollup()
+            rows = self._connection.execute(
+                "SELECT * FROM task_events WHERE seq > ? ORDER BY seq", (self._performance.last_seq,)
+            )
+            for row in rows:
+                self._performance.apply(row)
+            return self._performance.review(member, project_id, time.time())
+
+    def save_snapshot(self):
+        self.progress()
+        with self._lock:
+            self._save_snapshot()
+
+    def close(self):
+        with self._lock:
+            self._connection.close()
+
+    def _record_event(self, number: int, project_id: str, milestone: Optional[str], old_assignee: Optional[str],
+                      new_assignee: str, old_status: Optional[str], new_status: str, at: float,
+                      status_since: Optional[float], old_status_since: Optional[float],
+                      estimate_days: Optional[float] = None):
+        self._connection.execute(
+            "INSERT INTO task_events (task_id, project_id, milestone, old_assignee, new_assignee, old_status, "
+            "new_status, at, status_since, old_status_since, estimate_days) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (number, project_id, milestone, old_assignee, new_assignee, old_status, new_status, at,
+             status_since, old_status_since, estimate_days),
+        )
+
+    def _migrate(self):
+        # Event logs written before stage timings and estimates were recorded lack their columns
+        columns = {row[1] for row in self._connection.execute("PRAGMA table_info(task_events)")}
+        if columns:
+            for column in ("status_since", "old_status_since", "estimate_days"):
+                if column not in columns:
+                    self._connection.execute(f"ALTER TABLE task_events ADD COLUMN {column} REAL")
+            if "estimate_days" not in columns:
+                # Creation events carry the estimate; take it from the tasks they created
+                self._connection.execute(
+                    "UPDATE task_events SET estimate_days = (SELECT parse_estimate(json_extract(details, "
+                    "'$.estimated_days')) FROM tasks WHERE tasks.id = task_events.task_id) WHERE old_status IS NULL"
+                )
+
+    def _backfill_events(self):
+        # Stores created before the event log get one creation event per task
+        if self._connection.execute("SELECT 1 FROM task_events LIMIT 1").fetchone() is not None:
+            return
+        self._connection.execute(
+            "INSERT INTO task_events (task_id, project_id, milestone, new_assignee, new_status, at, status_since, "
+            "estimate_days) SELECT id, project_id, json_extract(details, '$.milestone'), assignee, status, "
+            "updated_at, updated_at, parse_estimate(json_extract(details, '$.estimated_days')) FROM tasks ORDER BY id"
+        )
+
+    def _save_snapshot(self):
+        self._connection.execute(
+            "INSERT OR REPLACE INTO progress_snapshots VALUES (?, ?)",
+            (self._rollup.last_seq, json.dumps(self._rollup.snapshot())),
+        )
+        # Only the latest snapshot is ever read
+        self._connection.execute("DELETE FROM progress_snapshots WHERE seq < ?", (self._rollup.last_seq,))
+        self._connection.commit()
+        self._snapshot_seq = self._rollup.last_seq
+
+    def _filters(self, project_id: Optional[str], assignee: Optional[str], status: Optional[str]):
+        clauses, parameters = [], []
+        for column, value in (("project_id", project_id), ("assignee", assignee), ("status", status)):
+            if value is not None:
+                clauses.append(f"{column} = ?")
+                parameters.append(value)
+        return (" WHERE " + " AND ".join(clauses) if clauses else ""), parameters
+
+    def _dependencies(self, numbers: List[int]) -> Dict[int, List[int]]:
+        dependencies = {number: [] for number in numbers}
+        # Chunked to stay under SQLite's bound-parameter limit
+        for start in range(0, len(numbers), 500):
+            chunk = numbers[start:start + 500]
+            rows = self._connection.execute(
+                f"SELECT task_id, depends_on FROM task_dependencies WHERE task_id IN ({','.join('?' * len(chunk))})",
+                chunk,
+            )
+            for task_id, depends_on in rows:
+                dependencies[task_id].append(depends_on)
+        return dependencies
+
+    def _ensure_exist(self, numbers: List[int]):
+        for number in numbers:
+            if self._connection.execute("SELECT 1 FROM tasks WHERE id = ?", (number,)).fetchone() is None:
+                raise ValueError(f"Unknown task '{format_task_id(number)}'")
+
+    @staticmethod
+    def _validate_status(status: str):
+        if status not in TASK_STATUSES:
+            raise ValueError(f"Invalid task status '{status}', expected one of {TASK_STATUSES}")
+
+    @staticmethod
+    def _to_dict(row: sqlite3.Row, dependencies: List[int]) -> Dict:
+        return {
+            "task_id": format_task_id(row["id"]),
+            "project_id": row["project_id"],
+            "name": row["name"],
+            "assignee": row["assignee"],
+            "status": row["status"],
+            "priority": row["priority"],
+            "depends_on": [format_task_id(d) for d in sorted(dependencies)],
+            "details": json.loads(row["details"]),
+            "created_at": _timestamp(row["created_at"]),
+            "updated_at": _timestamp(row["updated_at"]),
+        }
+
+
+def _timestamp(seconds: float) -> str:
+    return datetime.fromtimestamp(seconds, timezone.utc).isoformat(timespec="seconds")
+
+
+_task_store: Optional[TaskStore] = None
+_task_store_lock = threading.Lock()
+
+
+def get_task_store() -> TaskStore:
+    """
+    The agency's task store, opened on first use at AGENCY_TASK_STORE_PATH.
+    """
+    global _task_store
+    with _task_store_lock:
+        if _task_store is None:
+            _task_store = TaskStore(os.getenv("AGENCY_TASK_STORE_PATH", "task_store.db"))
+        return _task_store
@@ -0,0 +1,225 @@
+from typing import Dict, Iterable, List, Optional, Tuple
+import hashlib
+import json
+import mmap
+import os
+import re
+import struct
+import tempfile
+import threading
+import numpy as np
+
+MAGIC = b"TCATIDX1"
+# Bump when the index layout or term extraction changes, so indexes built by older code are rebuilt
+INDEX_FORMAT = 1
+
+# Where compiled indexes are written; each file is named after its catalog's version and content hash.
+# The default is the user's own cache directory: indexes are trusted as built, so they must not
+# live where other users can plant files, as in the shared temp directory.
+INDEX_DIR = os.getenv("AGENCY_TECH_CATALOG_INDEX_DIR") or os.path.join(
+    os.getenv("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache"), "agency_tech_catalog"
+)
+
+# Words too common in requirement text to say anything about a technology
+STOPWORDS = {
+    "an", "and", "as", "at", "by", "for", "in", "of", "on", "or", "the", "to", "with",
+    "high", "low", "medium", "large", "small", "support", "based", "application", "developers",
+}
+
+
+def words(text: str) -> List[str]:
+    return [word for word in re.findall(r"[a-z0-9][a-z0-9+#]*", text.lower())
+            if len(word) > 1 and word not in STOPWORDS]
+
+
+def index_terms(entry: Dict) -> List[str]:
+    """
+    The terms an entry is found by: its kind, category and each feature
+    exactly, and every word of its name, category, features and tags.
+    """
+    terms = {f"kind:{entry['kind']}", f"category:{entry['category'].lower()}"}
+    terms.update(f"feature:{feature.lower()}" for feature in entry.get("key_features", []))
+    text = " ".join([entry["name"], entry["category"], *entry.get("key_features", []), *entry.get("tags", [])])
+    terms.update(f"word:{word}" for word in words(text))
+    return sorted(terms)
+
+
+def compile_catalog(source_path: str, index_path: str) -> str:
+    """
+    Compiles a JSON catalog ({version, technologies: [...]}) into the binary
+    index TechCatalog maps: a JSON header with the term dictionary, one
+    sorted uint32 posting list per term, then each entry's JSON at an offset
+    from a uint64 table. Written to a temporary file and renamed into place,
+    so concurrent readers never see a partial index.
+    """
+    with open(source_path, "rb") as source:
+        raw = source.read()
+    catalog = json.loads(raw)
+    entries = catalog["technologies"]
+
+    postings: Dict[str, List[int]] = {}
+    for number, entry in enumerate(entries):
+        for term in index_terms(entry):
+            postings.setdefault(term, []).append(number)
+
+    records = [json.dumps(entry, separators=(",", ":")).encode("utf-8") for entry in entries]
+    offsets = np.zeros(len(records) + 1, dtype=np.uint64)
+    offsets[1:] = np.cumsum([len(record) for record in records])
+
+    terms, position = {}, 0
+    for term in sorted(postings):
+        terms[term] = [position, len(postings[term])]
+        position += len(postings[term])
+    posting_array = np.fromiter(
+        (number for term in sorted(postings) for number in postings[term]), dtype=np.uint32, count=position
+    )
+
+    header = {
+        "format": INDEX_FORMAT,
+        "version": catalog.get("version"),
+        "source_sha256": hashlib.sha256(raw).hexdigest(),
+        "count": len(entries),
+        "postings": position,
+        "terms": terms,
+    }
+    header_bytes = json.dumps(header, separators=(",", ":")).encode("utf-8")
+    header_bytes += b" " * (-(len(MAGIC) + 8 + len(header_bytes)) % 8)
+
+    directory = os.path.dirname(os.path.abspath(index_path))
+    os.makedirs(directory, mode=0o700, exist_ok=True)
+    fd, temporary = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as index:
+            index.write(MAGIC)
+            index.write(struct.pack("<Q", len(header_bytes)))
+            index.write(header_bytes)
+            index.write(posting_array.tobytes())
+            # Keeps the uint64 offsets 8-byte aligned
+            index.write(b"\0" * (4 * (position % 2)))
+            index.write(offsets.tobytes())
+            for record in records:
+                index.write(record)
+        os.replace(temporary, index_path)
+    except BaseException:
+        os.unlink(temporary)
+        raise
+    return index_path
+
+
+class TechCatalog:
+    """
+    A read-only technology catalog served from a memory-mapped compiled index.
+
+    Posting lists are NumPy views straight into the mapping, so opening a
+    catalog only parses the term dictionary and lookups touch just the lists
+    they need. search() intersects the required lists (smallest first),
+    counts preferred-term matches with one bincount, and decodes only the
+    entries it returns. Ties keep catalog order, so the catalog lists the
+    technologies it would put first on equal terms first.
+    """
+
+    def __init__(self, index_path: str):
+        self.index_path = index_path
+        with open(index_path, "rb") as index:
+            self._map = mmap.mmap(index.fileno(), 0, access=mmap.ACCESS_READ)
+        if self._map[:len(MAGIC)] != MAGIC:
+            raise ValueError(f"'{index_path}' is not a compiled technology catalog")
+        (header_length,) = struct.unpack_from("<Q", self._map, len(MAGIC))
+        start = len(MAGIC) + 8
+        header = json.loads(self._map[start:start + header_length])
+        self.version = header["version"]
+        self.source_sha256 = header["source_sha256"]
+        self.count = header["count"]
+        self._terms = header["terms"]
+
+        postings_offset = start + header_length
+        total_postings = header["postings"]
+        self._postings = np.frombuffer(self._map, dtype=np.uint32, count=total_postings, offset=postings_offset)
+        offsets_offset = postings_offset + 4 * (total_postings + total_postings % 2)
+        self._offsets = np.frombuffer(self._map, dtype=np.uint64, count=self.count + 1, offset=offsets_offset)
+        self._records_offset = offsets_offset + 8 * (self.count + 1)
+
+    def lookup(self, term: str) -> np.ndarray:
+        """
+        Sorted entry numbers carrying a term, e.g. 'kind:database' or 'word:python'.
+        """
+        position, length = self._terms.get(term, (0, 0))
+        return self._postings[position:position + length]
+
+    def entry(self, number: int) -> Dict:
+        start = self._records_offset + int(self._offsets[number])
+        end = self._records_offset + int(self._offsets[number + 1])
+        return json.loads(self._map[start:end])
+
+    def search(self, kind: Optional[str] = None, required_features: Iterable[str] = (),
+               categories: Iterable[str] = (), preferred: Iterable[str] = (),
+               limit: Optional[int] = None) -> List[Dict]:
+        """
+        Entries of a kind that have every required feature and, if categories
+        are given, one of those categories; ranked by how many of the
+        preferred words (free text is split into words) they match.
+        """
+        required = [self.lookup(f"kind:{kind}")] if kind else []
+        required += [self.lookup(f"feature:{feature.lower()}") for feature in required_features]
+        categories = list(categories)
+        if categories:
+            required.append(np.unique(np.concatenate(
+                [self.lookup(f"category:{category.lower()}") for category in categories]
+            )))
+
+        if required:
+            required.sort(key=len)
+            matches = required[0]
+            for postings in required[1:]:
+                if not len(matches):
+                    break
+                matches = np.intersect1d(matches, postings, assume_unique=True)
+        else:
+            matches = np.arange(self.count, dtype=np.uint32)
+
+        preferred_terms = {f"word:{word}" for text in preferred for word in words(text)}
+        if preferred_terms and len(matches):
+            hits = np.bincount(
+                np.concatenate([self.lookup(term) for term in preferred_terms]), minlength=self.count
+            )[matches]
+            matches = matches[np.argsort(-hits, kind="stable")]
+        if limit is not None:
+            matches = matches[:limit]
+        return [self.entry(int(number)) for number in matches]
+
+    def close(self):
+        # Views into the mapping must go before it can be closed
+        self._postings = self._offsets = None
+        self._map.close()
+
+
+def index_path_for(source_path: str) -> str:
+    with open(source_path, "rb") as source:
+        raw = source.read()
+    version = json.loads(raw).get("version") or "unversioned"
+    digest = hashlib.sha256(raw).hexdigest()[:16]
+    return os.path.join(INDEX_DIR, f"catalog-{version}-{digest}-f{INDEX_FORMAT}.idx")
+
+
+_catalogs: Dict[str, Tuple[Tuple[int, int], TechCatalog]] = {}
+_catalogs_lock = threading.Lock()
+
+
+def open_catalog(source_path: str) -> TechCatalog:
+    """
+    The catalog at source_path, compiled on first use (or whenever the file's
+    content changes) and memory-mapped once per process. Later calls only
+    stat the source file.
+    """
+    stat = os.stat(source_path)
+    signature = (stat.st_mtime_ns, stat.st_size)
+    with _catalogs_lock:
+        cached = _catalogs.get(source_path)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+        index_path = index_path_for(source_path)
+        if not os.path.exists(index_path):
+            compile_catalog(source_path, index_path)
+        catalog = TechCatalog(index_path)
+        _catalogs[source_path] = (signature, catalog)
+        return catalog
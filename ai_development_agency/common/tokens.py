@@ -0,0 +1,46 @@
+from functools import lru_cache
+from typing import Dict, List
+import json
+
+try:
+    import tiktoken
+except ImportError:  # tiktoken is optional, fall back to an estimate
+    tiktoken = None
+
+# Rough average for English prose and JSON with the OpenAI tokenizers
+CHARS_PER_TOKEN = 4
+
+
+@lru_cache(maxsize=None)
+def _get_encoding(model: str):
+    if tiktoken is None:
+        return None
+    try:
+        try:
+            return tiktoken.encoding_for_model(model)
+        except KeyError:
+            return tiktoken.get_encoding("o200k_base")
+    except Exception:
+        # The encoding files are downloaded on first use, which fails offline
+        return None
+
+
+def count_tokens(text: str, model: str = "gpt-4o") -> int:
+    """
+    Counts prompt tokens with tiktoken when it is installed and its encoding is
+    available, otherwise estimates them from the character count.
+    """
+    if not text:
+        return 0
+    encoding = _get_encoding(model)
+    if encoding is None:
+        return max(1, (len(text) + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN)
+    return len(encoding.encode(text))
+
+
+def count_schema_tokens(schemas: List[Dict], model: str = "gpt-4o") -> int:
+    """
+    Counts the tokens tool schemas add to every request, measured on their
+    compact JSON form.
+    """
+    return sum(count_tokens(json.dumps(schema, separators=(",", ":")), model) for schema in schemas)
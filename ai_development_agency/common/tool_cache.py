@@ -0,0 +1,246 @@
+from collections import OrderedDict
+from functools import wraps
+from typing import Dict, List, Optional, Set
+import ast
+import hashlib
+import importlib.util
+import inspect
+import json
+import os
+import sqlite3
+import sys
+import threading
+import time
+from .tool_output import get_output_format
+
+# Modules under this directory (the agency's own code) are part of a tool's code version
+AGENCY_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Writes between purges of expired and surplus rows from the disk store
+DISK_PURGE_EVERY = 100
+
+
+class ToolResultCache:
+    """
+    An LRU cache with per-entry TTL for tool results, optionally backed by a
+    SQLite file so results survive restarts and are shared between processes.
+    The file is purged of expired rows, and of the oldest rows beyond
+    disk_max_entries, when opened and every DISK_PURGE_EVERY writes.
+
+    Hit and miss counters are kept per tool.
+    """
+
+    def __init__(self, max_entries: int = 1024, ttl_seconds: Optional[float] = 3600,
+                 disk_path: Optional[str] = None, disk_max_entries: int = 100_000):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.disk_path = disk_path
+        self.disk_max_entries = disk_max_entries
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._stats: Dict[str, Dict[str, int]] = {}
+        self._lock = threading.Lock()
+        self._disk_writes = 0
+        if disk_path:
+            with self._connect() as connection:
+                connection.execute(
+                    "CREATE TABLE IF NOT EXISTS tool_results "
+                    "(key TEXT PRIMARY KEY, tool TEXT, value TEXT, expires_at REAL)"
+                )
+                self._purge(connection)
+
+    def get(self, tool_name: str, key: str) -> Optional[str]:
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                value, expires_at = entry
+                if expires_at is None or expires_at > now:
+                    self._entries.move_to_end(key)
+                    self._count(tool_name, "hits")
+                    return value
+                del self._entries[key]
+
+        if self.disk_path:
+            with self._connect() as connection:
+                row = connection.execute(
+                    "SELECT value, expires_at FROM tool_results WHERE key = ?", (key,)
+                ).fetchone()
+            if row and (row[1] is None or row[1] > now):
+                with self._lock:
+                    self._store(key, row[0], row[1])
+                    self._count(tool_name, "hits")
+                return row[0]
+
+        with self._lock:
+            self._count(tool_name, "misses")
+        return None
+
+    def set(self, tool_name: str, key: str, value: str):
+        expires_at = time.time() + self.ttl_seconds if self.ttl_seconds else None
+        with self._lock:
+            self._store(key, value, expires_at)
+        if self.disk_path:
+            with self._lock:
+                self._disk_writes += 1
+                purge = self._disk_writes % DISK_PURGE_EVERY == 0
+            with self._connect() as connection:
+                connection.execute(
+                    "INSERT OR REPLACE INTO tool_results VALUES (?, ?, ?, ?)",
+                    (key, tool_name, value, expires_at),
+                )
+                if purge:
+                    self._purge(connection)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._stats.clear()
+        if self.disk_path:
+            with self._connect() as connection:
+                connection.execute("DELETE FROM tool_results")
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        """
+        Hits, misses and hit rate per tool.
+        """
+        with self._lock:
+            report = {}
+            for tool_name, counters in self._stats.items():
+                total = counters["hits"] + counters["misses"]
+                report[tool_name] = dict(counters, hit_rate=round(counters["hits"] / total, 3) if total else 0.0)
+            return report
+
+    def _store(self, key: str, value: str, expires_at: Optional[float]):
+        self._entries[key] = (value, expires_at)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def _count(self, tool_name: str, counter: str):
+        counters = self._stats.setdefault(tool_name, {"hits": 0, "misses": 0})
+        counters[counter] += 1
+
+    def _purge(self, connection: sqlite3.Connection):
+        connection.execute("DELETE FROM tool_results WHERE expires_at <= ?", (time.time(),))
+        # A replaced row gets a new rowid, so the lowest rowids were written longest ago
+        surplus = connection.execute("SELECT COUNT(*) FROM tool_results").fetchone()[0] - self.disk_max_entries
+        if surplus > 0:
+            connection.execute(
+                "DELETE FROM tool_results WHERE rowid IN (SELECT rowid FROM tool_results ORDER BY rowid LIMIT ?)",
+                (surplus,),
+            )
+
+    def _connect(self):
+        connection = sqlite3.connect(self.disk_path, timeout=30)
+        connection.execute("PRAGMA journal_mode=WAL")
+        return connection
+
+
+_code_versions: Dict[type, str] = {}
+
+tool_cache = ToolResultCache(
+    max_entries=int(os.getenv("AGENCY_TOOL_CACHE_SIZE", "1024")),
+    ttl_seconds=float(os.getenv("AGENCY_TOOL_CACHE_TTL", "3600")) or None,
+    disk_path=os.getenv("AGENCY_TOOL_CACHE_PATH") or None,
+    disk_max_entries=int(os.getenv("AGENCY_TOOL_CACHE_DISK_SIZE", "100000")),
+)
+
+
+def tool_code_version(tool_class: type) -> str:
+    """
+    Hash of the source file defining the tool and of every agency module it
+    imports, directly or through other agency modules, so editing a tool or
+    an engine it calls (common/scheduling.py, ...) invalidates its cached
+    results.
+    """
+    version = _code_versions.get(tool_class)
+    if version is None:
+        digest = hashlib.sha256()
+        module = inspect.getmodule(tool_class)
+        if module is None:
+            digest.update(tool_class.__qualname__.encode("utf-8"))
+        else:
+            for name, source in sorted(_module_sources(module).items()):
+                digest.update(f"{name}\0{source}\0".encode("utf-8"))
+        version = digest.hexdigest()[:16]
+        _code_versions[tool_class] = version
+    return version
+
+
+def _module_sources(module, sources: Optional[Dict[str, str]] = None) -> Dict[str, str]:
+    # The module's source and, recursively, that of the agency modules its import statements name
+    sources = {} if sources is None else sources
+    try:
+        source = inspect.getsource(module)
+    except (OSError, TypeError):
+        source = module.__name__
+    sources[module.__name__] = source
+    for imported in _imported_agency_modules(module, source):
+        if imported.__name__ not in sources:
+            _module_sources(imported, sources)
+    return sources
+
+
+def _imported_agency_modules(module, source: str) -> List:
+    try:
+        tree = ast.parse(source)
+    except SyntaxError:
+        return []
+    names: Set[str] = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            names.update(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom):
+            try:
+                base = importlib.util.resolve_name("." * node.level + (node.module or ""), module.__package__) \
+                    if node.level else node.module
+            except (ImportError, ValueError):
+                continue
+            names.add(base)
+            # 'from package import module' names a submodule
+            names.update(f"{base}.{alias.name}" for alias in node.names)
+    modules = []
+    for name in names:
+        imported = sys.modules.get(name)
+        path = getattr(imported, "__file__", None)
+        if path and os.path.abspath(path).startswith(AGENCY_ROOT + os.sep) and imported is not module:
+            modules.append(imported)
+    return modules
+
+
+def tool_cache_key(tool) -> str:
+    """
+    Key of a tool call: tool class, code version, output format, the
+    canonical JSON of its field values (nested dicts included) and the
+    versions the tool's cache_dependencies(), if it has one, returns for the
+    files and data its result also depends on.
+    """
+    arguments = json.dumps(tool.model_dump(mode="json"), sort_keys=True, separators=(",", ":"))
+    dependencies = getattr(tool, "cache_dependencies", None)
+    material = "|".join([
+        type(tool).__qualname__,
+        tool_code_version(type(tool)),
+        get_output_format(),
+        arguments,
+        *(dependencies() if dependencies is not None else []),
+    ])
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+def cached_run(run):
+    """
+    Memoizes a tool's run() in the shared tool cache. Only use it on tools whose
+    result depends on nothing but their fields and what cache_dependencies()
+    versions.
+    """
+    @wraps(run)
+    def wrapper(self):
+        tool_name = type(self).__name__
+        key = tool_cache_key(self)
+        result = tool_cache.get(tool_name, key)
+        if result is None:
+            result = run(self)
+            tool_cache.set(tool_name, key, result)
+        return result
+
+    return wrapper
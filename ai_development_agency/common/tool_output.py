@@ -0,0 +1,164 @@
+from contextlib import contextmanager
+from typing import Any, Dict, Optional
+import json
+import os
+import re
+import threading
+
+OUTPUT_FORMATS = ["pretty", "compact", "abbreviated", "dense"]
+
+# Agency-wide default, overridable per call with use_output_format()
+_default_format = os.getenv("AGENCY_TOOL_OUTPUT_FORMAT", "compact")
+_local = threading.local()
+
+# Characters that force a dense-form string to be quoted
+DENSE_SPECIAL = re.compile(r"""^[\s\-\[\]{}#&*!|>'"%@`?]|[:,\[\]{}#\n]|\s$""")
+
+
+def set_output_format(output_format: str):
+    """
+    Sets the agency-wide default output format for all tools.
+    """
+    global _default_format
+    _validate_format(output_format)
+    _default_format = output_format
+
+
+def get_output_format() -> str:
+    return getattr(_local, "output_format", None) or _default_format
+
+
+@contextmanager
+def use_output_format(output_format: str):
+    """
+    Overrides the output format for tool calls made inside the block (per thread).
+    """
+    _validate_format(output_format)
+    previous = getattr(_local, "output_format", None)
+    _local.output_format = output_format
+    try:
+        yield
+    finally:
+        _local.output_format = previous
+
+
+def encode_output(data: Any, output_format: Optional[str] = None) -> str:
+    """
+    Serializes a tool result in the given format, or the current default:
+
+    - pretty: indented JSON (the original tool output)
+    - compact: JSON without insignificant whitespace
+    - abbreviated: compact JSON with long keys shortened, plus a legend
+    - dense: a YAML-like form without braces and quotes
+    """
+    output_format = output_format or get_output_format()
+    _validate_format(output_format)
+
+    if output_format == "pretty":
+        return json.dumps(data, indent=2)
+    if output_format == "compact":
+        return json.dumps(data, separators=(",", ":"))
+    if output_format == "abbreviated":
+        abbreviations = build_abbreviations(data)
+        encoded = _abbreviate_keys(data, abbreviations)
+        if abbreviations:
+            encoded = {"_keys": {short: key for key, short in abbreviations.items()}, "data": encoded}
+        return json.dumps(encoded, separators=(",", ":"))
+    return "\n".join(_dense_lines(data, 0))
+
+
+def build_abbreviations(data: Any, min_length: int = 8) -> Dict[str, str]:
+    """
+    Maps every key of at least min_length characters to the initials of its
+    snake_case words (e.g. 'technical_assessment' -> 'ta'), adding a numeric
+    suffix when two keys would collide. Keys are only abbreviated when that saves
+    characters across all their occurrences, legend included.
+    """
+    counts: Dict[str, int] = {}
+    _count_keys(data, counts)
+
+    abbreviations = {}
+    taken = set(counts)
+    for key in sorted(counts):
+        if len(key) < min_length:
+            continue
+        words = [w for w in re.split(r"[_\-\s]+", key) if w]
+        short = "".join(w[0] for w in words).lower() or key[:2]
+        candidate, suffix = short, 2
+        while candidate in taken:
+            candidate = f"{short}{suffix}"
+            suffix += 1
+        # Legend entry costs len(key) + len(candidate) + 6 characters
+        if (len(key) - len(candidate)) * counts[key] > len(key) + len(candidate) + 6:
+            abbreviations[key] = candidate
+            taken.add(candidate)
+    return abbreviations
+
+
+def _count_keys(data: Any, counts: Dict[str, int]):
+    if isinstance(data, dict):
+        for key, value in data.items():
+            counts[key] = counts.get(key, 0) + 1
+            _count_keys(value, counts)
+    elif isinstance(data, (list, tuple)):
+        for item in data:
+            _count_keys(item, counts)
+
+
+def _abbreviate_keys(data: Any, abbreviations: Dict[str, str]) -> Any:
+    if isinstance(data, dict):
+        return {abbreviations.get(k, k): _abbreviate_keys(v, abbreviations) for k, v in data.items()}
+    if isinstance(data, (list, tuple)):
+        return [_abbreviate_keys(item, abbreviations) for item in data]
+    return data
+
+
+def _dense_scalar(value: Any) -> str:
+    if isinstance(value, str):
+        if value == "" or DENSE_SPECIAL.search(value) or value.lower() in ("true", "false", "null"):
+            return json.dumps(value)
+        try:
+            float(value)
+            return json.dumps(value)  # keep numeric-looking strings distinguishable
+        except ValueError:
+            return value
+    return json.dumps(value)
+
+
+def _is_scalar(value: Any) -> bool:
+    return not isinstance(value, (dict, list, tuple))
+
+
+def _dense_lines(data: Any, indent: int):
+    pad = "  " * indent
+    if isinstance(data, dict):
+        if not data:
+            yield pad + "{}"
+        for key, value in data.items():
+            label = f"{pad}{_dense_scalar(str(key))}:"
+            if _is_scalar(value):
+                yield f"{label} {_dense_scalar(value)}"
+            elif isinstance(value, (list, tuple)) and all(_is_scalar(v) for v in value):
+                yield f"{label} [{', '.join(_dense_scalar(v) for v in value)}]"
+            elif not value:
+                yield f"{label} {'{}' if isinstance(value, dict) else '[]'}"
+            else:
+                yield label
+                yield from _dense_lines(value, indent + 1)
+    elif isinstance(data, (list, tuple)):
+        if all(_is_scalar(v) for v in data):
+            yield f"{pad}[{', '.join(_dense_scalar(v) for v in data)}]"
+            return
+        for item in data:
+            lines = list(_dense_lines(item, indent + 1))
+            # First line of each item carries the list marker
+            first = lines[0][len(pad) + 2:]
+            yield f"{pad}- {first}"
+            yield from lines[1:]
+    else:
+        yield pad + _dense_scalar(data)
+
+
+def _validate_format(output_format: str):
+    if output_format not in OUTPUT_FORMATS:
+        raise ValueError(f"Invalid output format '{output_format}', expected one of {OUTPUT_FORMATS}")
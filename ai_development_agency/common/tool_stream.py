@@ -0,0 +1,92 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Generator, Optional
+import queue
+import threading
+from .tool_output import encode_output, get_output_format, use_output_format
+
+
+@dataclass
+class ToolChunk:
+    section: str
+    content: str  # the section encoded on its own, e.g. {"coverage_report": {...}}
+    index: int
+    total: int
+
+
+# Receives the chunks of the tool running in the current context, if any
+_chunk_sink: ContextVar[Optional[Callable[[ToolChunk], None]]] = ContextVar("tool_chunk_sink", default=None)
+
+
+def current_chunk_sink() -> Optional[Callable[[ToolChunk], None]]:
+    return _chunk_sink.get()
+
+
+@contextmanager
+def chunk_sink(callback: Optional[Callable[[ToolChunk], None]]):
+    """
+    Sends the chunks of tools run inside the block to callback.
+    """
+    token = _chunk_sink.set(callback)
+    try:
+        yield
+    finally:
+        _chunk_sink.reset(token)
+
+
+def build_report(sections: Dict[str, Any]) -> str:
+    """
+    Builds a report section by section, in order, and returns it encoded.
+
+    Section values may be callables, which are only called when their turn
+    comes. Every finished section is emitted as a chunk to the active sink
+    right away, so consumers can start on early sections while later ones
+    are still being computed.
+    """
+    sink = _chunk_sink.get()
+    report = {}
+    for index, (name, section) in enumerate(sections.items()):
+        report[name] = section() if callable(section) else section
+        if sink is not None:
+            sink(ToolChunk(name, encode_output({name: report[name]}), index, len(sections)))
+    return encode_output(report)
+
+
+def stream_tool(tool) -> Generator[ToolChunk, None, str]:
+    """
+    Runs tool.run() in a background thread and yields its report sections as
+    chunks as soon as they are built; the generator returns the full output.
+
+    Tools that do not build their output with build_report(), and cached
+    results, come through as a single "result" chunk.
+    """
+    chunks: "queue.Queue" = queue.Queue()
+    finished = object()
+    result = {}
+    output_format = get_output_format()
+
+    def worker():
+        try:
+            with use_output_format(output_format), chunk_sink(chunks.put):
+                result["output"] = tool.run()
+        except Exception as e:
+            result["error"] = e
+        finally:
+            chunks.put(finished)
+
+    threading.Thread(target=worker, name=f"stream-{type(tool).__name__}", daemon=True).start()
+
+    emitted = False
+    while True:
+        chunk = chunks.get()
+        if chunk is finished:
+            break
+        emitted = True
+        yield chunk
+
+    if "error" in result:
+        raise result["error"]
+    if not emitted:
+        yield ToolChunk("result", result["output"], 0, 1)
+    return result["output"]
@@ -0,0 +1,96 @@
+from agency_swarm import Agent
+from typing import Dict, List, Optional, Tuple
+
+
+class Topology:
+    """
+    A declarative communication graph for the agency.
+
+    Each directed edge (sender, recipient) lets the sender message the recipient
+    and becomes one entry in the sender's SendMessage recipient enum, so the
+    number of edges per agent directly drives the size of its tool schema.
+    """
+
+    def __init__(self, name: str, edges: List[Tuple[Agent, Agent]]):
+        self.name = name
+        self.edges = []
+        seen = set()
+        for sender, recipient in edges:
+            key = (sender.name, recipient.name)
+            if sender.name == recipient.name or key in seen:
+                continue
+            seen.add(key)
+            self.edges.append((sender, recipient))
+
+    @property
+    def num_edges(self) -> int:
+        return len(self.edges)
+
+    @property
+    def agents(self) -> List[Agent]:
+        agents = {}
+        for sender, recipient in self.edges:
+            agents.setdefault(sender.name, sender)
+            agents.setdefault(recipient.name, recipient)
+        return list(agents.values())
+
+    def recipients_of(self, agent_name: str) -> List[str]:
+        return [recipient.name for sender, recipient in self.edges if sender.name == agent_name]
+
+    def reachable_from(self, agent_name: str) -> List[str]:
+        """
+        Names of all agents a message starting at agent_name can be routed to.
+        """
+        adjacency: Dict[str, List[str]] = {}
+        for sender, recipient in self.edges:
+            adjacency.setdefault(sender.name, []).append(recipient.name)
+
+        reached = []
+        stack = [agent_name]
+        visited = {agent_name}
+        while stack:
+            for recipient in adjacency.get(stack.pop(), []):
+                if recipient not in visited:
+                    visited.add(recipient)
+                    reached.append(recipient)
+                    stack.append(recipient)
+        return reached
+
+    def build_chart(self, entry: Optional[Agent] = None) -> List:
+        """
+        Returns an agency chart for agency_swarm's Agency: the entry agent first,
+        followed by one [sender, recipient] pair per edge.
+        """
+        entry = entry or self.edges[0][0]
+        return [entry] + [[sender, recipient] for sender, recipient in self.edges]
+
+
+def full_mesh(agents: List[Agent]) -> Topology:
+    """
+    Every agent can message every agent listed after it.
+    """
+    edges = []
+    for i, sender in enumerate(agents):
+        for recipient in agents[i + 1:]:
+            edges.append((sender, recipient))
+    return Topology("full_mesh", edges)
+
+
+def hub_and_spoke(hub: Agent, spokes: List[Agent]) -> Topology:
+    """
+    Only the hub delegates; spokes answer the hub and never talk to each other.
+    """
+    return Topology("hub_and_spoke", [(hub, spoke) for spoke in spokes])
+
+
+def layered(layers: List[List[Agent]]) -> Topology:
+    """
+    Every agent in a layer can message every agent in the next layer,
+    e.g. [[ceo], [cto], specialists] for CEO -> CTO -> specialists.
+    """
+    edges = []
+    for upper, lower in zip(layers, layers[1:]):
+        for sender in upper:
+            for recipient in lower:
+                edges.append((sender, recipient))
+    return Topology("layered", edges)
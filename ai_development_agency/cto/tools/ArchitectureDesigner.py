@@ -1,9 +1,77 @@
-from agency_swarm.tools import BaseTool
 from pydantic import Field
-from typing import Dict, List, Optional
-import json
-
-class ArchitectureDesigner(BaseTool):
+from typing import Callable, Dict, List, Optional
+import re
+if __name__ == "__main__" and not __package__:
+    # Run as a script: the shared modules live in the agency root
+    import sys
+    from pathlib import Path
+    sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from common.async_tool import AsyncTool
+from common.capacity import DEFAULT_REQUESTS, CapacitySimulator, tier_specs
+from common.component_graph import ComponentGraph
+from common.design_cache import changed_fields, design_cache, structural_diff
+from common.tool_stream import build_report
+from common.tool_cache import tool_code_version
+
+# Load the design must meet its latency target at, as a multiple of the expected load
+SCALABILITY_HEADROOM = {"low": 1.0, "medium": 1.5, "high": 3.0}
+# Replicas every tier keeps for redundancy at each scalability level
+SCALABILITY_MIN_REPLICAS = {"low": 1, "medium": 2, "high": 3}
+
+# Used when project_requirements gives no 'capacity' load or target
+DEFAULT_ARRIVAL_RATE = 100
+DEFAULT_TARGET_P99_MS = 200
+
+# The system design's components and calls, used when project_requirements gives no 'component_graph'
+DEFAULT_COMPONENT_GRAPH = {
+    "components": [
+        {"name": "Frontend", "latency_ms": 20, "kind": "client"},
+        {"name": "Backend API", "latency_ms": 15},
+        {"name": "AI Service", "latency_ms": 60},
+        {"name": "Database", "latency_ms": 8, "kind": "datastore"}
+    ],
+    "interactions": [
+        {"from": "Frontend", "to": "Backend API", "latency_ms": 20,
+         "protocol": "HTTPS/WSS", "data_format": "JSON/Protocol Buffers"},
+        {"from": "Backend API", "to": "AI Service", "latency_ms": 1,
+         "protocol": "gRPC", "data_format": "Protocol Buffers"},
+        {"from": "AI Service", "to": "Database", "latency_ms": 1,
+         "protocol": "SQL/MongoDB Protocol", "data_format": "BSON/SQL"}
+    ]
+}
+
+# Requirement fields (and tool fields) each design section reads; a section
+# missing here is assumed to read all of them. Sections reading nothing are
+# the same for every project.
+SECTION_DEPENDENCIES = {
+    "system_components": (),
+    "component_interactions": ("component_graph",),
+    "data_flow": (),
+    "latency_budgets": ("component_graph", "performance_requirements"),
+    "scalability_design": ("capacity", "performance_requirements", "scalability_level"),
+    "technical_stack": (),
+    "deployment_strategy": (),
+    "ai_components": (),
+    "model_deployment": (),
+    "data_pipeline": (),
+    "integration_points": (),
+    "performance_optimization": (),
+    "monitoring_strategy": (),
+    "security_layers": (),
+    "authentication": (),
+    "authorization": (),
+    "data_protection": (),
+    "security_monitoring": (),
+    "compliance_measures": (),
+    "cloud_architecture": (),
+    "networking": (),
+    "storage_solutions": (),
+    "scaling_strategy": ("capacity", "performance_requirements", "scalability_level"),
+    "disaster_recovery": (),
+    "monitoring_setup": (),
+}
+
+class ArchitectureDesigner(AsyncTool):
     """
     A tool for designing and validating system architectures, ensuring scalability,
     security, and proper integration of AI/ML components.
@@ -11,7 +79,15 @@ class ArchitectureDesigner(BaseTool):
     
     project_requirements: Dict = Field(
         ...,
-        description="Project requirements including technical specs, scalability needs, and AI/ML components"
+        description=(
+            "Project requirements including technical specs, scalability needs, and AI/ML components. "
+            "Optional 'capacity': {arrival_rate (requests/second), target_p99_ms (default from "
+            "performance_requirements.latency), cache_hit_ratio, tiers: [{name, service_ms, service_cv, "
+            "concurrency, hit_ratio}] along the request path, requests, seed} for capacity planning. Optional "
+            "'component_graph': {components: [{name, latency_ms, kind}], interactions: [{from, to, mode: "
+            "'sync'|'async', fan_out, parallel, latency_ms, protocol, data_format}], latency_budgets: "
+            "{entry component: ms}} for latency budgets along every request path"
+        )
     )
     
     design_type: str = Field(
@@ -21,9 +97,23 @@ class ArchitectureDesigner(BaseTool):
     
     scalability_level: Optional[str] = Field(
         "medium",
-        description="Required scalability level: 'high', 'medium', or 'low'"
+        description="Required scalability level: 'high', 'medium', or 'low'; anything else is planned as 'medium'"
+    )
+
+    design_id: Optional[str] = Field(
+        None,
+        description=(
+            "Names a design across calls. After the first call with an id, the result is a structural diff "
+            "(JSON-Patch-style operations) against the previous design of this id and type, with the "
+            "requirement fields that changed and the sections recomputed"
+        )
     )
 
+    # Capacity plans at the expected and the design load, simulated once per call
+    _capacity: Optional[Dict[str, Dict]] = None
+    # Typed component graph built from the requirements once per call
+    _graph: Optional[ComponentGraph] = None
+
     def run(self) -> str:
         """
         Generates architecture design and recommendations based on the specified parameters.
@@ -41,51 +131,90 @@ class ArchitectureDesigner(BaseTool):
 
     def _design_system_architecture(self) -> str:
         architecture = {
-            "system_components": self._define_system_components(),
-            "component_interactions": self._define_component_interactions(),
-            "data_flow": self._define_data_flow(),
-            "scalability_design": self._design_scalability_measures(),
-            "technical_stack": self._recommend_tech_stack(),
-            "deployment_strategy": self._define_deployment_strategy()
+            "system_components": self._define_system_components,
+            "component_interactions": self._define_component_interactions,
+            "data_flow": self._define_data_flow,
+            "latency_budgets": self._propagate_latency_budgets,
+            "scalability_design": self._design_scalability_measures,
+            "technical_stack": self._recommend_tech_stack,
+            "deployment_strategy": self._define_deployment_strategy
         }
         
-        return json.dumps(architecture, indent=2)
+        return self._build_design(architecture)
 
     def _design_ai_integration(self) -> str:
         ai_architecture = {
-            "ai_components": self._define_ai_components(),
-            "model_deployment": self._design_model_deployment(),
-            "data_pipeline": self._design_data_pipeline(),
-            "integration_points": self._define_integration_points(),
-            "performance_optimization": self._design_performance_optimization(),
-            "monitoring_strategy": self._define_ai_monitoring()
+            "ai_components": self._define_ai_components,
+            "model_deployment": self._design_model_deployment,
+            "data_pipeline": self._design_data_pipeline,
+            "integration_points": self._define_integration_points,
+            "performance_optimization": self._design_performance_optimization,
+            "monitoring_strategy": self._define_ai_monitoring
         }
         
-        return json.dumps(ai_architecture, indent=2)
+        return self._build_design(ai_architecture)
 
     def _design_security_architecture(self) -> str:
         security = {
-            "security_layers": self._define_security_layers(),
-            "authentication": self._design_authentication_system(),
-            "authorization": self._design_authorization_system(),
-            "data_protection": self._define_data_protection(),
-            "security_monitoring": self._design_security_monitoring(),
-            "compliance_measures": self._define_compliance_measures()
+            "security_layers": self._define_security_layers,
+            "authentication": self._design_authentication_system,
+            "authorization": self._design_authorization_system,
+            "data_protection": self._define_data_protection,
+            "security_monitoring": self._design_security_monitoring,
+            "compliance_measures": self._define_compliance_measures
         }
         
-        return json.dumps(security, indent=2)
+        return self._build_design(security)
 
     def _design_infrastructure(self) -> str:
         infrastructure = {
-            "cloud_architecture": self._design_cloud_infrastructure(),
-            "networking": self._design_network_architecture(),
-            "storage_solutions": self._design_storage_solutions(),
-            "scaling_strategy": self._define_scaling_strategy(),
-            "disaster_recovery": self._design_disaster_recovery(),
-            "monitoring_setup": self._design_monitoring_system()
+            "cloud_architecture": self._design_cloud_infrastructure,
+            "networking": self._design_network_architecture,
+            "storage_solutions": self._design_storage_solutions,
+            "scaling_strategy": self._define_scaling_strategy,
+            "disaster_recovery": self._design_disaster_recovery,
+            "monitoring_setup": self._design_monitoring_system
         }
         
-        return json.dumps(infrastructure, indent=2)
+        return self._build_design(infrastructure)
+
+    def _build_design(self, sections: Dict[str, Callable]) -> str:
+        """
+        Builds the design's sections, taking each from the design cache
+        unless a field it depends on changed. With a design_id and a
+        previous design under it, returns only what changed.
+        """
+        inputs = {**self.project_requirements, "scalability_level": self.scalability_level}
+        version = tool_code_version(type(self))
+        recomputed = []
+
+        def cached(name: str, compute: Callable) -> Callable:
+            def section():
+                key = design_cache.section_key(
+                    self.design_type, name, version, inputs, SECTION_DEPENDENCIES.get(name)
+                )
+                value, computed = design_cache.section(key, compute)
+                if computed:
+                    recomputed.append(name)
+                return value
+            return section
+
+        lazy = {name: cached(name, compute) for name, compute in sections.items()}
+        if not self.design_id:
+            return build_report(lazy)
+
+        previous = design_cache.previous(self.design_id, self.design_type)
+        document = {name: section() for name, section in lazy.items()}
+        design_cache.remember(self.design_id, self.design_type, inputs, document)
+        if previous is None:
+            return build_report(document)
+        previous_inputs, previous_document = previous
+        return build_report({
+            "design_id": self.design_id,
+            "changed_fields": changed_fields(previous_inputs, inputs),
+            "recomputed_sections": recomputed,
+            "changes": structural_diff(previous_document, document)
+        })
 
     def _define_system_components(self) -> List[Dict]:
         return [
@@ -116,26 +245,36 @@ class ArchitectureDesigner(BaseTool):
         ]
 
     def _define_component_interactions(self) -> List[Dict]:
-        return [
-            {
-                "from": "Frontend",
-                "to": "Backend API",
-                "protocol": "HTTPS/WSS",
-                "data_format": "JSON/Protocol Buffers"
-            },
-            {
-                "from": "Backend API",
-                "to": "AI Service",
-                "protocol": "gRPC",
-                "data_format": "Protocol Buffers"
-            },
-            {
-                "from": "AI Service",
-                "to": "Database",
-                "protocol": "SQL/MongoDB Protocol",
-                "data_format": "BSON/SQL"
-            }
-        ]
+        interactions = []
+        for call in self._component_graph().calls:
+            interaction = {"from": call.source, "to": call.target}
+            if call.protocol:
+                interaction["protocol"] = call.protocol
+            if call.data_format:
+                interaction["data_format"] = call.data_format
+            interaction.update(mode=call.mode, fan_out=call.fan_out, parallel=call.parallel, latency_ms=call.latency_ms)
+            interactions.append(interaction)
+        return interactions
+
+    def _component_graph(self) -> ComponentGraph:
+        if self._graph is None:
+            spec = self.project_requirements.get("component_graph") or DEFAULT_COMPONENT_GRAPH
+            self._graph = ComponentGraph.from_dicts(spec["components"], spec.get("interactions", []))
+        return self._graph
+
+    def _propagate_latency_budgets(self) -> Dict[str, Dict]:
+        """
+        End-to-end latency of the request path from every entry point
+        against its budget (by default the latency requirement), the hop
+        that dominates it, and each hop's proportional share of the budget.
+        """
+        graph = self._component_graph()
+        budgets = (self.project_requirements.get("component_graph") or {}).get("latency_budgets")
+        if not budgets:
+            latency = self.project_requirements.get("performance_requirements", {}).get("latency")
+            budget = _parse_latency_ms(latency) or DEFAULT_TARGET_P99_MS
+            budgets = {entry: budget for entry in graph.entry_points()}
+        return graph.budgets(budgets)
 
     def _define_data_flow(self) -> List[Dict]:
         return [
@@ -160,9 +299,13 @@ class ArchitectureDesigner(BaseTool):
         ]
 
     def _design_scalability_measures(self) -> Dict:
-        return {
+        design = self._plan_capacity()["design"]
+        replicas = {tier["name"]: tier["replicas"] for tier in design["tiers"]}
+        measures = {
+            "capacity_plan": design,
             "horizontal_scaling": {
-                "components": ["API Servers", "AI Services"],
+                "components": [name for name, count in replicas.items() if count > 1],
+                "replicas": replicas,
                 "strategy": "Auto-scaling based on load"
             },
             "vertical_scaling": {
@@ -175,6 +318,55 @@ class ArchitectureDesigner(BaseTool):
                 "strategy": "Read-heavy data caching"
             }
         }
+        for tier in self._capacity_settings()["tiers"]:
+            if tier["name"] == "Cache":
+                measures["caching"]["hit_ratio"] = tier["hit_ratio"]
+        return measures
+
+    def _capacity_settings(self) -> Dict:
+        settings = dict(self.project_requirements.get("capacity", {}))
+        if "target_p99_ms" not in settings:
+            latency = self.project_requirements.get("performance_requirements", {}).get("latency")
+            settings["target_p99_ms"] = _parse_latency_ms(latency) or DEFAULT_TARGET_P99_MS
+        settings.setdefault("arrival_rate", DEFAULT_ARRIVAL_RATE)
+        settings["tiers"] = tier_specs(settings.get("tiers"))
+        if "cache_hit_ratio" in settings:
+            for tier in settings["tiers"]:
+                if tier["name"] == "Cache":
+                    tier["hit_ratio"] = settings["cache_hit_ratio"]
+        return settings
+
+    def _plan_capacity(self) -> Dict[str, Dict]:
+        """
+        Replica counts meeting the latency target at the expected load and at
+        the design load (the expected load times the scalability level's
+        headroom), from simulating requests through the request path.
+        """
+        if self._capacity is None:
+            level = (self.scalability_level or "medium").strip().lower()
+            if level not in SCALABILITY_HEADROOM:
+                level = "medium"
+            settings = self._capacity_settings()
+            target, floor = settings["target_p99_ms"], SCALABILITY_MIN_REPLICAS[level]
+
+            def simulate(rate: float, start: Optional[List[int]] = None) -> Dict:
+                simulator = CapacitySimulator(
+                    rate, settings["tiers"],
+                    requests=settings.get("requests", DEFAULT_REQUESTS), seed=settings.get("seed", 0)
+                )
+                return simulator.plan(target, min_replicas=floor, start=start)
+
+            expected = simulate(settings["arrival_rate"])
+            design = simulate(
+                settings["arrival_rate"] * SCALABILITY_HEADROOM[level],
+                [tier["replicas"] for tier in expected["tiers"]]
+            )
+            design["scalability_level"] = level
+            if level != (self.scalability_level or "").strip().lower():
+                design["requested_scalability_level"] = self.scalability_level
+            design["headroom"] = SCALABILITY_HEADROOM[level]
+            self._capacity = {"expected": expected, "design": design}
+        return self._capacity
 
     def _recommend_tech_stack(self) -> Dict:
         return {
@@ -383,10 +575,18 @@ class ArchitectureDesigner(BaseTool):
         }
 
     def _define_scaling_strategy(self) -> Dict:
+        capacity = self._plan_capacity()
         return {
             "auto_scaling": {
                 "triggers": ["CPU", "Memory", "Custom Metrics"],
-                "policies": ["Target Tracking", "Step Scaling"]
+                "policies": ["Target Tracking", "Step Scaling"],
+                # Scale between what the expected load needs and what the design load needs
+                "replicas": {
+                    expected["name"]: {"min": expected["replicas"], "max": design["replicas"]}
+                    for expected, design in zip(capacity["expected"]["tiers"], capacity["design"]["tiers"])
+                },
+                "target_p99_ms": capacity["design"]["target_p99_ms"],
+                "meets_target": capacity["expected"]["meets_target"] and capacity["design"]["meets_target"]
             },
             "load_balancing": {
                 "type": "Application Load Balancer",
@@ -411,6 +611,16 @@ class ArchitectureDesigner(BaseTool):
         }
 
 
+def _parse_latency_ms(latency) -> Optional[float]:
+    # '< 200ms', '0.5 s' or a number of milliseconds
+    if isinstance(latency, (int, float)):
+        return float(latency)
+    match = re.search(r"(\d+(?:\.\d+)?)\s*(ms|s)\b", str(latency or ""))
+    if not match:
+        return None
+    return float(match.group(1)) * (1000 if match.group(2) == "s" else 1)
+
+
 if __name__ == "__main__":
     # Test the ArchitectureDesigner tool
     test_requirements = {
@@ -432,4 +642,49 @@ if __name__ == "__main__":
     )
     
     print("Testing ArchitectureDesigner tool:")
-    print(designer.run()) 
\ No newline at end of file
+    print(designer.run())
+
+    infrastructure = ArchitectureDesigner(
+        project_requirements={
+            **test_requirements,
+            "capacity": {"arrival_rate": 1500, "cache_hit_ratio": 0.9}
+        },
+        design_type="infrastructure",
+        scalability_level="medium"
+    )
+    print(infrastructure.run())
+
+    microservices = ArchitectureDesigner(
+        project_requirements={
+            **test_requirements,
+            "component_graph": {
+                "components": [
+                    {"name": "Gateway", "latency_ms": 2},
+                    {"name": "Orders", "latency_ms": 12},
+                    {"name": "Inventory", "latency_ms": 6},
+                    {"name": "Pricing", "latency_ms": 25},
+                    {"name": "Orders DB", "latency_ms": 5, "kind": "datastore"},
+                    {"name": "Notifications", "latency_ms": 40}
+                ],
+                "interactions": [
+                    {"from": "Gateway", "to": "Orders", "latency_ms": 1},
+                    {"from": "Orders", "to": "Inventory", "fan_out": 3, "parallel": True, "latency_ms": 1},
+                    {"from": "Orders", "to": "Pricing", "latency_ms": 1},
+                    {"from": "Orders", "to": "Orders DB", "fan_out": 2, "latency_ms": 0.5},
+                    {"from": "Orders", "to": "Notifications", "mode": "async"}
+                ],
+                "latency_budgets": {"Gateway": 60, "Notifications": 100}
+            }
+        },
+        design_type="system"
+    )
+    print(microservices.run())
+
+    # A named design: the second call returns only what the changed load altered
+    for arrival_rate in (500, 2000):
+        revision = ArchitectureDesigner(
+            project_requirements={**test_requirements, "capacity": {"arrival_rate": arrival_rate}},
+            design_type="infrastructure",
+            design_id="test-design"
+        )
+        print(revision.run()) 
\ No newline at end of file
@@ -1,9 +1,46 @@
-from agency_swarm.tools import BaseTool
 from pydantic import Field
-from typing import Dict, List, Optional
-import json
-
-class TechEvaluator(BaseTool):
+from typing import Dict, List, Optional, Union
+import math
+import os
+if __name__ == "__main__" and not __package__:
+    # Run as a script: the shared modules live in the agency root
+    import sys
+    from pathlib import Path
+    sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from common.async_tool import AsyncTool
+from common.cloud_costs import cost_model_version, get_cost_model, unknown_parameters, workload_spec as cloud_workload_spec
+from common.db_workloads import get_benchmark_results, workload_spec
+from common.scoring import WeightedScoring
+from common.tech_catalog import open_catalog
+from common.tool_stream import build_report
+from common.tool_cache import cached_run
+
+CATALOG_PATH = os.getenv("AGENCY_TECH_CATALOG_PATH") or os.path.join(os.path.dirname(__file__), "tech_catalog.json")
+
+# Technologies of each kind returned when evaluation_context sets no 'max_candidates'
+DEFAULT_CANDIDATES = 5
+
+# evaluation_context keys that configure the lookup rather than describe the project
+LOOKUP_KEYS = {
+    "candidates", "required_features", "categories", "max_candidates", "lower_is_better", "workload", "cloud_workload"
+}
+
+# Embedded engine benchmarked in place of each database category; others are not measured
+DATABASE_STAND_INS = {
+    "Relational": "sqlite",
+    "Embedded": "sqlite",
+    "Columnar": "sqlite",
+    "Document": "document",
+    "Search": "document",
+    "In-memory": "key_value",
+    "Key-value": "key_value",
+    "Wide-column": "key_value",
+}
+
+# Candidates shown in the comparison matrix; the ranking covers all of them
+MATRIX_CANDIDATES = 10
+
+class TechEvaluator(AsyncTool):
     """
     A tool for evaluating and selecting technologies, frameworks, and tools
     based on project requirements and constraints.
@@ -11,7 +48,17 @@ class TechEvaluator(BaseTool):
     
     evaluation_context: Dict = Field(
         ...,
-        description="Context for evaluation including project requirements, constraints, and preferences"
+        description=(
+            "Context for evaluation including project requirements, constraints, and preferences; its text "
+            "ranks technologies from the catalog. Optional 'required_features': [features every candidate "
+            "must have], 'categories': [e.g. 'Backend', 'Relational'], 'max_candidates' (default 5), "
+            "'candidates': {name: {criterion: score}} to rank instead of catalog frameworks, and "
+            "'lower_is_better': [criteria such as cost or latency where smaller scores win], and 'workload' "
+            "{shape: 'read_heavy'|'mixed'|'write_heavy'|'read_only' or read_fraction, records, operations, "
+            "value_bytes, key_distribution: 'zipfian'|'uniform', seed} for database measurements, and "
+            "'cloud_workload' {rps, response_kb, storage_gb, database_gb, growth_per_month, months, ...; "
+            "optional 'sweep': {parameter: [values]}} for cloud cost projections"
+        )
     )
     
     evaluation_type: str = Field(
@@ -19,15 +66,28 @@ class TechEvaluator(BaseTool):
         description="Type of evaluation: 'framework', 'database', 'cloud_service', 'ai_platform', or 'development_tool'"
     )
     
-    comparison_criteria: Optional[List[str]] = Field(
+    comparison_criteria: Optional[Union[List[str], Dict[str, float]]] = Field(
         None,
-        description="Specific criteria to focus on during evaluation"
+        description=(
+            "Specific criteria to focus on during evaluation, as a list (equal weights) or "
+            "{criterion: weight}; defaults to every criterion the candidates are scored on"
+        )
     )
 
+    # Catalog matches and candidate ranking computed once per run and shared by the sections
+    _relevant: Optional[Dict[str, List[Dict]]] = None
+    _scoring: Optional[WeightedScoring] = None
+    _scoring_error: Optional[str] = None
+    _pricing: Optional[Dict] = None
+
+    @cached_run
     def run(self) -> str:
         """
         Evaluates technologies based on the specified context and type.
         """
+        if self._max_candidates() is None:
+            return (f"Invalid max_candidates specified: {self.evaluation_context['max_candidates']!r}, "
+                    "expected a positive whole number")
         if self.evaluation_type == "framework":
             return self._evaluate_frameworks()
         elif self.evaluation_type == "database":
@@ -41,107 +101,170 @@ class TechEvaluator(BaseTool):
         else:
             return "Invalid evaluation type specified"
 
+    def cache_dependencies(self) -> List[str]:
+        # Cached results must not outlive the catalog the candidates come from or the cloud price sheet
+        return [open_catalog(CATALOG_PATH).source_sha256, cost_model_version()]
+
     def _evaluate_frameworks(self) -> str:
         framework_evaluation = {
-            "evaluated_frameworks": self._identify_relevant_frameworks(),
-            "comparison_matrix": self._create_comparison_matrix(),
-            "performance_analysis": self._analyze_performance_metrics(),
-            "community_analysis": self._analyze_community_health(),
-            "recommendation": self._generate_framework_recommendation()
+            "evaluated_frameworks": self._identify_relevant_frameworks,
+            "comparison_matrix": self._create_comparison_matrix,
+            "ranking": self._rank_candidates,
+            "sensitivity_analysis": self._analyze_weight_sensitivity,
+            "performance_analysis": self._analyze_performance_metrics,
+            "community_analysis": self._analyze_community_health,
+            "recommendation": self._generate_framework_recommendation
         }
         
-        return json.dumps(framework_evaluation, indent=2)
+        return build_report(framework_evaluation)
 
     def _evaluate_databases(self) -> str:
         database_evaluation = {
-            "evaluated_databases": self._identify_relevant_databases(),
-            "scalability_analysis": self._analyze_database_scalability(),
-            "performance_metrics": self._analyze_database_performance(),
-            "cost_analysis": self._analyze_database_costs(),
-            "recommendation": self._generate_database_recommendation()
+            "evaluated_databases": self._identify_relevant_databases,
+            "scalability_analysis": self._analyze_database_scalability,
+            "performance_metrics": self._analyze_database_performance,
+            "cost_analysis": self._analyze_database_costs,
+            "recommendation": self._generate_database_recommendation
         }
         
-        return json.dumps(database_evaluation, indent=2)
+        return build_report(database_evaluation)
 
     def _evaluate_cloud_services(self) -> str:
         cloud_evaluation = {
-            "evaluated_services": self._identify_relevant_cloud_services(),
-            "feature_comparison": self._compare_cloud_features(),
-            "pricing_analysis": self._analyze_cloud_pricing(),
-            "reliability_metrics": self._analyze_cloud_reliability(),
-            "recommendation": self._generate_cloud_recommendation()
+            "evaluated_services": self._identify_relevant_cloud_services,
+            "feature_comparison": self._compare_cloud_features,
+            "pricing_analysis": self._analyze_cloud_pricing,
+            "reliability_metrics": self._analyze_cloud_reliability,
+            "recommendation": self._generate_cloud_recommendation
         }
         
-        return json.dumps(cloud_evaluation, indent=2)
+        return build_report(cloud_evaluation)
 
     def _evaluate_ai_platforms(self) -> str:
         ai_evaluation = {
-            "evaluated_platforms": self._identify_relevant_ai_platforms(),
-            "capability_analysis": self._analyze_ai_capabilities(),
-            "integration_assessment": self._assess_ai_integration(),
-            "performance_benchmarks": self._analyze_ai_performance(),
-            "recommendation": self._generate_ai_platform_recommendation()
+            "evaluated_platforms": self._identify_relevant_ai_platforms,
+            "capability_analysis": self._analyze_ai_capabilities,
+            "integration_assessment": self._assess_ai_integration,
+            "performance_benchmarks": self._analyze_ai_performance,
+            "recommendation": self._generate_ai_platform_recommendation
         }
         
-        return json.dumps(ai_evaluation, indent=2)
+        return build_report(ai_evaluation)
 
     def _evaluate_development_tools(self) -> str:
         tool_evaluation = {
-            "evaluated_tools": self._identify_relevant_tools(),
-            "feature_comparison": self._compare_tool_features(),
-            "integration_analysis": self._analyze_tool_integration(),
-            "team_impact": self._assess_team_impact(),
-            "recommendation": self._generate_tool_recommendation()
+            "evaluated_tools": self._identify_relevant_tools,
+            "feature_comparison": self._compare_tool_features,
+            "integration_analysis": self._analyze_tool_integration,
+            "team_impact": self._assess_team_impact,
+            "recommendation": self._generate_tool_recommendation
         }
         
-        return json.dumps(tool_evaluation, indent=2)
+        return build_report(tool_evaluation)
+
+    def _find_technologies(self, kind: str) -> List[Dict]:
+        if self._relevant is None:
+            self._relevant = {}
+        if kind not in self._relevant:
+            context = self.evaluation_context
+            self._relevant[kind] = open_catalog(CATALOG_PATH).search(
+                kind,
+                required_features=context.get("required_features", []),
+                categories=context.get("categories", []),
+                preferred=_context_text({k: v for k, v in context.items() if k not in LOOKUP_KEYS}),
+                limit=self._max_candidates()
+            )
+        return self._relevant[kind]
+
+    def _max_candidates(self) -> Optional[int]:
+        # Agents may send the count as text ("3"); None when it is not a positive whole number
+        try:
+            limit = int(self.evaluation_context.get("max_candidates", DEFAULT_CANDIDATES))
+        except (TypeError, ValueError):
+            return None
+        return limit if limit > 0 else None
 
     def _identify_relevant_frameworks(self) -> List[Dict]:
         return [
             {
-                "name": "React",
-                "category": "Frontend",
-                "version": "18.x",
-                "key_features": ["Component-based", "Virtual DOM", "Large ecosystem"]
-            },
-            {
-                "name": "FastAPI",
-                "category": "Backend",
-                "version": "0.100.x",
-                "key_features": ["Async support", "Auto OpenAPI docs", "Type hints"]
-            },
-            {
-                "name": "Flutter",
-                "category": "Mobile",
-                "version": "3.x",
-                "key_features": ["Cross-platform", "Hot reload", "Rich widgets"]
+                "name": entry["name"],
+                "category": entry["category"],
+                "version": entry.get("version"),
+                "key_features": entry["key_features"]
             }
+            for entry in self._find_technologies("framework")
         ]
 
+    def _candidates(self) -> Dict[str, Dict[str, float]]:
+        candidates = self.evaluation_context.get("candidates")
+        if candidates:
+            return candidates
+        return {entry["name"]: entry.get("metrics", {}) for entry in self._find_technologies("framework")}
+
+    def _unscored_criteria(self) -> List[str]:
+        scored = {criterion for scores in self._candidates().values() for criterion in scores}
+        return [criterion for criterion in self.comparison_criteria or [] if criterion not in scored]
+
+    def _score_candidates(self) -> Optional[WeightedScoring]:
+        if self._scoring is None and self._scoring_error is None and self._candidates():
+            candidates = self._candidates()
+            # Criteria no candidate has a score for cannot rank them; they are reported instead,
+            # and when none of the requested ones is scored, every scored criterion ranks
+            unscored = set(self._unscored_criteria())
+            criteria = self.comparison_criteria
+            if isinstance(criteria, dict):
+                criteria = {c: weight for c, weight in criteria.items() if c not in unscored}
+            elif criteria:
+                criteria = [c for c in criteria if c not in unscored]
+            if not criteria:
+                criteria = list(dict.fromkeys(c for scores in candidates.values() for c in scores))
+            if not criteria:
+                return None
+            try:
+                self._scoring = WeightedScoring(
+                    candidates, criteria, self.evaluation_context.get("lower_is_better", [])
+                )
+            except ValueError as e:
+                # Weights that cannot rank anything (all zero, negative or not numbers) are
+                # explained in the report rather than failing the whole evaluation
+                self._scoring_error = str(e)
+        return self._scoring
+
     def _create_comparison_matrix(self) -> Dict:
+        scoring = self._score_candidates()
+        if scoring is None:
+            return {}
+        shown = scoring.order[:MATRIX_CANDIDATES]
         return {
-            "performance": {
-                "React": 9,
-                "FastAPI": 9.5,
-                "Flutter": 8.5
-            },
-            "developer_experience": {
-                "React": 9,
-                "FastAPI": 9,
-                "Flutter": 8
-            },
-            "community_support": {
-                "React": 9.5,
-                "FastAPI": 8,
-                "Flutter": 8.5
-            },
-            "learning_curve": {
-                "React": 7,
-                "FastAPI": 8,
-                "Flutter": 6
+            criterion: {
+                scoring.names[i]: float(scoring.values[i, k])
+                for i in shown if not math.isnan(scoring.values[i, k])
             }
+            for k, criterion in enumerate(scoring.criteria)
         }
 
+    def _rank_candidates(self) -> Dict:
+        scoring = self._score_candidates()
+        if scoring is None:
+            ranking = {"weights": {}, "candidates": 0, "top": [], "unscored_criteria": self._unscored_criteria()}
+            if self._scoring_error:
+                ranking["error"] = self._scoring_error
+            return ranking
+        ranking = {
+            "weights": {criterion: round(weight, 4) for criterion, weight in scoring.weights.items()},
+            "candidates": len(scoring.names),
+            "top": scoring.ranking(MATRIX_CANDIDATES),
+            "unscored_criteria": self._unscored_criteria()
+        }
+        if scoring.non_numeric:
+            # Ranked as missing scores
+            ranking["non_numeric_scores"] = scoring.non_numeric
+        return ranking
+
+    def _analyze_weight_sensitivity(self) -> List[Dict]:
+        scoring = self._score_candidates()
+        return scoring.sensitivity() if scoring is not None else []
+
     def _analyze_performance_metrics(self) -> Dict:
         return {
             "load_time": {
@@ -175,38 +298,62 @@ class TechEvaluator(BaseTool):
         }
 
     def _generate_framework_recommendation(self) -> Dict:
+        scoring = self._score_candidates()
+        if self._scoring_error:
+            return {
+                "recommended_framework": None,
+                "reasoning": [f"The candidates cannot be ranked: {self._scoring_error}"],
+                "considerations": ["Give at least one comparison criterion a positive numeric weight"]
+            }
+        if scoring is None and self._candidates():
+            return {
+                "recommended_framework": None,
+                "reasoning": ["No candidate has a score for any criterion"],
+                "considerations": ["Give the candidates scores in 'candidates' or rank catalog frameworks instead"]
+            }
+        if scoring is None:
+            return {
+                "recommended_framework": None,
+                "reasoning": ["No framework in the catalog matches the required features and categories"],
+                "considerations": ["Relax 'required_features' or 'categories'"]
+            }
+        winner = scoring.winner
+        score = scoring.ranking(1)[0]["score"]
+        reasoning = [
+            f"{criterion} contributes {contribution:.2f} of its {score:.2f} weighted score"
+            for criterion, contribution in list(scoring.contributions(winner).items())[:3] if contribution > 0
+        ]
+
+        # Weight changes that would change the recommendation, nearest first
+        flips = []
+        for row in scoring.sensitivity():
+            if row["flips_above"] is not None:
+                flips.append((row["flips_above"] - row["weight"], f"{row['winner_above']} wins if {row['criterion']} "
+                              f"weighs more than {row['flips_above']:.0%} (now {row['weight']:.0%})"))
+            if row["flips_below"] is not None:
+                flips.append((row["weight"] - row["flips_below"], f"{row['winner_below']} wins if {row['criterion']} "
+                              f"weighs less than {row['flips_below']:.0%} (now {row['weight']:.0%})"))
+        considerations = [note for _, note in sorted(flips)[:3]]
+        requested = list(self.comparison_criteria or [])
+        if requested and set(requested) <= set(self._unscored_criteria()):
+            reasoning.insert(0, f"No candidate is scored on {', '.join(requested)}; "
+                                f"ranked on {', '.join(scoring.criteria)} instead")
+        if scoring.non_numeric:
+            reasoning.append(f"{len(scoring.non_numeric)} score(s) that are not numbers were ranked as missing; "
+                             "see ranking.non_numeric_scores")
+
         return {
-            "recommended_framework": "FastAPI",
-            "reasoning": [
-                "Best performance metrics",
-                "Excellent developer experience",
-                "Strong type safety",
-                "Growing community support"
-            ],
-            "considerations": [
-                "Team expertise required",
-                "Integration complexity",
-                "Learning curve for new developers"
-            ]
+            "recommended_framework": winner,
+            "score": score,
+            "runner_up": scoring.ranking(2)[1]["name"] if len(scoring.names) > 1 else None,
+            "reasoning": reasoning,
+            "considerations": considerations or ["The recommendation holds under any single weight change"]
         }
 
     def _identify_relevant_databases(self) -> List[Dict]:
         return [
-            {
-                "name": "PostgreSQL",
-                "type": "Relational",
-                "key_features": ["ACID", "JSON support", "Extensibility"]
-            },
-            {
-                "name": "MongoDB",
-                "type": "Document",
-                "key_features": ["Scalability", "Flexibility", "Rich queries"]
-            },
-            {
-                "name": "Redis",
-                "type": "In-memory",
-                "key_features": ["Speed", "Caching", "Data structures"]
-            }
+            {"name": entry["name"], "type": entry["category"], "key_features": entry["key_features"]}
+            for entry in self._find_technologies("database")
         ]
 
     def _analyze_database_scalability(self) -> Dict:
@@ -224,17 +371,28 @@ class TechEvaluator(BaseTool):
         }
 
     def _analyze_database_performance(self) -> Dict:
+        workload = workload_spec(self.evaluation_context.get("workload"))
+        results = get_benchmark_results()
+        measured, stand_ins, not_measured = {}, {}, []
+        for entry in self._find_technologies("database"):
+            backend = DATABASE_STAND_INS.get(entry["category"])
+            if backend is None:
+                not_measured.append(entry["name"])
+                continue
+            stand_ins[entry["name"]] = backend
+            if backend not in measured:
+                # Each stand-in runs once per workload and environment; later calls read the stored result
+                measured[backend] = results.measure(backend, workload)
+
         return {
-            "read_performance": {
-                "PostgreSQL": "Very Good",
-                "MongoDB": "Excellent",
-                "Redis": "Outstanding"
+            "workload": workload,
+            "read_performance": {name: measured[b]["read"].summary() for name, b in stand_ins.items()},
+            "write_performance": {name: measured[b]["write"].summary() for name, b in stand_ins.items()},
+            "throughput_ops_per_second": {
+                name: measured[b]["throughput_ops_per_second"] for name, b in stand_ins.items()
             },
-            "write_performance": {
-                "PostgreSQL": "Good",
-                "MongoDB": "Very Good",
-                "Redis": "Outstanding"
-            }
+            "measured_with": stand_ins,
+            "not_measured": not_measured
         }
 
     def _analyze_database_costs(self) -> Dict:
@@ -266,15 +424,11 @@ class TechEvaluator(BaseTool):
     def _identify_relevant_cloud_services(self) -> List[Dict]:
         return [
             {
-                "provider": "AWS",
-                "key_services": ["ECS", "RDS", "S3", "Lambda"],
-                "strengths": ["Market leader", "Feature-rich", "Global presence"]
-            },
-            {
-                "provider": "GCP",
-                "key_services": ["GKE", "Cloud SQL", "Cloud Storage", "Cloud Functions"],
-                "strengths": ["AI/ML focus", "Network performance", "Innovation"]
+                "provider": entry["name"],
+                "key_services": entry.get("key_services", []),
+                "strengths": entry["key_features"]
             }
+            for entry in self._find_technologies("cloud_service")
         ]
 
     def _compare_cloud_features(self) -> Dict:
@@ -290,16 +444,36 @@ class TechEvaluator(BaseTool):
         }
 
     def _analyze_cloud_pricing(self) -> Dict:
-        return {
-            "compute_costs": {
-                "AWS": "Pay per second",
-                "GCP": "Pay per second with sustained use discounts"
-            },
-            "storage_costs": {
-                "AWS": "Tiered pricing",
-                "GCP": "Tiered pricing with automatic discounts"
-            }
+        if self._pricing is not None:
+            return self._pricing
+        model = get_cost_model()
+        workload = dict(self.evaluation_context.get("cloud_workload", {}))
+        sweep = workload.pop("sweep", None)
+        providers = [service["provider"] for service in self._identify_relevant_cloud_services()]
+        priced, not_priced = model.priced_providers(providers)
+        projected = model.project(workload, priced)
+
+        pricing = {
+            "price_sheet": model.version,
+            "currency": model.currency,
+            "workload": cloud_workload_spec(workload),
+            "projected_costs": projected,
+            "cheapest_provider": min(projected, key=lambda provider: projected[provider]["total_cost"]),
+            "not_priced": not_priced
         }
+        ignored = unknown_parameters(workload)
+        if ignored:
+            pricing["ignored_parameters"] = ignored
+        if sweep:
+            result = model.sweep(workload, sweep, priced)
+            cheapest = result["cheapest"]
+            pricing["scaling_curves"] = model.scaling_curves(workload, sweep, priced)
+            pricing["sweep"] = {
+                "configurations": len(cheapest),
+                "cheapest_share": {provider: round(float((cheapest == provider).mean()), 3) for provider in priced}
+            }
+        self._pricing = pricing
+        return pricing
 
     def _analyze_cloud_reliability(self) -> Dict:
         return {
@@ -314,28 +488,32 @@ class TechEvaluator(BaseTool):
         }
 
     def _generate_cloud_recommendation(self) -> Dict:
+        pricing = self._analyze_cloud_pricing()
+        projected = pricing["projected_costs"]
+        ranked = sorted(projected, key=lambda provider: projected[provider]["total_cost"])
+        cheapest = pricing["cheapest_provider"]
+        months = len(projected[cheapest]["monthly_cost"])
+        reasoning = [
+            f"Lowest projected cost: {projected[cheapest]['total_cost']:,.0f} {pricing['currency']} "
+            f"over {months} months",
+            f"Runs on {projected[cheapest]['last_month']['instances']} with "
+            f"{projected[cheapest]['last_month']['database_nodes']} by the last month"
+        ]
+        if len(ranked) > 1:
+            runner_up = ranked[1]
+            gap = projected[runner_up]["total_cost"] / projected[cheapest]["total_cost"] - 1
+            reasoning.append(f"{runner_up}, the next cheapest, costs {gap:.0%} more")
+        if pricing["not_priced"]:
+            reasoning.append(f"No prices for {', '.join(pricing['not_priced'])}, so they were not compared")
         return {
-            "recommended_provider": "AWS",
-            "reasoning": [
-                "Comprehensive service offering",
-                "Strong market presence",
-                "Extensive documentation",
-                "Rich ecosystem"
-            ]
+            "recommended_provider": cheapest,
+            "reasoning": reasoning
         }
 
     def _identify_relevant_ai_platforms(self) -> List[Dict]:
         return [
-            {
-                "name": "TensorFlow",
-                "type": "ML Framework",
-                "key_features": ["Production-ready", "TensorFlow Serving", "TPU support"]
-            },
-            {
-                "name": "PyTorch",
-                "type": "ML Framework",
-                "key_features": ["Dynamic graphs", "Research-friendly", "TorchServe"]
-            }
+            {"name": entry["name"], "type": entry["category"], "key_features": entry["key_features"]}
+            for entry in self._find_technologies("ai_platform")
         ]
 
     def _analyze_ai_capabilities(self) -> Dict:
@@ -386,18 +564,15 @@ class TechEvaluator(BaseTool):
         }
 
     def _identify_relevant_tools(self) -> List[Dict]:
-        return [
-            {
-                "category": "CI/CD",
-                "tools": ["GitHub Actions", "Jenkins", "GitLab CI"],
-                "key_features": ["Automation", "Integration", "Scalability"]
-            },
-            {
-                "category": "Monitoring",
-                "tools": ["Prometheus", "Grafana", "ELK Stack"],
-                "key_features": ["Metrics", "Visualization", "Logging"]
-            }
-        ]
+        # Grouped by category, in the order each category's best match ranks
+        categories: Dict[str, Dict] = {}
+        for entry in self._find_technologies("development_tool"):
+            group = categories.setdefault(
+                entry["category"], {"category": entry["category"], "tools": [], "key_features": []}
+            )
+            group["tools"].append(entry["name"])
+            group["key_features"].extend(f for f in entry["key_features"] if f not in group["key_features"])
+        return list(categories.values())
 
     def _compare_tool_features(self) -> Dict:
         return {
@@ -451,7 +626,20 @@ class TechEvaluator(BaseTool):
         }
 
 
+def _context_text(value) -> List[str]:
+    # Every string in the evaluation context, however deeply nested
+    if isinstance(value, str):
+        return [value]
+    if isinstance(value, dict):
+        value = list(value.values())
+    if isinstance(value, (list, tuple)):
+        return [text for item in value for text in _context_text(item)]
+    return []
+
+
 if __name__ == "__main__":
+    os.environ.setdefault("AGENCY_DB_BENCHMARK_PATH", ":memory:")
+
     # Test the TechEvaluator tool
     test_context = {
         "project_type": "AI-powered Web Application",
@@ -472,4 +660,30 @@ if __name__ == "__main__":
     )
     
     print("Testing TechEvaluator tool:")
-    print(evaluator.run()) 
\ No newline at end of file
+    print(evaluator.run())
+
+    weighted = TechEvaluator(
+        evaluation_context=test_context,
+        evaluation_type="framework",
+        comparison_criteria={"performance": 2, "community_support": 3, "learning_curve": 1}
+    )
+    print(weighted.run())
+
+    databases = TechEvaluator(
+        evaluation_context={**test_context, "workload": {"shape": "mixed", "operations": 5000}},
+        evaluation_type="database"
+    )
+    print(databases.run())
+
+    clouds = TechEvaluator(
+        evaluation_context={
+            **test_context,
+            "cloud_workload": {
+                "rps": 500,
+                "database_gb": 200,
+                "sweep": {"rps": [100, 1000, 10000], "response_kb": [5, 50, 500]}
+            }
+        },
+        evaluation_type="cloud_service"
+    )
+    print(clouds.run()) 
\ No newline at end of file
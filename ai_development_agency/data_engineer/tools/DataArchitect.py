@@ -1,9 +1,15 @@
-from agency_swarm.tools import BaseTool
 from pydantic import Field
 from typing import Dict, List, Optional
-import json
+if __name__ == "__main__" and not __package__:
+    # Run as a script: the shared modules live in the agency root
+    import sys
+    from pathlib import Path
+    sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from common.async_tool import AsyncTool
+from common.tool_stream import build_report
+from common.tool_cache import cached_run
 
-class DataArchitect(BaseTool):
+class DataArchitect(AsyncTool):
     """
     A tool for designing and managing data infrastructure,
     data models, and data flows.
@@ -24,6 +30,7 @@ class DataArchitect(BaseTool):
         description="Target environment: 'development', 'staging', or 'production'"
     )
 
+    @cached_run
     def run(self) -> str:
         """
         Designs and manages data architecture based on the specified parameters.
@@ -41,43 +48,43 @@ class DataArchitect(BaseTool):
 
     def _design_infrastructure(self) -> str:
         infrastructure = {
-            "storage": self._design_storage_layer(),
-            "processing": self._design_processing_layer(),
-            "serving": self._design_serving_layer(),
-            "security": self._design_security_layer()
+            "storage": self._design_storage_layer,
+            "processing": self._design_processing_layer,
+            "serving": self._design_serving_layer,
+            "security": self._design_security_layer
         }
         
-        return json.dumps(infrastructure, indent=2)
+        return build_report(infrastructure)
 
     def _design_data_model(self) -> str:
         model = {
-            "schemas": self._define_schemas(),
-            "relationships": self._define_relationships(),
-            "validation": self._define_validation_rules(),
-            "documentation": self._create_documentation()
+            "schemas": self._define_schemas,
+            "relationships": self._define_relationships,
+            "validation": self._define_validation_rules,
+            "documentation": self._create_documentation
         }
         
-        return json.dumps(model, indent=2)
+        return build_report(model)
 
     def _design_pipeline(self) -> str:
         pipeline = {
-            "ingestion": self._design_ingestion_layer(),
-            "processing": self._design_transformation_layer(),
-            "storage": self._design_persistence_layer(),
-            "monitoring": self._design_monitoring_layer()
+            "ingestion": self._design_ingestion_layer,
+            "processing": self._design_transformation_layer,
+            "storage": self._design_persistence_layer,
+            "monitoring": self._design_monitoring_layer
         }
         
-        return json.dumps(pipeline, indent=2)
+        return build_report(pipeline)
 
     def _design_integration(self) -> str:
         integration = {
-            "connectors": self._design_connectors(),
-            "apis": self._design_apis(),
-            "sync": self._design_synchronization(),
-            "monitoring": self._design_integration_monitoring()
+            "connectors": self._design_connectors,
+            "apis": self._design_apis,
+            "sync": self._design_synchronization,
+            "monitoring": self._design_integration_monitoring
         }
         
-        return json.dumps(integration, indent=2)
+        return build_report(integration)
 
     def _design_storage_layer(self) -> Dict:
         return {
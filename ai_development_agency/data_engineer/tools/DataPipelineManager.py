@@ -1,9 +1,15 @@
-from agency_swarm.tools import BaseTool
 from pydantic import Field
 from typing import Dict, List, Optional
-import json
+if __name__ == "__main__" and not __package__:
+    # Run as a script: the shared modules live in the agency root
+    import sys
+    from pathlib import Path
+    sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from common.async_tool import AsyncTool
+from common.tool_stream import build_report
+from common.tool_cache import cached_run
 
-class DataPipelineManager(BaseTool):
+class DataPipelineManager(AsyncTool):
     """
     A tool for managing data pipelines, ETL/ELT workflows,
     and data processing jobs.
@@ -24,6 +30,7 @@ class DataPipelineManager(BaseTool):
         description="Target environment: 'development', 'staging', or 'production'"
     )
 
+    @cached_run
     def run(self) -> str:
         """
         Manages data pipeline operations based on the specified parameters.
@@ -41,43 +48,43 @@ class DataPipelineManager(BaseTool):
 
     def _create_etl_pipeline(self) -> str:
         pipeline = {
-            "extraction": self._configure_extraction(),
-            "transformation": self._configure_transformation(),
-            "loading": self._configure_loading(),
-            "monitoring": self._configure_monitoring()
+            "extraction": self._configure_extraction,
+            "transformation": self._configure_transformation,
+            "loading": self._configure_loading,
+            "monitoring": self._configure_monitoring
         }
         
-        return json.dumps(pipeline, indent=2)
+        return build_report(pipeline)
 
     def _create_elt_pipeline(self) -> str:
         pipeline = {
-            "extraction": self._configure_extraction(),
-            "loading": self._configure_loading(),
-            "transformation": self._configure_transformation(),
-            "monitoring": self._configure_monitoring()
+            "extraction": self._configure_extraction,
+            "loading": self._configure_loading,
+            "transformation": self._configure_transformation,
+            "monitoring": self._configure_monitoring
         }
         
-        return json.dumps(pipeline, indent=2)
+        return build_report(pipeline)
 
     def _create_streaming_pipeline(self) -> str:
         pipeline = {
-            "ingestion": self._configure_stream_ingestion(),
-            "processing": self._configure_stream_processing(),
-            "delivery": self._configure_stream_delivery(),
-            "monitoring": self._configure_stream_monitoring()
+            "ingestion": self._configure_stream_ingestion,
+            "processing": self._configure_stream_processing,
+            "delivery": self._configure_stream_delivery,
+            "monitoring": self._configure_stream_monitoring
         }
         
-        return json.dumps(pipeline, indent=2)
+        return build_report(pipeline)
 
     def _create_batch_pipeline(self) -> str:
         pipeline = {
-            "scheduling": self._configure_scheduling(),
-            "processing": self._configure_batch_processing(),
-            "delivery": self._configure_batch_delivery(),
-            "monitoring": self._configure_batch_monitoring()
+            "scheduling": self._configure_scheduling,
+            "processing": self._configure_batch_processing,
+            "delivery": self._configure_batch_delivery,
+            "monitoring": self._configure_batch_monitoring
         }
         
-        return json.dumps(pipeline, indent=2)
+        return build_report(pipeline)
 
     def _configure_extraction(self) -> Dict:
         return {
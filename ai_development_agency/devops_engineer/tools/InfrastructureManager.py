@@ -1,9 +1,15 @@
-from agency_swarm.tools import BaseTool
 from pydantic import Field
 from typing import Dict, List, Optional
-import json
+if __name__ == "__main__" and not __package__:
+    # Run as a script: the shared modules live in the agency root
+    import sys
+    from pathlib import Path
+    sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from common.async_tool import AsyncTool
+from common.tool_stream import build_report
+from common.tool_cache import cached_run
 
-class InfrastructureManager(BaseTool):
+class InfrastructureManager(AsyncTool):
     """
     A tool for managing cloud infrastructure, deployments,
     and infrastructure as code.
@@ -24,6 +30,7 @@ class InfrastructureManager(BaseTool):
         description="Target environment: 'development', 'staging', or 'production'"
     )
 
+    @cached_run
     def run(self) -> str:
         """
         Manages infrastructure operations based on the specified parameters.
@@ -41,43 +48,43 @@ class InfrastructureManager(BaseTool):
 
     def _provision_infrastructure(self) -> str:
         infrastructure = {
-            "cloud_resources": self._provision_cloud_resources(),
-            "network": self._configure_network(),
-            "security": self._configure_security(),
-            "monitoring": self._setup_monitoring()
+            "cloud_resources": self._provision_cloud_resources,
+            "network": self._configure_network,
+            "security": self._configure_security,
+            "monitoring": self._setup_monitoring
         }
         
-        return json.dumps(infrastructure, indent=2)
+        return build_report(infrastructure)
 
     def _deploy_application(self) -> str:
         deployment = {
-            "containers": self._deploy_containers(),
-            "services": self._configure_services(),
-            "routing": self._configure_routing(),
-            "scaling": self._configure_scaling()
+            "containers": self._deploy_containers,
+            "services": self._configure_services,
+            "routing": self._configure_routing,
+            "scaling": self._configure_scaling
         }
         
-        return json.dumps(deployment, indent=2)
+        return build_report(deployment)
 
     def _monitor_infrastructure(self) -> str:
         monitoring = {
-            "metrics": self._collect_metrics(),
-            "logs": self._aggregate_logs(),
-            "alerts": self._configure_alerts(),
-            "dashboards": self._create_dashboards()
+            "metrics": self._collect_metrics,
+            "logs": self._aggregate_logs,
+            "alerts": self._configure_alerts,
+            "dashboards": self._create_dashboards
         }
         
-        return json.dumps(monitoring, indent=2)
+        return build_report(monitoring)
 
     def _maintain_infrastructure(self) -> str:
         maintenance = {
-            "updates": self._apply_updates(),
-            "backups": self._manage_backups(),
-            "optimization": self._optimize_resources(),
-            "cleanup": self._perform_cleanup()
+            "updates": self._apply_updates,
+            "backups": self._manage_backups,
+            "optimization": self._optimize_resources,
+            "cleanup": self._perform_cleanup
         }
         
-        return json.dumps(maintenance, indent=2)
+        return build_report(maintenance)
 
     def _provision_cloud_resources(self) -> Dict:
         return {
@@ -1,9 +1,15 @@
-from agency_swarm.tools import BaseTool
 from pydantic import Field
 from typing import Dict, List, Optional
-import json
+if __name__ == "__main__" and not __package__:
+    # Run as a script: the shared modules live in the agency root
+    import sys
+    from pathlib import Path
+    sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from common.async_tool import AsyncTool
+from common.tool_stream import build_report
+from common.tool_cache import cached_run
 
-class PipelineAutomator(BaseTool):
+class PipelineAutomator(AsyncTool):
     """
     A tool for managing CI/CD pipelines, automation workflows,
     and deployment processes.
@@ -24,6 +30,7 @@ class PipelineAutomator(BaseTool):
         description="Target environment: 'development', 'staging', or 'production'"
     )
 
+    @cached_run
     def run(self) -> str:
         """
         Manages pipeline operations based on the specified parameters.
@@ -41,43 +48,43 @@ class PipelineAutomator(BaseTool):
 
     def _create_build_pipeline(self) -> str:
         pipeline = {
-            "stages": self._define_build_stages(),
-            "triggers": self._configure_triggers(),
-            "artifacts": self._configure_artifacts(),
-            "caching": self._configure_caching()
+            "stages": self._define_build_stages,
+            "triggers": self._configure_triggers,
+            "artifacts": self._configure_artifacts,
+            "caching": self._configure_caching
         }
         
-        return json.dumps(pipeline, indent=2)
+        return build_report(pipeline)
 
     def _create_test_pipeline(self) -> str:
         pipeline = {
-            "stages": self._define_test_stages(),
-            "environments": self._configure_test_environments(),
-            "reporting": self._configure_test_reporting(),
-            "coverage": self._configure_coverage()
+            "stages": self._define_test_stages,
+            "environments": self._configure_test_environments,
+            "reporting": self._configure_test_reporting,
+            "coverage": self._configure_coverage
         }
         
-        return json.dumps(pipeline, indent=2)
+        return build_report(pipeline)
 
     def _create_deploy_pipeline(self) -> str:
         pipeline = {
-            "stages": self._define_deploy_stages(),
-            "strategies": self._configure_deploy_strategies(),
-            "validation": self._configure_validation(),
-            "rollback": self._configure_rollback()
+            "stages": self._define_deploy_stages,
+            "strategies": self._configure_deploy_strategies,
+            "validation": self._configure_validation,
+            "rollback": self._configure_rollback
         }
         
-        return json.dumps(pipeline, indent=2)
+        return build_report(pipeline)
 
     def _create_release_pipeline(self) -> str:
         pipeline = {
-            "stages": self._define_release_stages(),
-            "versioning": self._configure_versioning(),
-            "changelog": self._generate_changelog(),
-            "notifications": self._configure_notifications()
+            "stages": self._define_release_stages,
+            "versioning": self._configure_versioning,
+            "changelog": self._generate_changelog,
+            "notifications": self._configure_notifications
         }
         
-        return json.dumps(pipeline, indent=2)
+        return build_report(pipeline)
 
     def _define_build_stages(self) -> List[Dict]:
         return [
@@ -1,9 +1,15 @@
-from agency_swarm.tools import BaseTool
 from pydantic import Field
 from typing import Dict, List, Optional
-import json
+if __name__ == "__main__" and not __package__:
+    # Run as a script: the shared modules live in the agency root
+    import sys
+    from pathlib import Path
+    sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from common.async_tool import AsyncTool
+from common.tool_stream import build_report
+from common.tool_cache import cached_run
 
-class BackendDeveloper(BaseTool):
+class BackendDeveloper(AsyncTool):
     """
     A tool for implementing backend components, APIs, database models,
     and business logic.
@@ -24,6 +30,7 @@ class BackendDeveloper(BaseTool):
         description="Backend framework to use: 'FastAPI', 'Django', or 'Express'"
     )
 
+    @cached_run
     def run(self) -> str:
         """
         Implements backend components based on the specified parameters.
@@ -41,47 +48,47 @@ class BackendDeveloper(BaseTool):
 
     def _implement_api(self) -> str:
         api = {
-            "endpoints": self._design_endpoints(),
-            "middleware": self._implement_middleware(),
-            "validation": self._implement_validation(),
-            "error_handling": self._implement_error_handling(),
-            "documentation": self._generate_api_documentation()
+            "endpoints": self._design_endpoints,
+            "middleware": self._implement_middleware,
+            "validation": self._implement_validation,
+            "error_handling": self._implement_error_handling,
+            "documentation": self._generate_api_documentation
         }
         
-        return json.dumps(api, indent=2)
+        return build_report(api)
 
     def _implement_database(self) -> str:
         database = {
-            "models": self._design_database_models(),
-            "migrations": self._setup_migrations(),
-            "queries": self._implement_queries(),
-            "indexing": self._setup_indexing(),
-            "optimization": self._implement_db_optimization()
+            "models": self._design_database_models,
+            "migrations": self._setup_migrations,
+            "queries": self._implement_queries,
+            "indexing": self._setup_indexing,
+            "optimization": self._implement_db_optimization
         }
         
-        return json.dumps(database, indent=2)
+        return build_report(database)
 
     def _implement_auth(self) -> str:
         auth = {
-            "authentication": self._implement_authentication(),
-            "authorization": self._implement_authorization(),
-            "security": self._implement_security_measures(),
-            "user_management": self._implement_user_management(),
-            "session_handling": self._implement_session_handling()
+            "authentication": self._implement_authentication,
+            "authorization": self._implement_authorization,
+            "security": self._implement_security_measures,
+            "user_management": self._implement_user_management,
+            "session_handling": self._implement_session_handling
         }
         
-        return json.dumps(auth, indent=2)
+        return build_report(auth)
 
     def _implement_integration(self) -> str:
         integration = {
-            "service_integration": self._implement_service_integration(),
-            "data_transformation": self._implement_data_transformation(),
-            "error_handling": self._implement_integration_error_handling(),
-            "monitoring": self._implement_monitoring(),
-            "documentation": self._generate_integration_documentation()
+            "service_integration": self._implement_service_integration,
+            "data_transformation": self._implement_data_transformation,
+            "error_handling": self._implement_integration_error_handling,
+            "monitoring": self._implement_monitoring,
+            "documentation": self._generate_integration_documentation
         }
         
-        return json.dumps(integration, indent=2)
+        return build_report(integration)
 
     def _design_endpoints(self) -> List[Dict]:
         return [
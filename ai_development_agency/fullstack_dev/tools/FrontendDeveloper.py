@@ -1,9 +1,15 @@
-from agency_swarm.tools import BaseTool
 from pydantic import Field
 from typing import Dict, List, Optional
-import json
+if __name__ == "__main__" and not __package__:
+    # Run as a script: the shared modules live in the agency root
+    import sys
+    from pathlib import Path
+    sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from common.async_tool import AsyncTool
+from common.tool_stream import build_report
+from common.tool_cache import cached_run
 
-class FrontendDeveloper(BaseTool):
+class FrontendDeveloper(AsyncTool):
     """
     A tool for implementing frontend components, managing state,
     and ensuring optimal user experience.
@@ -24,6 +30,7 @@ class FrontendDeveloper(BaseTool):
         description="Frontend framework to use: 'React', 'Vue', or 'Angular'"
     )
 
+    @cached_run
     def run(self) -> str:
         """
         Implements frontend components based on the specified parameters.
@@ -41,47 +48,47 @@ class FrontendDeveloper(BaseTool):
 
     def _implement_component(self) -> str:
         component = {
-            "component_structure": self._design_component_structure(),
-            "styling": self._implement_styling(),
-            "state_handling": self._implement_state_handling(),
-            "event_handlers": self._implement_event_handlers(),
-            "documentation": self._generate_component_documentation()
+            "component_structure": self._design_component_structure,
+            "styling": self._implement_styling,
+            "state_handling": self._implement_state_handling,
+            "event_handlers": self._implement_event_handlers,
+            "documentation": self._generate_component_documentation
         }
         
-        return json.dumps(component, indent=2)
+        return build_report(component)
 
     def _implement_page(self) -> str:
         page = {
-            "page_structure": self._design_page_structure(),
-            "routing": self._implement_routing(),
-            "data_fetching": self._implement_data_fetching(),
-            "layout": self._implement_layout(),
-            "optimization": self._implement_page_optimization()
+            "page_structure": self._design_page_structure,
+            "routing": self._implement_routing,
+            "data_fetching": self._implement_data_fetching,
+            "layout": self._implement_layout,
+            "optimization": self._implement_page_optimization
         }
         
-        return json.dumps(page, indent=2)
+        return build_report(page)
 
     def _implement_state_management(self) -> str:
         state_management = {
-            "store_setup": self._setup_store(),
-            "actions": self._implement_actions(),
-            "reducers": self._implement_reducers(),
-            "selectors": self._implement_selectors(),
-            "middleware": self._implement_middleware()
+            "store_setup": self._setup_store,
+            "actions": self._implement_actions,
+            "reducers": self._implement_reducers,
+            "selectors": self._implement_selectors,
+            "middleware": self._implement_middleware
         }
         
-        return json.dumps(state_management, indent=2)
+        return build_report(state_management)
 
     def _implement_integration(self) -> str:
         integration = {
-            "api_integration": self._implement_api_integration(),
-            "error_handling": self._implement_error_handling(),
-            "loading_states": self._implement_loading_states(),
-            "data_transformation": self._implement_data_transformation(),
-            "caching": self._implement_caching()
+            "api_integration": self._implement_api_integration,
+            "error_handling": self._implement_error_handling,
+            "loading_states": self._implement_loading_states,
+            "data_transformation": self._implement_data_transformation,
+            "caching": self._implement_caching
         }
         
-        return json.dumps(integration, indent=2)
+        return build_report(integration)
 
     def _design_component_structure(self) -> Dict:
         return {
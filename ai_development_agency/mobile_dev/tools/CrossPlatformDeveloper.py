@@ -1,9 +1,15 @@
-from agency_swarm.tools import BaseTool
 from pydantic import Field
 from typing import Dict, List, Optional
-import json
+if __name__ == "__main__" and not __package__:
+    # Run as a script: the shared modules live in the agency root
+    import sys
+    from pathlib import Path
+    sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from common.async_tool import AsyncTool
+from common.tool_stream import build_report
+from common.tool_cache import cached_run
 
-class CrossPlatformDeveloper(BaseTool):
+class CrossPlatformDeveloper(AsyncTool):
     """
     A tool for implementing cross-platform mobile applications using
     Flutter or React Native frameworks.
@@ -24,6 +30,7 @@ class CrossPlatformDeveloper(BaseTool):
         description="Mobile framework to use: 'Flutter' or 'React Native'"
     )
 
+    @cached_run
     def run(self) -> str:
         """
         Implements cross-platform mobile components based on the specified parameters.
@@ -41,47 +48,47 @@ class CrossPlatformDeveloper(BaseTool):
 
     def _implement_ui(self) -> str:
         ui = {
-            "screen_structure": self._design_screen_structure(),
-            "components": self._implement_components(),
-            "navigation": self._implement_navigation(),
-            "responsive_design": self._implement_responsive_design(),
-            "platform_adaptations": self._implement_platform_adaptations()
+            "screen_structure": self._design_screen_structure,
+            "components": self._implement_components,
+            "navigation": self._implement_navigation,
+            "responsive_design": self._implement_responsive_design,
+            "platform_adaptations": self._implement_platform_adaptations
         }
         
-        return json.dumps(ui, indent=2)
+        return build_report(ui)
 
     def _implement_feature(self) -> str:
         feature = {
-            "business_logic": self._implement_business_logic(),
-            "data_handling": self._implement_data_handling(),
-            "error_handling": self._implement_error_handling(),
-            "offline_support": self._implement_offline_support(),
-            "platform_features": self._implement_platform_features()
+            "business_logic": self._implement_business_logic,
+            "data_handling": self._implement_data_handling,
+            "error_handling": self._implement_error_handling,
+            "offline_support": self._implement_offline_support,
+            "platform_features": self._implement_platform_features
         }
         
-        return json.dumps(feature, indent=2)
+        return build_report(feature)
 
     def _implement_state_management(self) -> str:
         state = {
-            "state_setup": self._setup_state_management(),
-            "actions": self._implement_actions(),
-            "reducers": self._implement_reducers(),
-            "persistence": self._implement_persistence(),
-            "middleware": self._implement_middleware()
+            "state_setup": self._setup_state_management,
+            "actions": self._implement_actions,
+            "reducers": self._implement_reducers,
+            "persistence": self._implement_persistence,
+            "middleware": self._implement_middleware
         }
         
-        return json.dumps(state, indent=2)
+        return build_report(state)
 
     def _implement_integration(self) -> str:
         integration = {
-            "api_integration": self._implement_api_integration(),
-            "native_integration": self._implement_native_integration(),
-            "service_integration": self._implement_service_integration(),
-            "platform_services": self._implement_platform_services(),
-            "error_handling": self._implement_integration_error_handling()
+            "api_integration": self._implement_api_integration,
+            "native_integration": self._implement_native_integration,
+            "service_integration": self._implement_service_integration,
+            "platform_services": self._implement_platform_services,
+            "error_handling": self._implement_integration_error_handling
         }
         
-        return json.dumps(integration, indent=2)
+        return build_report(integration)
 
     def _design_screen_structure(self) -> Dict:
         return {
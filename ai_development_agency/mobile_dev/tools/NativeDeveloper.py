@@ -1,9 +1,15 @@
-from agency_swarm.tools import BaseTool
 from pydantic import Field
 from typing import Dict, List, Optional
-import json
+if __name__ == "__main__" and not __package__:
+    # Run as a script: the shared modules live in the agency root
+    import sys
+    from pathlib import Path
+    sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from common.async_tool import AsyncTool
+from common.tool_stream import build_report
+from common.tool_cache import cached_run
 
-class NativeDeveloper(BaseTool):
+class NativeDeveloper(AsyncTool):
     """
     A tool for implementing native mobile features, optimizations,
     and platform-specific integrations.
@@ -24,6 +30,7 @@ class NativeDeveloper(BaseTool):
         description="Target platform: 'android' or 'ios'"
     )
 
+    @cached_run
     def run(self) -> str:
         """
         Implements native mobile features based on the specified parameters.
@@ -41,47 +48,47 @@ class NativeDeveloper(BaseTool):
 
     def _implement_native_feature(self) -> str:
         feature = {
-            "implementation": self._design_native_implementation(),
-            "permissions": self._handle_permissions(),
-            "lifecycle": self._handle_lifecycle(),
-            "error_handling": self._implement_error_handling(),
-            "platform_specifics": self._implement_platform_specifics()
+            "implementation": self._design_native_implementation,
+            "permissions": self._handle_permissions,
+            "lifecycle": self._handle_lifecycle,
+            "error_handling": self._implement_error_handling,
+            "platform_specifics": self._implement_platform_specifics
         }
         
-        return json.dumps(feature, indent=2)
+        return build_report(feature)
 
     def _implement_optimization(self) -> str:
         optimization = {
-            "performance": self._optimize_performance(),
-            "memory": self._optimize_memory(),
-            "battery": self._optimize_battery(),
-            "size": self._optimize_app_size(),
-            "monitoring": self._implement_monitoring()
+            "performance": self._optimize_performance,
+            "memory": self._optimize_memory,
+            "battery": self._optimize_battery,
+            "size": self._optimize_app_size,
+            "monitoring": self._implement_monitoring
         }
         
-        return json.dumps(optimization, indent=2)
+        return build_report(optimization)
 
     def _implement_native_integration(self) -> str:
         integration = {
-            "native_modules": self._implement_native_modules(),
-            "platform_apis": self._implement_platform_apis(),
-            "hardware_access": self._implement_hardware_access(),
-            "security": self._implement_security_measures(),
-            "compatibility": self._ensure_compatibility()
+            "native_modules": self._implement_native_modules,
+            "platform_apis": self._implement_platform_apis,
+            "hardware_access": self._implement_hardware_access,
+            "security": self._implement_security_measures,
+            "compatibility": self._ensure_compatibility
         }
         
-        return json.dumps(integration, indent=2)
+        return build_report(integration)
 
     def _implement_platform_service(self) -> str:
         service = {
-            "service_setup": self._setup_platform_service(),
-            "configuration": self._configure_service(),
-            "integration": self._integrate_service(),
-            "monitoring": self._monitor_service(),
-            "error_handling": self._handle_service_errors()
+            "service_setup": self._setup_platform_service,
+            "configuration": self._configure_service,
+            "integration": self._integrate_service,
+            "monitoring": self._monitor_service,
+            "error_handling": self._handle_service_errors
         }
         
-        return json.dumps(service, indent=2)
+        return build_report(service)
 
     def _design_native_implementation(self) -> Dict:
         if self.platform == "android":
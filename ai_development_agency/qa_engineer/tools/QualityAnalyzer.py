@@ -1,9 +1,15 @@
-from agency_swarm.tools import BaseTool
 from pydantic import Field
 from typing import Dict, List, Optional
-import json
+if __name__ == "__main__" and not __package__:
+    # Run as a script: the shared modules live in the agency root
+    import sys
+    from pathlib import Path
+    sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from common.async_tool import AsyncTool
+from common.tool_stream import build_report
+from common.tool_cache import cached_run
 
-class QualityAnalyzer(BaseTool):
+class QualityAnalyzer(AsyncTool):
     """
     A tool for analyzing test results, generating quality reports,
     and providing insights for quality improvement.
@@ -24,6 +30,7 @@ class QualityAnalyzer(BaseTool):
         description="Format for the analysis report: 'json', 'html', or 'markdown'"
     )
 
+    @cached_run
     def run(self) -> str:
         """
         Analyzes test results and generates quality reports based on the specified parameters.
@@ -41,43 +48,43 @@ class QualityAnalyzer(BaseTool):
 
     def _analyze_coverage(self) -> str:
         analysis = {
-            "coverage_report": self._generate_coverage_report(),
-            "code_quality": self._analyze_code_quality(),
-            "test_quality": self._analyze_test_quality(),
-            "recommendations": self._generate_coverage_recommendations()
+            "coverage_report": self._generate_coverage_report,
+            "code_quality": self._analyze_code_quality,
+            "test_quality": self._analyze_test_quality,
+            "recommendations": self._generate_coverage_recommendations
         }
         
-        return json.dumps(analysis, indent=2)
+        return build_report(analysis)
 
     def _analyze_performance(self) -> str:
         analysis = {
-            "performance_report": self._generate_performance_report(),
-            "load_analysis": self._analyze_load_test_results(),
-            "bottlenecks": self._identify_bottlenecks(),
-            "recommendations": self._generate_performance_recommendations()
+            "performance_report": self._generate_performance_report,
+            "load_analysis": self._analyze_load_test_results,
+            "bottlenecks": self._identify_bottlenecks,
+            "recommendations": self._generate_performance_recommendations
         }
         
-        return json.dumps(analysis, indent=2)
+        return build_report(analysis)
 
     def _analyze_security(self) -> str:
         analysis = {
-            "security_report": self._generate_security_report(),
-            "vulnerabilities": self._analyze_vulnerabilities(),
-            "compliance": self._check_security_compliance(),
-            "recommendations": self._generate_security_recommendations()
+            "security_report": self._generate_security_report,
+            "vulnerabilities": self._analyze_vulnerabilities,
+            "compliance": self._check_security_compliance,
+            "recommendations": self._generate_security_recommendations
         }
         
-        return json.dumps(analysis, indent=2)
+        return build_report(analysis)
 
     def _analyze_accessibility(self) -> str:
         analysis = {
-            "accessibility_report": self._generate_accessibility_report(),
-            "wcag_compliance": self._check_wcag_compliance(),
-            "usability": self._analyze_usability(),
-            "recommendations": self._generate_accessibility_recommendations()
+            "accessibility_report": self._generate_accessibility_report,
+            "wcag_compliance": self._check_wcag_compliance,
+            "usability": self._analyze_usability,
+            "recommendations": self._generate_accessibility_recommendations
         }
         
-        return json.dumps(analysis, indent=2)
+        return build_report(analysis)
 
     def _generate_coverage_report(self) -> Dict:
         return {
@@ -1,9 +1,15 @@
-from agency_swarm.tools import BaseTool
 from pydantic import Field
 from typing import Dict, List, Optional
-import json
+if __name__ == "__main__" and not __package__:
+    # Run as a script: the shared modules live in the agency root
+    import sys
+    from pathlib import Path
+    sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from common.async_tool import AsyncTool
+from common.tool_stream import build_report
+from common.tool_cache import cached_run
 
-class TestAutomator(BaseTool):
+class TestAutomator(AsyncTool):
     """
     A tool for automating various types of tests including unit tests,
     integration tests, end-to-end tests, and performance tests.
@@ -24,6 +30,7 @@ class TestAutomator(BaseTool):
         description="Test framework to use (e.g., 'pytest', 'jest', 'cypress', 'k6')"
     )
 
+    @cached_run
     def run(self) -> str:
         """
         Creates and executes automated tests based on the specified parameters.
@@ -42,46 +49,46 @@ class TestAutomator(BaseTool):
     def _create_unit_tests(self) -> str:
         tests = {
             "framework": self.framework or "pytest",
-            "test_suite": self._generate_unit_test_suite(),
-            "mocks": self._generate_mocks(),
-            "assertions": self._generate_assertions(),
-            "coverage": self._define_coverage_requirements()
+            "test_suite": self._generate_unit_test_suite,
+            "mocks": self._generate_mocks,
+            "assertions": self._generate_assertions,
+            "coverage": self._define_coverage_requirements
         }
         
-        return json.dumps(tests, indent=2)
+        return build_report(tests)
 
     def _create_integration_tests(self) -> str:
         tests = {
             "framework": self.framework or "pytest",
-            "test_suite": self._generate_integration_test_suite(),
-            "fixtures": self._generate_fixtures(),
-            "api_tests": self._generate_api_tests(),
-            "database_tests": self._generate_database_tests()
+            "test_suite": self._generate_integration_test_suite,
+            "fixtures": self._generate_fixtures,
+            "api_tests": self._generate_api_tests,
+            "database_tests": self._generate_database_tests
         }
         
-        return json.dumps(tests, indent=2)
+        return build_report(tests)
 
     def _create_e2e_tests(self) -> str:
         tests = {
             "framework": self.framework or "cypress",
-            "test_suite": self._generate_e2e_test_suite(),
-            "page_objects": self._generate_page_objects(),
-            "test_data": self._generate_test_data(),
-            "commands": self._generate_custom_commands()
+            "test_suite": self._generate_e2e_test_suite,
+            "page_objects": self._generate_page_objects,
+            "test_data": self._generate_test_data,
+            "commands": self._generate_custom_commands
         }
         
-        return json.dumps(tests, indent=2)
+        return build_report(tests)
 
     def _create_performance_tests(self) -> str:
         tests = {
             "framework": self.framework or "k6",
-            "test_suite": self._generate_performance_test_suite(),
-            "scenarios": self._generate_load_scenarios(),
-            "metrics": self._define_performance_metrics(),
-            "thresholds": self._define_performance_thresholds()
+            "test_suite": self._generate_performance_test_suite,
+            "scenarios": self._generate_load_scenarios,
+            "metrics": self._define_performance_metrics,
+            "thresholds": self._define_performance_thresholds
         }
         
-        return json.dumps(tests, indent=2)
+        return build_report(tests)
 
     def _generate_unit_test_suite(self) -> Dict:
         return {
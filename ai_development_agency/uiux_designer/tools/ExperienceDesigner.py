@@ -1,9 +1,15 @@
-from agency_swarm.tools import BaseTool
 from pydantic import Field
 from typing import Dict, List, Optional
-import json
+if __name__ == "__main__" and not __package__:
+    # Run as a script: the shared modules live in the agency root
+    import sys
+    from pathlib import Path
+    sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from common.async_tool import AsyncTool
+from common.tool_stream import build_report
+from common.tool_cache import cached_run
 
-class ExperienceDesigner(BaseTool):
+class ExperienceDesigner(AsyncTool):
     """
     A tool for designing user experiences, information architecture,
     and interaction patterns.
@@ -24,6 +30,7 @@ class ExperienceDesigner(BaseTool):
         description="Target platform: 'web', 'mobile', or 'desktop'"
     )
 
+    @cached_run
     def run(self) -> str:
         """
         Designs user experiences based on the specified parameters.
@@ -41,47 +48,47 @@ class ExperienceDesigner(BaseTool):
 
     def _conduct_research(self) -> str:
         research = {
-            "user_research": self._conduct_user_research(),
-            "personas": self._create_personas(),
-            "journeys": self._map_user_journeys(),
-            "requirements": self._analyze_requirements(),
-            "insights": self._generate_insights()
+            "user_research": self._conduct_user_research,
+            "personas": self._create_personas,
+            "journeys": self._map_user_journeys,
+            "requirements": self._analyze_requirements,
+            "insights": self._generate_insights
         }
         
-        return json.dumps(research, indent=2)
+        return build_report(research)
 
     def _design_architecture(self) -> str:
         architecture = {
-            "information_structure": self._design_information_structure(),
-            "navigation": self._design_navigation(),
-            "user_flows": self._create_user_flows(),
-            "content_strategy": self._define_content_strategy(),
-            "wireframes": self._create_wireframes()
+            "information_structure": self._design_information_structure,
+            "navigation": self._design_navigation,
+            "user_flows": self._create_user_flows,
+            "content_strategy": self._define_content_strategy,
+            "wireframes": self._create_wireframes
         }
         
-        return json.dumps(architecture, indent=2)
+        return build_report(architecture)
 
     def _design_interactions(self) -> str:
         interactions = {
-            "patterns": self._define_interaction_patterns(),
-            "behaviors": self._define_behaviors(),
-            "feedback": self._design_feedback_system(),
-            "animations": self._design_animations(),
-            "gestures": self._define_gestures()
+            "patterns": self._define_interaction_patterns,
+            "behaviors": self._define_behaviors,
+            "feedback": self._design_feedback_system,
+            "animations": self._design_animations,
+            "gestures": self._define_gestures
         }
         
-        return json.dumps(interactions, indent=2)
+        return build_report(interactions)
 
     def _design_testing(self) -> str:
         testing = {
-            "test_plan": self._create_test_plan(),
-            "scenarios": self._define_test_scenarios(),
-            "metrics": self._define_metrics(),
-            "methodology": self._define_methodology(),
-            "analysis": self._define_analysis_approach()
+            "test_plan": self._create_test_plan,
+            "scenarios": self._define_test_scenarios,
+            "metrics": self._define_metrics,
+            "methodology": self._define_methodology,
+            "analysis": self._define_analysis_approach
         }
         
-        return json.dumps(testing, indent=2)
+        return build_report(testing)
 
     def _conduct_user_research(self) -> Dict:
         return {
@@ -1,9 +1,15 @@
-from agency_swarm.tools import BaseTool
 from pydantic import Field
 from typing import Dict, List, Optional
-import json
+if __name__ == "__main__" and not __package__:
+    # Run as a script: the shared modules live in the agency root
+    import sys
+    from pathlib import Path
+    sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from common.async_tool import AsyncTool
+from common.tool_stream import build_report
+from common.tool_cache import cached_run
 
-class InterfaceDesigner(BaseTool):
+class InterfaceDesigner(AsyncTool):
     """
     A tool for designing user interfaces, visual components,
     and design systems.
@@ -24,6 +30,7 @@ class InterfaceDesigner(BaseTool):
         description="Target platform: 'web', 'mobile', or 'desktop'"
     )
 
+    @cached_run
     def run(self) -> str:
         """
         Designs user interfaces based on the specified parameters.
@@ -41,47 +48,47 @@ class InterfaceDesigner(BaseTool):
 
     def _design_visual_style(self) -> str:
         style = {
-            "color_palette": self._define_color_palette(),
-            "typography": self._define_typography(),
-            "spacing": self._define_spacing_system(),
-            "imagery": self._define_imagery_style(),
-            "iconography": self._define_iconography()
+            "color_palette": self._define_color_palette,
+            "typography": self._define_typography,
+            "spacing": self._define_spacing_system,
+            "imagery": self._define_imagery_style,
+            "iconography": self._define_iconography
         }
         
-        return json.dumps(style, indent=2)
+        return build_report(style)
 
     def _design_components(self) -> str:
         components = {
-            "atomic_elements": self._design_atomic_elements(),
-            "molecules": self._design_molecules(),
-            "organisms": self._design_organisms(),
-            "templates": self._design_templates(),
-            "documentation": self._create_component_documentation()
+            "atomic_elements": self._design_atomic_elements,
+            "molecules": self._design_molecules,
+            "organisms": self._design_organisms,
+            "templates": self._design_templates,
+            "documentation": self._create_component_documentation
         }
         
-        return json.dumps(components, indent=2)
+        return build_report(components)
 
     def _design_system(self) -> str:
         system = {
-            "foundations": self._define_foundations(),
-            "components": self._define_component_library(),
-            "patterns": self._define_design_patterns(),
-            "guidelines": self._create_guidelines(),
-            "resources": self._create_design_resources()
+            "foundations": self._define_foundations,
+            "components": self._define_component_library,
+            "patterns": self._define_design_patterns,
+            "guidelines": self._create_guidelines,
+            "resources": self._create_design_resources
         }
         
-        return json.dumps(system, indent=2)
+        return build_report(system)
 
     def _create_prototype(self) -> str:
         prototype = {
-            "screens": self._design_screens(),
-            "interactions": self._define_interactions(),
-            "animations": self._define_animations(),
-            "assets": self._prepare_assets(),
-            "specifications": self._create_specifications()
+            "screens": self._design_screens,
+            "interactions": self._define_interactions,
+            "animations": self._define_animations,
+            "assets": self._prepare_assets,
+            "specifications": self._create_specifications
         }
         
-        return json.dumps(prototype, indent=2)
+        return build_report(prototype)
 
     def _define_color_palette(self) -> Dict:
         return {